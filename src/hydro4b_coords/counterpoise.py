@@ -0,0 +1,117 @@
+"""
+This module contains functions for creating the full set of counterpoise-corrected MRCC
+input files needed for the many-body decomposition of the interaction energy of a single
+geometry of hydrogen molecules.
+
+For a geometry of N molecules, there is one input file for every nonempty subset of the
+molecules; for four molecules, there are 15. In each file, the molecules in the subset
+are real, and all of the other molecules are ghosts. Every file uses the basis of the
+full geometry.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import pathlib
+from typing import Iterator
+
+import numpy as np
+
+from hydro4b_coords import molecule
+from hydro4b_coords.mrcc_input import MRCCInputFileData
+from hydro4b_coords.mrcc_input import MRCCInputFileWriter
+from hydro4b_coords.mrcc_input import WriteReport
+
+
+@dataclasses.dataclass(frozen=True)
+class CounterpoiseJob:
+    """
+    The contents of the MRCC input file in which only the molecules at the indices in
+    'subset' are real. The 'label' is unique to the subset; for example, 'cp_0_2_3'.
+    """
+
+    subset: tuple[int, ...]
+    label: str
+    contents: str
+
+
+def counterpoise_subsets(n_molecules: int) -> list[tuple[int, ...]]:
+    """
+    All nonempty subsets of the indices of 'n_molecules' molecules, ordered first by the
+    size of the subset, and then lexicographically. For example, for three molecules:
+        (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2)
+    """
+    _check_n_molecules(n_molecules)
+
+    indices = range(n_molecules)
+    subsets: list[tuple[int, ...]] = []
+    for size in range(1, n_molecules + 1):
+        subsets.extend(itertools.combinations(indices, size))
+
+    return subsets
+
+
+def counterpoise_jobs(mrccdata: MRCCInputFileData) -> Iterator[CounterpoiseJob]:
+    """
+    Yield the counterpoise-corrected job of every nonempty subset of the molecules in
+    'mrccdata'. The ghost statuses of the molecules in 'mrccdata' are ignored.
+
+    The molecules can be a list of HydrogenMoleculeInfo instances, or a MoleculeBatch.
+    The parts of the input files that are shared between all of the subsets (the header,
+    the basis lines, and the positions of the atoms) are only created once; only the
+    ghost statuses of the atoms change from one subset to the next.
+    """
+    molecules = mrccdata.fields["molecules"]
+    n_molecules = len(molecules)
+    n_hydro_atoms_per_molecule = 2
+
+    filewriter = MRCCInputFileWriter()
+    template = filewriter.compile_template(mrccdata, n_molecules)
+
+    positions = molecule.as_molecule_batch(molecules).atom_positions
+
+    for subset in counterpoise_subsets(n_molecules):
+        molecule_ghost_statuses = [i not in subset for i in range(n_molecules)]
+        ghost_statuses = np.repeat(molecule_ghost_statuses, n_hydro_atoms_per_molecule)
+
+        contents = template.render(positions, ghost_statuses)
+
+        yield CounterpoiseJob(subset, _subset_label(subset), contents)
+
+
+def write_counterpoise_jobs(
+    mrccdata: MRCCInputFileData,
+    output_dir: str | pathlib.Path,
+    *,
+    filename: str = "MINP",
+    max_workers: int = 8,
+) -> WriteReport:
+    """
+    Write the MRCC input file of every counterpoise-corrected job of the molecules in
+    'mrccdata', into the directory 'output_dir/<job label>'.
+    """
+    output_dir = pathlib.Path(output_dir)
+
+    def contents_and_filenames() -> Iterator[tuple[str, pathlib.Path]]:
+        for job in counterpoise_jobs(mrccdata):
+            job_dir = output_dir / job.label
+            job_dir.mkdir(parents=True, exist_ok=True)
+
+            yield (job.contents, job_dir / filename)
+
+    filewriter = MRCCInputFileWriter()
+
+    return filewriter.write_rendered(contents_and_filenames(), max_workers=max_workers)
+
+
+def _subset_label(subset: tuple[int, ...]) -> str:
+    return "_".join(["cp"] + [str(i) for i in subset])
+
+
+def _check_n_molecules(n_molecules: int) -> None:
+    if n_molecules < 1:
+        raise ValueError(
+            "There must be at least one molecule to create counterpoise subsets.\n"
+            f"Entered: {n_molecules}"
+        )
@@ -0,0 +1,374 @@
+"""
+This module contains a persistent, on-disk cache of the arrays that describe a
+DiscretizedDistribution.
+
+Each entry in the cache is a directory, named after a hash of all the parameters
+used to create the distribution, holding the '.npy' files of its domain and its
+discretized CDF. Entries are loaded as read-only memory-mapped arrays, so that many
+worker processes that create the same distribution share a single copy of it, and
+none of them need to evaluate the probability distribution function.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import shutil
+import types
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+import numpy as np
+
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+
+_DOMAIN_FILENAME = "linspace_domain.npy"
+_CDF_FILENAME = "discretized_cdf.npy"
+
+_DEFAULT_MAX_SIZE_BYTES = 1024**3
+
+
+class DiscretizedDistributionCache:
+    """
+    A cache of discretized distributions, stored in 'cache_dir'.
+
+    The total size of all the entries is kept at or below 'max_size_bytes'. Whenever a
+    new entry is stored, the least recently used entries are evicted until the cache
+    fits in the budget again. The entry that was just stored is never evicted.
+
+    The key of an entry is a hash of the function (its qualified name, its bytecode,
+    its default arguments, the values captured in its closure, and the module-level
+    globals that it refers to), the number of terms, the bounds, the 'args' and 'kwargs',
+    and whether the function is vectorized. NumPy arrays are hashed through their raw
+    bytes; all other values are hashed through their 'repr()', so they should have a
+    repr that faithfully describes their value.
+
+    If the function depends on state that is not captured this way (for example, a
+    file that it reads), pass a 'salt' that changes whenever that state changes.
+    """
+
+    _cache_dir: pathlib.Path
+    _max_size_bytes: int
+
+    def __init__(
+        self,
+        cache_dir: str | pathlib.Path,
+        *,
+        max_size_bytes: int = _DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        _check_max_size_bytes(max_size_bytes)
+
+        self._cache_dir = pathlib.Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+
+    def get(
+        self,
+        function: Callable[[Any], float],
+        n_terms: int,
+        x_min: float,
+        x_max: float,
+        *,
+        args: Optional[list[Any]] = None,
+        kwargs: Optional[dict[Any, Any]] = None,
+        vectorized: bool = False,
+        sampling_method: str = "interp",
+        n_table: Optional[int] = None,
+        salt: str = "",
+    ) -> DiscretizedDistribution:
+        """
+        Return the DiscretizedDistribution created with these parameters, loading it from
+        the cache if it exists, and creating and storing it otherwise.
+        """
+        key = self.cache_key(
+            function,
+            n_terms,
+            x_min,
+            x_max,
+            args=args,
+            kwargs=kwargs,
+            vectorized=vectorized,
+            salt=salt,
+        )
+        entry_dir = self._cache_dir / key
+
+        if entry_dir.is_dir():
+            try:
+                return self._load(entry_dir, sampling_method, n_table)
+            except FileNotFoundError:
+                # another process evicted the entry after it was found; rebuild it
+                pass
+
+        distrib = DiscretizedDistribution(
+            function,
+            n_terms,
+            x_min,
+            x_max,
+            args=args,
+            kwargs=kwargs,
+            vectorized=vectorized,
+        )
+        self._store(entry_dir, distrib)
+        self._evict(keep=entry_dir)
+
+        try:
+            return self._load(entry_dir, sampling_method, n_table)
+        except FileNotFoundError:
+            return DiscretizedDistribution.from_arrays(
+                distrib.linspace_domain,
+                distrib.discretized_cdf,
+                sampling_method=sampling_method,
+                n_table=n_table,
+            )
+
+    def cache_key(
+        self,
+        function: Callable[[Any], float],
+        n_terms: int,
+        x_min: float,
+        x_max: float,
+        *,
+        args: Optional[list[Any]] = None,
+        kwargs: Optional[dict[Any, Any]] = None,
+        vectorized: bool = False,
+        salt: str = "",
+    ) -> str:
+        """The name of the cache entry for the distribution created with these parameters."""
+        if args is None:
+            args = []
+
+        if kwargs is None:
+            kwargs = {}
+
+        parameters = (
+            _function_fingerprint(function),
+            int(n_terms),
+            float(x_min),
+            float(x_max),
+            _value_fingerprint(tuple(args)),
+            _value_fingerprint(sorted(kwargs.items(), key=repr)),
+            bool(vectorized),
+            str(salt),
+        )
+
+        return hashlib.sha256(repr(parameters).encode()).hexdigest()
+
+    @property
+    def total_size(self) -> int:
+        """The total number of bytes used by all the entries in the cache."""
+        return sum([_directory_size(entry) for entry in self._entries()])
+
+    def clear(self) -> None:
+        for entry_dir in self._entries():
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _entries(self) -> list[pathlib.Path]:
+        return [
+            path
+            for path in self._cache_dir.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
+    def _store(self, entry_dir: pathlib.Path, distrib: DiscretizedDistribution) -> None:
+        """
+        Write the arrays into a temporary directory first, then rename it to its final
+        name. The rename is atomic, so other processes never see a partially-written
+        entry. If another process stored the same entry first, its copy is kept.
+        """
+        tmp_dir = self._cache_dir / f".{entry_dir.name}.{uuid.uuid4().hex}"
+        tmp_dir.mkdir()
+
+        try:
+            np.save(tmp_dir / _DOMAIN_FILENAME, distrib.linspace_domain)
+            np.save(tmp_dir / _CDF_FILENAME, distrib.discretized_cdf)
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            if not entry_dir.is_dir():
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _load(
+        self,
+        entry_dir: pathlib.Path,
+        sampling_method: str,
+        n_table: Optional[int],
+    ) -> DiscretizedDistribution:
+        linspace_domain = np.load(entry_dir / _DOMAIN_FILENAME, mmap_mode="r")
+        discretized_cdf = np.load(entry_dir / _CDF_FILENAME, mmap_mode="r")
+
+        # the modification time of the entry marks when it was last used
+        os.utime(entry_dir)
+
+        return DiscretizedDistribution.from_arrays(
+            linspace_domain,
+            discretized_cdf,
+            sampling_method=sampling_method,
+            n_table=n_table,
+        )
+
+    def _evict(self, keep: pathlib.Path) -> None:
+        """
+        Remove the least recently used entries until the cache fits in the budget.
+
+        Other processes sharing the cache can remove entries at any time, so the entries
+        that vanish while they are being looked at are skipped.
+        """
+        usages = []
+        for entry_dir in self._entries():
+            try:
+                mtime = entry_dir.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            usages.append((mtime, entry_dir, _directory_size(entry_dir)))
+
+        usages.sort(key=lambda usage: usage[0])
+        total_size = sum([size for (_, _, size) in usages])
+
+        for (_, entry_dir, size) in usages:
+            if total_size <= self._max_size_bytes:
+                break
+            if entry_dir == keep:
+                continue
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+
+def _function_fingerprint(
+    function: Callable[..., Any], seen: frozenset[int] = frozenset()
+) -> tuple[Any, ...]:
+    """
+    A description of a function that stays the same between different processes, unlike
+    its 'repr()', which contains its memory address. Functions without Python bytecode
+    (for example, NumPy ufuncs) are described by their module and name alone.
+
+    The module-level globals that the function refers to are included, so that changing
+    (for example) a constant used by the function also changes its fingerprint. The ids
+    of the functions already being described are kept in 'seen', so that recursive
+    functions do not recurse forever.
+    """
+    name = (
+        getattr(function, "__module__", None),
+        getattr(function, "__qualname__", repr(type(function))),
+    )
+
+    code = getattr(function, "__code__", None)
+    if code is None or id(function) in seen:
+        return name
+
+    seen = seen | {id(function)}
+
+    defaults = _value_fingerprint(getattr(function, "__defaults__", None), seen)
+    kwdefaults = _value_fingerprint(getattr(function, "__kwdefaults__", None), seen)
+    closure = getattr(function, "__closure__", None) or ()
+    closure_values = tuple(
+        [_value_fingerprint(cell.cell_contents, seen) for cell in closure]
+    )
+    global_values = _globals_fingerprint(
+        code, getattr(function, "__globals__", {}), seen
+    )
+
+    return (
+        name,
+        _code_fingerprint(code),
+        defaults,
+        kwdefaults,
+        closure_values,
+        global_values,
+    )
+
+
+def _code_fingerprint(code: types.CodeType) -> tuple[Any, ...]:
+    consts = tuple([_value_fingerprint(const) for const in code.co_consts])
+    return (code.co_code, consts, code.co_names)
+
+
+def _globals_fingerprint(
+    code: types.CodeType, namespace: dict[str, Any], seen: frozenset[int]
+) -> tuple[Any, ...]:
+    """
+    The values of the globals that 'code' (or any code nested in it) refers to. Modules
+    and classes are described by their names only, and builtins are not included.
+    """
+    values: list[tuple[Any, ...]] = []
+    for name in sorted(_referenced_names(code)):
+        if name not in namespace:
+            continue
+
+        value = namespace[name]
+        if isinstance(value, types.ModuleType):
+            values.append((name, "module", value.__name__))
+        elif isinstance(value, type):
+            values.append((name, "class", value.__module__, value.__qualname__))
+        else:
+            values.append((name, _value_fingerprint(value, seen)))
+
+    return tuple(values)
+
+
+def _referenced_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+
+    return names
+
+
+def _value_fingerprint(value: Any, seen: frozenset[int] = frozenset()) -> Any:
+    """
+    A description of a value with a faithful 'repr()'. NumPy arrays are described by a
+    hash of their raw bytes, because their repr is truncated for large arrays.
+    """
+    if isinstance(value, types.CodeType):
+        return _code_fingerprint(value)
+    if isinstance(value, types.FunctionType):
+        return _function_fingerprint(value, seen)
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value).tobytes()
+        return (
+            "ndarray",
+            value.dtype.str,
+            value.shape,
+            hashlib.sha256(data).hexdigest(),
+        )
+    if isinstance(value, (list, tuple)):
+        return (
+            type(value).__name__,
+            tuple([_value_fingerprint(v, seen) for v in value]),
+        )
+    if isinstance(value, dict):
+        items = [(repr(k), _value_fingerprint(v, seen)) for (k, v) in value.items()]
+        return ("dict", tuple(sorted(items, key=lambda item: item[0])))
+    return value
+
+
+def _directory_size(directory: pathlib.Path) -> int:
+    """The total size of the files in 'directory'; files removed meanwhile count as 0."""
+    try:
+        paths = list(directory.iterdir())
+    except FileNotFoundError:
+        return 0
+
+    size = 0
+    for path in paths:
+        if not path.is_file():
+            continue
+        try:
+            size += path.stat().st_size
+        except FileNotFoundError:
+            continue
+
+    return size
+
+
+def _check_max_size_bytes(max_size_bytes: int) -> None:
+    if max_size_bytes <= 0:
+        raise ValueError(
+            "The maximum size of the cache must be positive.\n"
+            f"Entered: {max_size_bytes}"
+        )
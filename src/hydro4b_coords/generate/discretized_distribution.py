@@ -6,45 +6,206 @@ from __future__ import annotations
 from typing import Any
 from typing import Callable
 from typing import Optional
+from typing import Sequence
+from typing import Union
 
 import numpy as np
+from numpy.typing import NDArray
+
+# the ways in which a uniform random number can be mapped onto the distribution:
+#  - "interp": interpolate the discretized CDF directly; each draw is a binary search
+#  - "table": look up a precomputed inverse CDF on a uniform grid of probabilities; each
+#             draw is a constant-time bucket index, followed by a linear interpolation;
+#             the few buckets that contain a region of zero probability are sampled
+#             like "interp" instead, so that no values are placed inside such a region
+_SAMPLING_METHOD_OPTIONS = ["interp", "table"]
 
 
 class DiscretizedDistribution:
+    """
+    A probability distribution over the interval [x_min, x_max], created by evaluating
+    a probability distribution function on 'n_terms' evenly-spaced points.
+
+    The 'sampling_method' chooses how uniform random numbers are mapped onto the
+    distribution. With "table", the inverse CDF is precomputed on a uniform grid of
+    'n_table' probabilities (by default, 'n_terms' of them), so the cost of each draw
+    does not grow with 'n_terms'.
+
+    If 'vectorized' is True, the probability distribution function is called only once,
+    with the entire array of evenly-spaced points, like a NumPy ufunc. Otherwise, it is
+    called once for each point.
+    """
 
-    _linspace_domain: np.ndarray[float]
-    _discretized_cdf: np.ndarray[float]
+    _linspace_domain: NDArray[np.float64]
+    _discretized_cdf: NDArray[np.float64]
+    _sampling_method: str
+    _inverse_cdf_table: Optional[NDArray[np.float64]]
+    _inverse_cdf_slopes: Optional[NDArray[np.float64]]
+    _inverse_cdf_exact_buckets: Optional[NDArray[np.bool_]]
 
     def __init__(
         self,
-        function: Callable[[Any], float],
+        function: Callable[..., Any],
         n_terms: int,
         x_min: float,
         x_max: float,
         *,
         args: Optional[list[Any]] = None,
         kwargs: Optional[dict[Any, Any]] = None,
+        sampling_method: str = "interp",
+        n_table: Optional[int] = None,
+        vectorized: bool = False,
     ) -> None:
         _check_number_of_terms(n_terms)
         _check_bounds_order(x_min, x_max)
+        _check_sampling_method(sampling_method)
 
         self._linspace_domain = np.linspace(x_min, x_max, n_terms)
 
         partial_func = _create_partial_func(function, args, kwargs)
-        discretized = _discretize_pdf(partial_func, self._linspace_domain)
+        if vectorized:
+            discretized = _discretize_pdf_vectorized(
+                partial_func, self._linspace_domain
+            )
+        else:
+            discretized = _discretize_pdf(partial_func, self._linspace_domain)
         normalized = discretized / np.sum(discretized)
 
         self._discretized_cdf = _zerobased_cumsum(normalized)
 
+        self._set_sampling_method(sampling_method, n_table)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        linspace_domain: NDArray[np.float64],
+        discretized_cdf: NDArray[np.float64],
+        *,
+        sampling_method: str = "interp",
+        n_table: Optional[int] = None,
+    ) -> DiscretizedDistribution:
+        """
+        Create the distribution directly from the evenly-spaced domain and the discretized
+        CDF of a previously-created distribution, without evaluating any function. The
+        arrays are used as-is, and are not copied; this allows read-only, memory-mapped
+        arrays to be shared.
+        """
+        _check_number_of_terms(linspace_domain.size)
+        _check_matching_sizes(linspace_domain, discretized_cdf)
+        _check_sampling_method(sampling_method)
+
+        distrib = cls.__new__(cls)
+        distrib._linspace_domain = linspace_domain
+        distrib._discretized_cdf = discretized_cdf
+        distrib._set_sampling_method(sampling_method, n_table)
+
+        return distrib
+
+    def _set_sampling_method(
+        self, sampling_method: str, n_table: Optional[int]
+    ) -> None:
+        self._sampling_method = sampling_method
+        self._inverse_cdf_table = None
+        self._inverse_cdf_slopes = None
+        self._inverse_cdf_exact_buckets = None
+
+        if sampling_method == "table":
+            if n_table is None:
+                n_table = self._linspace_domain.size
+            _check_number_of_table_entries(n_table)
+
+            self._inverse_cdf_table = _uniform_inverse_cdf_table(
+                self._discretized_cdf, self._linspace_domain, n_table
+            )
+            self._inverse_cdf_slopes = np.diff(self._inverse_cdf_table)
+            self._inverse_cdf_exact_buckets = _buckets_with_flat_cdf(
+                self._discretized_cdf, n_table - 1
+            )
+
+    @property
+    def linspace_domain(self) -> NDArray[np.float64]:
+        return self._linspace_domain
+
+    @property
+    def discretized_cdf(self) -> NDArray[np.float64]:
+        return self._discretized_cdf
+
+    @property
+    def sampling_method(self) -> str:
+        return self._sampling_method
+
+    @property
+    def memory_footprint(self) -> int:
+        """The number of bytes used by the arrays that describe the distribution."""
+        arrays = [
+            self._linspace_domain,
+            self._discretized_cdf,
+            self._inverse_cdf_table,
+            self._inverse_cdf_slopes,
+            self._inverse_cdf_exact_buckets,
+        ]
+
+        return sum([arr.nbytes for arr in arrays if arr is not None])
+
     def sample(self) -> float:
         """Sample a value from the discretized distribution."""
         prob = np.random.uniform(0.0, 1.0)
-        x_sampled = np.interp(prob, self._discretized_cdf, self._linspace_domain)
+        x_sampled: float = self._inverse_cdf(prob)
+
+        return x_sampled
+
+    def sample_many(
+        self, n_samples: int, rng: np.random.Generator
+    ) -> NDArray[np.float64]:
+        """
+        Sample 'n_samples' values from the discretized distribution at once, using the
+        random number generator 'rng'. The uniform draws and the interpolation are each
+        done in a single NumPy call, which avoids the per-call overhead of 'sample()'.
+        """
+        return self.sample_array((n_samples,), rng)
+
+    def sample_array(
+        self, shape: Union[int, Sequence[int]], rng: np.random.Generator
+    ) -> NDArray[np.float64]:
+        """
+        Sample an array of values with the given 'shape' from the discretized distribution,
+        using the random number generator 'rng'.
+        """
+        _check_sample_shape(shape)
+
+        probs = rng.uniform(0.0, 1.0, size=shape)
+        x_sampled: NDArray[np.float64] = self._inverse_cdf(probs)
 
         return x_sampled
 
+    def _inverse_cdf(self, probs: Any) -> Any:
+        """Map probabilities in [0, 1] onto values in the distribution's domain."""
+        table = self._inverse_cdf_table
+        slopes = self._inverse_cdf_slopes
+        exact_buckets = self._inverse_cdf_exact_buckets
+        if table is None or slopes is None or exact_buckets is None:
+            return np.interp(probs, self._discretized_cdf, self._linspace_domain)
+
+        probs = np.asarray(probs)
+        n_buckets = slopes.size
+        position = probs * n_buckets
+        i_bucket = np.minimum(position.astype(np.intp), n_buckets - 1)
+        fraction = position - i_bucket
+
+        values = np.asarray(table[i_bucket] + fraction * slopes[i_bucket])
+
+        # interpolating between the ends of these buckets would cross a region of zero
+        # probability, so their draws are mapped through the CDF itself
+        is_exact = exact_buckets[i_bucket]
+        if np.any(is_exact):
+            values[is_exact] = np.interp(
+                probs[is_exact], self._discretized_cdf, self._linspace_domain
+            )
 
-def _zerobased_cumsum(normalized_pdf: np.ndarray[float]) -> np.ndarray[float]:
+        return values[()]
+
+
+def _zerobased_cumsum(normalized_pdf: NDArray[np.float64]) -> NDArray[np.float64]:
     """
     In the '_discretize_pdf' function, the returned array is 1 element shorter than
     then length of 'linspace_domain'.
@@ -56,14 +217,52 @@ def _zerobased_cumsum(normalized_pdf: np.ndarray[float]) -> np.ndarray[float]:
     return np.concatenate(([0.0], np.cumsum(normalized_pdf)))
 
 
+def _uniform_inverse_cdf_table(
+    discretized_cdf: NDArray[np.float64],
+    linspace_domain: NDArray[np.float64],
+    n_table: int,
+) -> NDArray[np.float64]:
+    """
+    Evaluate the inverse of the piecewise-linear CDF at 'n_table' evenly-spaced
+    probabilities between 0 and 1, inclusive. Because the probabilities are evenly
+    spaced, the bucket that a probability falls into can be found with a single
+    multiplication instead of a binary search.
+    """
+    uniform_probs = np.linspace(0.0, 1.0, n_table)
+    return np.interp(uniform_probs, discretized_cdf, linspace_domain)
+
+
+def _buckets_with_flat_cdf(
+    discretized_cdf: NDArray[np.float64], n_buckets: int
+) -> NDArray[np.bool_]:
+    """
+    Find the buckets of the uniform inverse CDF table whose probabilities include the
+    value of the CDF over an interval where it is flat (where the PDF is zero). The inverse
+    CDF jumps across the interval at that probability, so a linear interpolation within
+    the bucket would place values inside it. A probability on (or within rounding of)
+    the boundary between two buckets marks both of them.
+    """
+    is_flat = np.diff(discretized_cdf) == 0.0
+    flat_probs = discretized_cdf[:-1][is_flat] * n_buckets
+
+    exact_buckets = np.zeros(n_buckets, dtype=bool)
+    for shift in [-1.0e-6, 1.0e-6]:
+        i_bucket = np.clip(
+            np.floor(flat_probs + shift).astype(np.intp), 0, n_buckets - 1
+        )
+        exact_buckets[i_bucket] = True
+
+    return exact_buckets
+
+
 def _create_partial_func(
-    function: Callable[[Any], float],
+    function: Callable[..., Any],
     args: Optional[list[Any]] = None,
     kwargs: Optional[dict[Any, Any]] = None,
-) -> Callable[[float], float]:
+) -> Callable[[Any], Any]:
     """
-    Create a partial function of 'function', that accepts only one float, and returns only
-    one float. Also checks 'args' and 'kwargs' before passing them.
+    Create a partial function of 'function', that accepts only one float (or one array of
+    floats, for a vectorized function). Also checks 'args' and 'kwargs' before passing them.
     """
     if args is None:
         args = []
@@ -71,7 +270,7 @@ def _create_partial_func(
     if kwargs is None:
         kwargs = {}
 
-    def partial_func(x: float) -> float:
+    def partial_func(x: Any) -> Any:
         return function(x, *args, **kwargs)
 
     return partial_func
@@ -79,8 +278,8 @@ def _create_partial_func(
 
 def _discretize_pdf(
     prob_dist_func: Callable[[float], float],
-    linspace_domain: np.ndarray[float],
-) -> np.ndarray[float]:
+    linspace_domain: NDArray[np.float64],
+) -> NDArray[np.float64]:
     """
     Evaluate a probability distribution function along a 1D domain. Because 'prob_dist_func'
     is assumed to represent a probability distribution function, all calls to it are checked
@@ -113,6 +312,44 @@ def _discretize_pdf(
     return discretized
 
 
+def _discretize_pdf_vectorized(
+    prob_dist_func: Callable[[Any], Any],
+    linspace_domain: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Like '_discretize_pdf()', but 'prob_dist_func' is evaluated on all of the points of
+    'linspace_domain' (except the last) in a single call, and the nonnegativity of all
+    of the values is checked at once.
+
+    Raises
+    ------
+    If 'prob_dist_func' does not return one value per point, or if any of the values
+    are negative, a ValueError is raised.
+    """
+    domain = linspace_domain[:-1]
+    discretized = np.asarray(prob_dist_func(domain), dtype=float)
+
+    if discretized.shape != domain.shape:
+        raise ValueError(
+            "A vectorized probability distribution function must return an array with\n"
+            "the same shape as the array it is evaluated on.\n"
+            f"Expected shape: {domain.shape}\n"
+            f"Found shape: {discretized.shape}"
+        )
+    _check_all_nonnegative(discretized, domain)
+
+    return discretized
+
+
+def _check_all_nonnegative(
+    values: NDArray[np.float64], xs: NDArray[np.float64]
+) -> None:
+    i_negatives = np.flatnonzero(values < 0.0)
+    if i_negatives.size > 0:
+        i_first = i_negatives[0]
+        _check_nonnegative(values[i_first], xs[i_first])
+
+
 def _check_nonnegative(value: float, x: float) -> None:
     if value < 0.0:
         raise ValueError(
@@ -130,9 +367,44 @@ def _check_number_of_terms(n_terms: int) -> None:
         )
 
 
+def _check_matching_sizes(
+    linspace_domain: NDArray[np.float64], discretized_cdf: NDArray[np.float64]
+) -> None:
+    if linspace_domain.shape != discretized_cdf.shape:
+        raise ValueError(
+            "The domain and the discretized CDF must have the same shape.\n"
+            f"Found: {linspace_domain.shape} and {discretized_cdf.shape}"
+        )
+
+
+def _check_sampling_method(sampling_method: str) -> None:
+    if sampling_method not in _SAMPLING_METHOD_OPTIONS:
+        raise ValueError(
+            f"'{sampling_method}' is not a valid sampling method.\n"
+            f"The valid options are: {_SAMPLING_METHOD_OPTIONS}"
+        )
+
+
+def _check_number_of_table_entries(n_table: int) -> None:
+    if n_table < 2:
+        raise ValueError(
+            "The inverse CDF lookup table must have 2 or more entries.\n"
+            f"Entered: {n_table}"
+        )
+
+
 def _check_bounds_order(x_min: float, x_max: float) -> None:
     if x_min >= x_max:
         raise ValueError(
             "'x_min' must be greater than 'x_max'.\n"
             f"Found: x_min = {x_min: .12f}, x_max = {x_max: .12f}"
         )
+
+
+def _check_sample_shape(shape: Union[int, Sequence[int]]) -> None:
+    dimensions = (shape,) if isinstance(shape, int) else tuple(shape)
+    if any([dim < 0 for dim in dimensions]):
+        raise ValueError(
+            "The number of samples along each dimension must be nonnegative.\n"
+            f"Entered: {shape}"
+        )
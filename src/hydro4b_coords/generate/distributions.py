@@ -2,7 +2,8 @@
 This module contains factory functions that create specific DiscretizedDistributions.
 """
 
-import math
+import numpy as np
+from numpy.typing import NDArray
 
 from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
 
@@ -14,10 +15,12 @@ def exponential_decay_distribution(
     _check_positive_coeff(coeff)
     _check_positive_decay_rate(decay_rate)
 
-    def exponential_decay(x: float) -> float:
-        return coeff * math.exp(-decay_rate * (x - x_min))
+    def exponential_decay(x: NDArray[np.float64]) -> NDArray[np.float64]:
+        return coeff * np.exp(-decay_rate * (x - x_min))
 
-    return DiscretizedDistribution(exponential_decay, n_terms, x_min, x_max)
+    return DiscretizedDistribution(
+        exponential_decay, n_terms, x_min, x_max, vectorized=True
+    )
 
 
 def _check_positive_coeff(coeff: float) -> None:
@@ -6,11 +6,26 @@ from a random distribution of relative pair distances.
 import contextlib
 import math
 from dataclasses import dataclass
+from typing import ContextManager
+from typing import Optional
 from typing import Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 from cartesian import Cartesian3D
 
 from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from hydro4b_coords.generate.statistics import SamplingStatistics
+from hydro4b_coords.generate.statistics import REJECT_CAYLEY_MENGER
+from hydro4b_coords.generate.statistics import REJECT_EMBEDDING
+from hydro4b_coords.generate.statistics import REJECT_TRIANGLE_INEQUALITY
+from hydro4b_coords.generate.statistics import STAGE_COORDINATES
+from hydro4b_coords.generate.statistics import STAGE_SAMPLE
+from hydro4b_coords.generate.statistics import STAGE_VALIDATE
+from hydro4b_coords.generate.validity import cayley_menger_mask
+from hydro4b_coords.generate.validity import is_cayley_menger_valid
+from hydro4b_coords.generate.validity import is_triangle_inequality_valid
+from hydro4b_coords.generate.validity import triangle_inequality_mask
 
 FourCartesianPoints = Tuple[Cartesian3D, Cartesian3D, Cartesian3D, Cartesian3D]
 
@@ -19,6 +34,7 @@ def sample_fourbody_geometry(
     distrib: DiscretizedDistribution,
     *,
     n_max_reattempts: int = 1024,
+    stats: Optional[SamplingStatistics] = None,
 ) -> FourCartesianPoints:
     """
     Generate four Cartesian3D points, whose six relative side lengths are generated
@@ -26,31 +42,59 @@ def sample_fourbody_geometry(
 
     Because not every 6 randomly generated side lengths creates a valid four-body
     geometry, this function makes repeated attempts to generate the geometry, rejecting
-    failed attempts.
-    """
-    for _ in range(n_max_reattempts):
-        with contextlib.suppress(ValueError):
-            pairdist_coord = _generate_pair_distances(distrib)
-            points = pairdistance_to_cartesian(pairdist_coord)
-            return points
+    failed attempts. Sextets of side lengths that do not form a valid, non-degenerate
+    tetrahedron are rejected before the Cartesian coordinates are constructed.
 
-    raise RuntimeError(
-        "Unable to generate four Cartesian3D points with the provided distribution."
-        f"Number of attempts: {n_max_reattempts}"
-    )
+    If 'stats' is provided, the attempts, rejections, and timings are recorded in it.
+    """
+    points, _ = _sample_fourbody_geometry_attempts(distrib, n_max_reattempts, stats)
+    return points
 
 
 def sample_fourbody_geometry_with_reattempts(
     distrib: DiscretizedDistribution,
     *,
     n_max_reattempts: int = 1024,
+    stats: Optional[SamplingStatistics] = None,
 ) -> Tuple[FourCartesianPoints, int]:
     """Like 'sample_fourbody_geometry()', but also returns the number of reattempts made."""
+    return _sample_fourbody_geometry_attempts(distrib, n_max_reattempts, stats)
+
+
+def _sample_fourbody_geometry_attempts(
+    distrib: DiscretizedDistribution,
+    n_max_reattempts: int,
+    stats: Optional[SamplingStatistics],
+) -> Tuple[FourCartesianPoints, int]:
+    # the statistics are only recorded if they were asked for, so that the callers who
+    # do not pass 'stats' do not pay for the timers on every attempt
     for i_reattempt in range(n_max_reattempts):
-        with contextlib.suppress(ValueError):
+        if stats is not None:
+            stats.record_attempts(1, 0)
+
+        with _time_stage(stats, STAGE_SAMPLE):
             pairdist_coord = _generate_pair_distances(distrib)
-            points = pairdistance_to_cartesian(pairdist_coord)
-            return (points, i_reattempt)
+
+        with _time_stage(stats, STAGE_VALIDATE):
+            reason = _rejection_reason(pairdist_coord.unpack())
+
+        if reason is not None:
+            if stats is not None:
+                stats.record_rejections(reason)
+            continue
+
+        with _time_stage(stats, STAGE_COORDINATES):
+            try:
+                points = pairdistance_to_cartesian(pairdist_coord)
+            except ValueError:
+                if stats is not None:
+                    stats.record_rejections(REJECT_EMBEDDING)
+                continue
+
+        if stats is not None:
+            stats.record_attempts(0, 1)
+            stats.record_attempts_for_accepted(i_reattempt + 1)
+        return (points, i_reattempt)
 
     raise RuntimeError(
         "Unable to generate four Cartesian3D points with the provided distribution."
@@ -58,6 +102,99 @@ def sample_fourbody_geometry_with_reattempts(
     )
 
 
+def _time_stage(
+    stats: Optional[SamplingStatistics], stage: str
+) -> ContextManager[None]:
+    """Time the stage in 'stats', or do nothing if there are no statistics to record."""
+    if stats is None:
+        return contextlib.nullcontext()
+
+    return stats.time_stage(stage)
+
+
+def sample_fourbody_geometries(
+    distrib: DiscretizedDistribution,
+    n_geometries: int,
+    rng: np.random.Generator,
+    *,
+    batch_size: int = 65536,
+    n_max_batches: int = 1024,
+    stats: Optional[SamplingStatistics] = None,
+) -> NDArray[np.float64]:
+    """
+    Generate 'n_geometries' groups of four points in 3D space, whose six relative side
+    lengths are generated by the distribution 'distrib', and return them as an array
+    of shape (n_geometries, 4, 3).
+
+    This is the batched counterpart to 'sample_fourbody_geometry()'. Each batch samples
+    an array of shape (batch_size, 6) of side lengths, and rejects the invalid tetrahedra
+    using a boolean mask, before converting the remaining ones to Cartesian coordinates
+    all at once. Batches are sampled until the requested number of valid geometries is filled.
+
+    If 'stats' is provided, the attempts, rejections, and timings are recorded in it. Every
+    valid geometry in a batch counts as accepted, including the surplus ones in the last
+    batch that are not returned.
+    """
+    _check_n_geometries(n_geometries)
+    _check_batch_size(batch_size)
+
+    if stats is None:
+        stats = SamplingStatistics()
+
+    geometries = np.empty((n_geometries, 4, 3), dtype=float)
+    n_filled = 0
+
+    for _ in range(n_max_batches):
+        if n_filled == n_geometries:
+            break
+
+        with stats.time_stage(STAGE_SAMPLE):
+            side_lengths = distrib.sample_array((batch_size, 6), rng)
+
+        with stats.time_stage(STAGE_VALIDATE):
+            is_triangle_valid = triangle_inequality_mask(side_lengths)
+            is_cayley_menger_valid = cayley_menger_mask(side_lengths)
+            side_lengths = side_lengths[is_triangle_valid & is_cayley_menger_valid]
+
+        with stats.time_stage(STAGE_COORDINATES):
+            points, is_valid = six_side_lengths_to_cartesian_array(side_lengths)
+
+        n_accepted = int(np.count_nonzero(is_valid))
+        n_triangle_rejected = int(np.count_nonzero(~is_triangle_valid))
+        n_cayley_menger_rejected = int(
+            np.count_nonzero(is_triangle_valid & ~is_cayley_menger_valid)
+        )
+
+        stats.record_attempts(batch_size, n_accepted)
+        stats.record_rejections(REJECT_TRIANGLE_INEQUALITY, n_triangle_rejected)
+        stats.record_rejections(REJECT_CAYLEY_MENGER, n_cayley_menger_rejected)
+        stats.record_rejections(REJECT_EMBEDDING, is_valid.size - n_accepted)
+
+        accepted = points[is_valid][: n_geometries - n_filled]
+        geometries[n_filled : n_filled + len(accepted)] = accepted
+        n_filled += len(accepted)
+
+    if n_filled < n_geometries:
+        raise RuntimeError(
+            "Unable to generate the requested number of four-body geometries with the provided distribution.\n"
+            f"Number of geometries generated: {n_filled} of {n_geometries}\n"
+            f"Number of batches: {n_max_batches}"
+        )
+
+    return geometries
+
+
+def _rejection_reason(side_lengths: Tuple[float, ...]) -> Optional[str]:
+    """The reason a single sextet of side lengths is rejected, or None if it is valid."""
+    if not is_triangle_inequality_valid(side_lengths):
+        return REJECT_TRIANGLE_INEQUALITY
+
+    if not is_cayley_menger_valid(side_lengths):
+        return REJECT_CAYLEY_MENGER
+
+    return None
+
+
 @dataclass(frozen=True)
 class PairDistanceCoordinate:
     r01: float
@@ -78,11 +215,19 @@ class PairDistanceCoordinate:
         return all([pairdist >= 0.0 for pairdist in self.unpack()])
 
 
-def _check_n_reattempts(n_reattempts: int, n_max_reattempts: int) -> None:
-    if n_reattempts == n_max_reattempts:
-        raise RuntimeError(
-            "Unable to generate four Cartesian3D points with the provided distribution."
-            f"Number of attempts: {n_reattempts}"
+def _check_n_geometries(n_geometries: int) -> None:
+    if n_geometries < 0:
+        raise ValueError(
+            "The number of geometries to generate must be nonnegative.\n"
+            f"Entered: {n_geometries}"
+        )
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError(
+            "The number of side length sextets sampled per batch must be positive.\n"
+            f"Entered: {batch_size}"
         )
 
 
@@ -151,3 +296,72 @@ def six_side_lengths_to_cartesian(
     point3 = Cartesian3D(x3, y3, z3)
 
     return (point0, point1, point2, point3)
+
+
+def six_side_lengths_to_cartesian_array(
+    side_lengths: NDArray[np.float64],
+    sqrt_tolerance: float = 1.0e-6,
+) -> Tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """
+    The array-in/array-out version of 'six_side_lengths_to_cartesian()'. It accepts an
+    array of shape (N, 6), where each row holds the side lengths (r01, r02, r03, r12, r13, r23),
+    and returns the four points of each geometry as an array of shape (N, 4, 3).
+
+    The points follow the same conventions as 'six_side_lengths_to_cartesian()':
+     - point0 is at the origin
+     - point1 lies on the positive x-axis
+     - point2 satisfies (y >= 0, z == 0)
+     - point3 satisfies (z >= 0)
+
+    The 'sqrt_tolerance' is also handled the same way; if the term under the square root
+    for y2 is not larger than 'sqrt_tolerance', then both y2 and y3 are set to 0.0, and
+    the term under the square root for z3 is clipped to be nonnegative.
+
+    Unlike the scalar function, these clipped cases are not hidden. A boolean mask of
+    shape (N,) is also returned, which is False for every row where the clipping was
+    needed (beyond 'sqrt_tolerance' for z3), or where the coordinates are not finite.
+
+    Raises
+    ------
+    If 'side_lengths' is not a 2D array with 6 columns, a ValueError is raised.
+    """
+    side_lengths = np.asarray(side_lengths, dtype=float)
+    _check_side_lengths_shape(side_lengths)
+
+    r01, r02, r03, r12, r13, r23 = side_lengths.T
+    points = np.zeros((side_lengths.shape[0], 4, 3), dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x2 = (r01**2 + r02**2 - r12**2) / (2.0 * r01)
+        x3 = (r03**2 - r13**2 + r01**2) / (2.0 * r01)
+
+        y2_inner = r02**2 - x2**2
+        is_y2_valid = y2_inner > sqrt_tolerance
+
+        y2 = np.sqrt(np.where(is_y2_valid, y2_inner, 1.0))
+        y3 = (r03**2 - r23**2 + r02**2 - 2.0 * x2 * x3) / (2.0 * y2)
+        y2 = np.where(is_y2_valid, y2, 0.0)
+        y3 = np.where(is_y2_valid, y3, 0.0)
+
+        z3_inner = r03**2 - x3**2 - y3**2
+        z3 = np.sqrt(np.maximum(0.0, z3_inner))
+
+    points[:, 1, 0] = r01
+    points[:, 2, 0] = x2
+    points[:, 2, 1] = y2
+    points[:, 3, 0] = x3
+    points[:, 3, 1] = y3
+    points[:, 3, 2] = z3
+
+    is_valid = is_y2_valid & (z3_inner >= -sqrt_tolerance)
+    is_valid &= np.all(np.isfinite(points), axis=(1, 2))
+
+    return (points, is_valid)
+
+
+def _check_side_lengths_shape(side_lengths: NDArray[np.float64]) -> None:
+    if side_lengths.ndim != 2 or side_lengths.shape[1] != 6:
+        raise ValueError(
+            "The side lengths must be an array of shape (N, 6).\n"
+            f"Found: array of shape {side_lengths.shape}"
+        )
@@ -0,0 +1,121 @@
+"""
+This module contains a driver that generates four-body geometries in parallel, over
+a pool of processes.
+
+The requested geometries are split into chunks of a fixed size, and each chunk gets
+its own random number generator, spawned from a single master seed through NumPy's
+'SeedSequence'. The chunks (and their seeds) only depend on the number of geometries
+and the chunk size, and never on the number of processes, so the merged result is
+bit-for-bit reproducible for a given master seed, regardless of how many processes
+are used.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from hydro4b_coords.generate.generate import sample_fourbody_geometries
+from hydro4b_coords.generate.statistics import SamplingStatistics
+
+
+def sample_fourbody_geometries_parallel(
+    distrib: DiscretizedDistribution,
+    n_geometries: int,
+    seed: int,
+    *,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 65536,
+    batch_size: int = 65536,
+    stats: Optional[SamplingStatistics] = None,
+) -> NDArray[np.float64]:
+    """
+    Generate 'n_geometries' groups of four points in 3D space, using the distribution
+    'distrib', and return them as an array of shape (n_geometries, 4, 3).
+
+    The geometries are generated in chunks of 'chunk_size' by 'sample_fourbody_geometries()',
+    spread across 'n_workers' processes (by default, one per CPU). If 'n_workers' is 1,
+    the chunks are generated in this process, without creating a pool.
+
+    The chunks are always merged in the same order, so the result for a given 'seed'
+    and 'chunk_size' is the same for any value of 'n_workers'.
+    """
+    _check_n_geometries(n_geometries)
+    _check_chunk_size(chunk_size)
+
+    chunk_sizes = _chunk_sizes(n_geometries, chunk_size)
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+    chunk_arguments = [
+        (distrib, n_chunk, seed_seq, batch_size)
+        for (n_chunk, seed_seq) in zip(chunk_sizes, seed_sequences)
+    ]
+
+    if n_workers == 1:
+        results = [_sample_chunk(*arguments) for arguments in chunk_arguments]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_sample_chunk, *zip(*chunk_arguments)))
+
+    if stats is not None:
+        for (_, chunk_stats) in results:
+            stats.merge(chunk_stats)
+
+    if len(results) == 0:
+        return np.empty((0, 4, 3), dtype=float)
+
+    return np.concatenate([geometries for (geometries, _) in results])
+
+
+def _sample_chunk(
+    distrib: DiscretizedDistribution,
+    n_geometries: int,
+    seed_seq: np.random.SeedSequence,
+    batch_size: int,
+) -> Tuple[NDArray[np.float64], SamplingStatistics]:
+    """The work done by each process; it must be a module-level function to be pickled."""
+    rng = np.random.default_rng(seed_seq)
+    stats = SamplingStatistics()
+    geometries = sample_fourbody_geometries(
+        distrib, n_geometries, rng, batch_size=batch_size, stats=stats
+    )
+
+    return (geometries, stats)
+
+
+def _chunk_sizes(n_geometries: int, chunk_size: int) -> list[int]:
+    n_full_chunks, n_remaining = divmod(n_geometries, chunk_size)
+    sizes = [chunk_size] * n_full_chunks
+    if n_remaining > 0:
+        sizes.append(n_remaining)
+
+    return sizes
+
+
+def _check_n_geometries(n_geometries: object) -> None:
+    if isinstance(n_geometries, bool) or not isinstance(
+        n_geometries, (int, np.integer)
+    ):
+        raise ValueError(
+            "The number of geometries to generate must be an integer.\n"
+            f"Entered: {n_geometries!r}"
+        )
+
+    if n_geometries < 0:
+        raise ValueError(
+            "The number of geometries to generate must be nonnegative.\n"
+            f"Entered: {n_geometries}"
+        )
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(
+            "The number of geometries generated per chunk must be positive.\n"
+            f"Entered: {chunk_size}"
+        )
@@ -0,0 +1,129 @@
+"""
+This module contains the SamplingStatistics class, which records how efficiently the
+four-body geometry samplers turn sampled side lengths into accepted geometries.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import time
+from typing import Iterator
+
+# the reasons for which a sextet of sampled side lengths can be rejected
+REJECT_TRIANGLE_INEQUALITY = "triangle_inequality"
+REJECT_CAYLEY_MENGER = "cayley_menger"
+REJECT_EMBEDDING = "embedding"
+
+# the stages of the samplers, whose wall times are recorded
+STAGE_SAMPLE = "sample"
+STAGE_VALIDATE = "validate"
+STAGE_COORDINATES = "coordinates"
+
+
+class SamplingStatistics:
+    """
+    Collects statistics over one or more calls to the four-body geometry samplers:
+     - the number of attempts (sampled sextets of side lengths) and accepted geometries
+     - a histogram of the reasons why attempts were rejected
+     - the number of attempts needed for each accepted geometry (scalar sampler only)
+     - the total wall time spent in each stage of the sampler
+
+    The same instance can be passed to several calls, and the statistics accumulate.
+    """
+
+    _n_attempts: int
+    _n_accepted: int
+    _rejection_counts: collections.Counter[str]
+    _attempts_per_accepted: list[int]
+    _stage_times: dict[str, float]
+
+    def __init__(self) -> None:
+        self._n_attempts = 0
+        self._n_accepted = 0
+        self._rejection_counts = collections.Counter()
+        self._attempts_per_accepted = []
+        self._stage_times = collections.defaultdict(float)
+
+    def record_attempts(self, n_attempts: int, n_accepted: int) -> None:
+        self._n_attempts += n_attempts
+        self._n_accepted += n_accepted
+
+    def record_rejections(self, reason: str, n_rejected: int = 1) -> None:
+        if n_rejected > 0:
+            self._rejection_counts[reason] += n_rejected
+
+    def record_attempts_for_accepted(self, n_attempts: int) -> None:
+        """Record how many attempts the scalar sampler needed to accept one geometry."""
+        self._attempts_per_accepted.append(n_attempts)
+
+    def merge(self, other: SamplingStatistics) -> None:
+        """Add the statistics collected in 'other' to these statistics."""
+        self._n_attempts += other._n_attempts
+        self._n_accepted += other._n_accepted
+        self._rejection_counts.update(other._rejection_counts)
+        self._attempts_per_accepted.extend(other._attempts_per_accepted)
+        for (stage, seconds) in other._stage_times.items():
+            self._stage_times[stage] += seconds
+
+    @contextlib.contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Add the wall time spent inside the 'with' block to the total time of 'stage'."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stage_times[stage] += time.perf_counter() - start
+
+    @property
+    def n_attempts(self) -> int:
+        return self._n_attempts
+
+    @property
+    def n_accepted(self) -> int:
+        return self._n_accepted
+
+    @property
+    def acceptance_rate(self) -> float:
+        if self._n_attempts == 0:
+            return 0.0
+        return self._n_accepted / self._n_attempts
+
+    @property
+    def mean_attempts_per_accepted(self) -> float:
+        if self._n_accepted == 0:
+            return float("inf")
+        return self._n_attempts / self._n_accepted
+
+    @property
+    def rejection_histogram(self) -> dict[str, int]:
+        return dict(self._rejection_counts)
+
+    @property
+    def attempts_per_accepted(self) -> list[int]:
+        return list(self._attempts_per_accepted)
+
+    @property
+    def stage_times(self) -> dict[str, float]:
+        return dict(self._stage_times)
+
+    def summary(self) -> str:
+        """A human-readable report of the collected statistics."""
+        lines = [
+            f"attempts:                   {self._n_attempts}",
+            f"accepted:                   {self._n_accepted}",
+            f"acceptance rate:            {self.acceptance_rate: .6f}",
+            f"mean attempts per accepted: {self.mean_attempts_per_accepted: .6f}",
+            "rejections:",
+        ]
+        lines += [
+            f"    {reason}: {count}"
+            for (reason, count) in self._rejection_counts.most_common()
+        ]
+        lines += ["wall time per stage (s):"]
+        lines += [
+            f"    {stage}: {seconds: .6f}"
+            for (stage, seconds) in self._stage_times.items()
+        ]
+
+        return "\n".join(lines)
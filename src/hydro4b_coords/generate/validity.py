@@ -0,0 +1,209 @@
+"""
+This module contains vectorized checks for whether sextets of side lengths describe
+valid (non-degenerate) four-body geometries.
+
+The side lengths are given as arrays of shape (N, 6), where the columns are ordered as
+(r01, r02, r03, r12, r13, r23). These checks work only with the side lengths, and can
+be used to reject invalid sextets before any Cartesian coordinates are constructed.
+
+The scalar versions of the checks, for a single sextet of side lengths, only use plain
+floating-point arithmetic, so that the geometries sampled one at a time do not pay for
+creating arrays.
+"""
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+# the column indices (in the side lengths array) of the three sides of each of the
+# four triangular faces of the tetrahedron
+FACE_SIDE_INDICES = [
+    (0, 1, 3),  # points (0, 1, 2) -> (r01, r02, r12)
+    (0, 2, 4),  # points (0, 1, 3) -> (r01, r03, r13)
+    (1, 2, 5),  # points (0, 2, 3) -> (r02, r03, r23)
+    (3, 4, 5),  # points (1, 2, 3) -> (r12, r13, r23)
+]
+
+
+def triangle_inequality_mask(
+    side_lengths: NDArray[np.float64],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> NDArray[np.bool_]:
+    """
+    Check that every one of the four triangular faces of each geometry satisfies the
+    strict triangle inequality. Each face is only accepted if the sum of any two of its
+    sides exceeds the third by more than 'relative_tolerance' times the longest side of
+    the geometry, so that nearly-collinear faces are also rejected.
+
+    Returns a boolean mask of shape (N,).
+    """
+    side_lengths = _as_side_lengths_array(side_lengths)
+    threshold = relative_tolerance * np.max(side_lengths, axis=1)
+
+    is_valid = np.ones(side_lengths.shape[0], dtype=bool)
+    for (i, j, k) in FACE_SIDE_INDICES:
+        a = side_lengths[:, i]
+        b = side_lengths[:, j]
+        c = side_lengths[:, k]
+        is_valid &= a + b - c > threshold
+        is_valid &= a + c - b > threshold
+        is_valid &= b + c - a > threshold
+
+    return is_valid
+
+
+def cayley_menger_determinant(side_lengths: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Calculate the Cayley-Menger determinant of each geometry. For four points, this
+    determinant is equal to 288 times the squared volume of the tetrahedron, and is
+    positive only if the six side lengths can be realized as a tetrahedron in 3D space.
+
+    Returns an array of shape (N,).
+    """
+    side_lengths = _as_side_lengths_array(side_lengths)
+    sq = side_lengths**2
+    n_geometries = side_lengths.shape[0]
+
+    cm_matrix = np.ones((n_geometries, 5, 5), dtype=float)
+    cm_matrix[:, 0, 0] = 0.0
+    cm_matrix[:, range(1, 5), range(1, 5)] = 0.0
+
+    for (i_side, (p0, p1)) in enumerate(
+        [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    ):
+        cm_matrix[:, p0 + 1, p1 + 1] = sq[:, i_side]
+        cm_matrix[:, p1 + 1, p0 + 1] = sq[:, i_side]
+
+    determinants: NDArray[np.float64] = np.linalg.det(cm_matrix)
+
+    return determinants
+
+
+def cayley_menger_mask(
+    side_lengths: NDArray[np.float64],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> NDArray[np.bool_]:
+    """
+    Check that the Cayley-Menger determinant of each geometry is positive, with a margin
+    of 'relative_tolerance' times the sixth power of the longest side. The determinant
+    scales as the sixth power of the side lengths, so the check is independent of the
+    overall size of the geometry, and also rejects nearly-flat tetrahedra.
+
+    Returns a boolean mask of shape (N,).
+    """
+    side_lengths = _as_side_lengths_array(side_lengths)
+    threshold = relative_tolerance * np.max(side_lengths, axis=1) ** 6
+    is_valid: NDArray[np.bool_] = cayley_menger_determinant(side_lengths) > threshold
+
+    return is_valid
+
+
+def tetrahedron_validity_mask(
+    side_lengths: NDArray[np.float64],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> NDArray[np.bool_]:
+    """
+    Check that each sextet of side lengths describes a valid, non-degenerate tetrahedron;
+    all four faces must satisfy the triangle inequality, and the Cayley-Menger determinant
+    must be positive.
+
+    Returns a boolean mask of shape (N,).
+    """
+    side_lengths = _as_side_lengths_array(side_lengths)
+
+    is_valid = triangle_inequality_mask(
+        side_lengths, relative_tolerance=relative_tolerance
+    )
+    is_valid &= cayley_menger_mask(side_lengths, relative_tolerance=relative_tolerance)
+
+    return is_valid
+
+
+def is_valid_tetrahedron(
+    side_lengths: Sequence[float],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> bool:
+    """Like 'tetrahedron_validity_mask()', but for a single sextet of side lengths."""
+    return is_triangle_inequality_valid(
+        side_lengths, relative_tolerance=relative_tolerance
+    ) and is_cayley_menger_valid(side_lengths, relative_tolerance=relative_tolerance)
+
+
+def is_triangle_inequality_valid(
+    side_lengths: Sequence[float],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> bool:
+    """Like 'triangle_inequality_mask()', but for a single sextet of side lengths."""
+    _check_six_side_lengths(side_lengths)
+    threshold = relative_tolerance * max(side_lengths)
+
+    for (i, j, k) in FACE_SIDE_INDICES:
+        a = side_lengths[i]
+        b = side_lengths[j]
+        c = side_lengths[k]
+        if not (
+            a + b - c > threshold and a + c - b > threshold and b + c - a > threshold
+        ):
+            return False
+
+    return True
+
+
+def cayley_menger_determinant_scalar(side_lengths: Sequence[float]) -> float:
+    """
+    Like 'cayley_menger_determinant()', but for a single sextet of side lengths. The
+    determinant is evaluated in closed form, from the squares of the side lengths.
+    """
+    _check_six_side_lengths(side_lengths)
+    r01, r02, r03, r12, r13, r23 = side_lengths
+    s01 = r01 * r01
+    s02 = r02 * r02
+    s03 = r03 * r03
+    s12 = r12 * r12
+    s13 = r13 * r13
+    s23 = r23 * r23
+
+    # each pair of opposite edges, and the product of the three sides of each face
+    opposite_edge_terms = (
+        s01 * s23 * (s02 + s03 + s12 + s13 - s01 - s23)
+        + s02 * s13 * (s01 + s03 + s12 + s23 - s02 - s13)
+        + s03 * s12 * (s01 + s02 + s13 + s23 - s03 - s12)
+    )
+    face_terms = s01 * s02 * s12 + s01 * s03 * s13 + s02 * s03 * s23 + s12 * s13 * s23
+
+    return 2.0 * (opposite_edge_terms - face_terms)
+
+
+def is_cayley_menger_valid(
+    side_lengths: Sequence[float],
+    *,
+    relative_tolerance: float = 1.0e-6,
+) -> bool:
+    """Like 'cayley_menger_mask()', but for a single sextet of side lengths."""
+    threshold = relative_tolerance * max(side_lengths) ** 6
+    return cayley_menger_determinant_scalar(side_lengths) > threshold
+
+
+def _as_side_lengths_array(side_lengths: NDArray[np.float64]) -> NDArray[np.float64]:
+    side_lengths = np.asarray(side_lengths, dtype=float)
+    if side_lengths.ndim != 2 or side_lengths.shape[1] != 6:
+        raise ValueError(
+            "The side lengths must be an array of shape (N, 6).\n"
+            f"Found: array of shape {side_lengths.shape}"
+        )
+
+    return side_lengths
+
+
+def _check_six_side_lengths(side_lengths: Sequence[float]) -> None:
+    if len(side_lengths) != 6:
+        raise ValueError(
+            "There must be exactly six side lengths.\n"
+            f"Found: {len(side_lengths)} side lengths"
+        )
@@ -1,187 +1,267 @@
+"""
+The four-body geometries of the HCP lattice, and the maps from their tags to the
+functions that create them, and to their combinatorial counts.
+
+None of the modules with the geometry functions are imported until one of the functions
+is first accessed, either as an attribute of this package (for example,
+'geometries.tetrahedron'), or through 'MAP_GEOMETRY_TAG_TO_FUNCTION'. This keeps the
+import of this package cheap for short-lived processes that only need a few geometries.
+
+For the same reason, this module only imports modules that the interpreter has already
+imported at startup; in particular, it avoids 'typing'.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+
+# type checkers treat any constant named 'TYPE_CHECKING' as True, so they see the real
+# types of the lazily imported names, without 'typing' being imported at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from cartesian import CartesianND
+
+    from hydro4b_coords.geometries.combinatorics import *  # noqa: F403
+    from hydro4b_coords.geometries.five_unit_sides import *  # noqa: F403
+    from hydro4b_coords.geometries.four_unit_sides import *  # noqa: F403
+    from hydro4b_coords.geometries.one_unit_side import *  # noqa: F403
+    from hydro4b_coords.geometries.point_table import *  # noqa: F403
+    from hydro4b_coords.geometries.tetrahedron import *  # noqa: F403
+    from hydro4b_coords.geometries.three_unit_sides import *  # noqa: F403
+    from hydro4b_coords.geometries.triangles import *  # noqa: F403
+    from hydro4b_coords.geometries.two_unit_sides import *  # noqa: F403
+
+    GeometryFunction = Callable[[float], list[CartesianND]]
+
 # fmt: off
-from hydro4b_coords.geometries.triangles import equilateral_triangle
-
-from hydro4b_coords.geometries.tetrahedron import tetrahedron
-
-from hydro4b_coords.geometries.five_unit_sides import fourbody_geometry_sqrt2
-from hydro4b_coords.geometries.five_unit_sides import fourbody_geometry_sqrt83
-from hydro4b_coords.geometries.five_unit_sides import fourbody_geometry_sqrt3
-
-# old names to keep the previous function calls working
-from hydro4b_coords.geometries.five_unit_sides import irregular_tetrahedron
-from hydro4b_coords.geometries.five_unit_sides import irregular_tetrahedron_sqrt2
-from hydro4b_coords.geometries.five_unit_sides import irregular_tetrahedron_sqrt3
-from hydro4b_coords.geometries.five_unit_sides import irregular_tetrahedron_sqrt83
-
-
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt2_sqrt2
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt2_sqrt3
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt3_sqrt3
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt3_2
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt2_sqrt113
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt3_sqrt113
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt83_sqrt113
-from hydro4b_coords.geometries.four_unit_sides import fourbody_geometry_sqrt113_sqrt113
-
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt83
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt113
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt2_2
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt83_sqrt113
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_a
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_b
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_a
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_b
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt113_sqrt113_a
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt2_sqrt113_sqrt113_b
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt3
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt113
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt83_sqrt113_sqrt113
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_a
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_b
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt3_sqrt3_2_a
-from hydro4b_coords.geometries.three_unit_sides import fourbody_geometry_sqrt3_sqrt3_2_b
-
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt2_sqrt3_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt3_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt83_sqrt113_sqrt113_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_sqrt113_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt3_2_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_sqrt113_sqrt113_2
-from hydro4b_coords.geometries.two_unit_sides import fourbody_geometry_sqrt3_2_2_2
-
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt3_sqrt3_2_2_2
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113
-from hydro4b_coords.geometries.one_unit_side import fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2
-
-from hydro4b_coords.geometries.combinatorics import MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT
-
-MAP_GEOMETRY_TAG_TO_FUNCTION = {
-    '1'                                     : tetrahedron,
-    'sqrt2'                                 : fourbody_geometry_sqrt2,
-    'sqrt83'                                : fourbody_geometry_sqrt83,
-    'sqrt3'                                 : fourbody_geometry_sqrt3,
-    'sqrt2_sqrt2'                           : fourbody_geometry_sqrt2_sqrt2,
-    'sqrt2_sqrt113'                         : fourbody_geometry_sqrt2_sqrt113,
-    'sqrt2_sqrt3'                           : fourbody_geometry_sqrt2_sqrt3,
-    'sqrt83_sqrt113'                        : fourbody_geometry_sqrt83_sqrt113,
-    'sqrt3_sqrt3'                           : fourbody_geometry_sqrt3_sqrt3,
-    'sqrt3_sqrt113'                         : fourbody_geometry_sqrt3_sqrt113,
-    'sqrt3_2'                               : fourbody_geometry_sqrt3_2,
-    'sqrt113_sqrt113'                       : fourbody_geometry_sqrt113_sqrt113,
-    'sqrt2_sqrt2_sqrt83'                    : fourbody_geometry_sqrt2_sqrt2_sqrt83,
-    'sqrt2_sqrt2_sqrt113'                   : fourbody_geometry_sqrt2_sqrt2_sqrt113,
-    'sqrt2_sqrt2_2'                         : fourbody_geometry_sqrt2_sqrt2_2,
-    'sqrt2_sqrt83_sqrt113'                  : fourbody_geometry_sqrt2_sqrt83_sqrt113,
-    'sqrt2_sqrt3_sqrt3_a'                   : fourbody_geometry_sqrt2_sqrt3_sqrt3_a,
-    'sqrt2_sqrt3_sqrt3_b'                   : fourbody_geometry_sqrt2_sqrt3_sqrt3_b,
-    'sqrt2_sqrt3_sqrt113_a'                 : fourbody_geometry_sqrt2_sqrt3_sqrt113_a,
-    'sqrt2_sqrt3_sqrt113_b'                 : fourbody_geometry_sqrt2_sqrt3_sqrt113_b,
-    'sqrt2_sqrt113_sqrt113_a'               : fourbody_geometry_sqrt2_sqrt113_sqrt113_a,
-    'sqrt2_sqrt113_sqrt113_b'               : fourbody_geometry_sqrt2_sqrt113_sqrt113_b,
-    'sqrt83_sqrt3_sqrt3'                    : fourbody_geometry_sqrt83_sqrt3_sqrt3,
-    'sqrt83_sqrt3_sqrt113'                  : fourbody_geometry_sqrt83_sqrt3_sqrt113,
-    'sqrt83_sqrt113_sqrt113'                : fourbody_geometry_sqrt83_sqrt113_sqrt113,
-    'sqrt3_sqrt3_sqrt3_a'                   : fourbody_geometry_sqrt3_sqrt3_sqrt3_a,
-    'sqrt3_sqrt3_sqrt3_b'                   : fourbody_geometry_sqrt3_sqrt3_sqrt3_b,
-    'sqrt3_sqrt3_2_a'                       : fourbody_geometry_sqrt3_sqrt3_2_a,
-    'sqrt3_sqrt3_2_b'                       : fourbody_geometry_sqrt3_sqrt3_2_b,
-    'sqrt2_sqrt2_sqrt83_sqrt3'              : fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3,
-    'sqrt2_sqrt2_sqrt83_sqrt113'            : fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113,
-    'sqrt2_sqrt2_sqrt3_sqrt3_a'             : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a,
-    'sqrt2_sqrt2_sqrt3_sqrt3_b'             : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b,
-    'sqrt2_sqrt2_sqrt3_2'                   : fourbody_geometry_sqrt2_sqrt2_sqrt3_2,
-    'sqrt2_sqrt3_sqrt3_sqrt3'               : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3,
-    'sqrt2_sqrt3_sqrt3_sqrt113_a'           : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a,
-    'sqrt2_sqrt3_sqrt3_sqrt113_b'           : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b,
-    'sqrt2_sqrt3_sqrt3_sqrt113_c'           : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c,
-    'sqrt2_sqrt3_sqrt3_2_a'                 : fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a,
-    'sqrt2_sqrt3_sqrt3_2_b'                 : fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b,
-    'sqrt2_sqrt3_sqrt3_2_c'                 : fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c,
-    'sqrt2_sqrt3_sqrt113_sqrt113_a'         : fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a,
-    'sqrt2_sqrt3_sqrt113_sqrt113_b'         : fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b,
-    'sqrt2_sqrt3_sqrt113_sqrt113_c'         : fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c,
-    'sqrt2_sqrt3_sqrt113_sqrt113_d'         : fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d,
-    'sqrt83_sqrt83_sqrt113_sqrt113'         : fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113,
-    'sqrt83_sqrt3_sqrt3_sqrt3'              : fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3,
-    'sqrt83_sqrt3_sqrt3_sqrt113'            : fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113,
-    'sqrt83_sqrt3_sqrt3_2'                  : fourbody_geometry_sqrt83_sqrt3_sqrt3_2,
-    'sqrt83_sqrt3_sqrt113_sqrt113'          : fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113,
-    'sqrt83_sqrt113_sqrt113_sqrt113'        : fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113,
-    'sqrt83_sqrt113_sqrt113_2'              : fourbody_geometry_sqrt83_sqrt113_sqrt113_2,
-    'sqrt3_sqrt3_sqrt3_sqrt113'             : fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113,
-    'sqrt3_sqrt3_sqrt3_2_a'                 : fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a,
-    'sqrt3_sqrt3_sqrt3_2_b'                 : fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b,
-    'sqrt3_sqrt3_sqrt3_2_c'                 : fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c,
-    'sqrt3_sqrt3_sqrt113_sqrt113_a'         : fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a,
-    'sqrt3_sqrt3_sqrt113_sqrt113_b'         : fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b,
-    'sqrt3_sqrt3_sqrt113_sqrt113_c'         : fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c,
-    'sqrt3_sqrt3_sqrt113_2'                 : fourbody_geometry_sqrt3_sqrt3_sqrt113_2,
-    'sqrt3_sqrt3_2_2'                       : fourbody_geometry_sqrt3_sqrt3_2_2,
-    'sqrt3_sqrt113_sqrt113_sqrt113'         : fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113,
-    'sqrt3_sqrt113_sqrt113_2'               : fourbody_geometry_sqrt3_sqrt113_sqrt113_2,
-    'sqrt3_2_2_2'                           : fourbody_geometry_sqrt3_2_2_2,
-    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt3'        : fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3,
-    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt113'      : fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113,
-    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a'     : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a,
-    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b'     : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b,
-    'sqrt2_sqrt2_sqrt3_sqrt3_2'             : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2,
-    'sqrt2_sqrt2_sqrt3_sqrt113_2'           : fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2,
-    'sqrt2_sqrt2_sqrt113_sqrt113_2'         : fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2,
-    'sqrt2_sqrt83_sqrt3_sqrt3_sqrt113'      : fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113,
-    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a'       : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a,
-    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b'       : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b,
-    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt113'       : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113,
-    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a'   : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a,
-    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b'   : fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b,
-    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt3'        : fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3,
-    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt113'      : fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113,
-    'sqrt3_sqrt3_sqrt3_sqrt113_2'           : fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2,
-    'sqrt3_sqrt3_2_2_2'                     : fourbody_geometry_sqrt3_sqrt3_2_2_2,
-    'sqrt3_sqrt113_sqrt113_sqrt113_sqrt113' : fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113,
-    'sqrt3_sqrt113_sqrt113_sqrt113_2'       : fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2,
+# the name of the module (in this package) in which each public name is defined
+_NAME_TO_MODULE = {
+    'equilateral_triangle'                                    : 'triangles',
+    'tetrahedron'                                             : 'tetrahedron',
+    'fourbody_geometry_sqrt2'                                 : 'five_unit_sides',
+    'fourbody_geometry_sqrt83'                                : 'five_unit_sides',
+    'fourbody_geometry_sqrt3'                                 : 'five_unit_sides',
+    'irregular_tetrahedron'                                   : 'five_unit_sides',
+    'irregular_tetrahedron_sqrt2'                             : 'five_unit_sides',
+    'irregular_tetrahedron_sqrt3'                             : 'five_unit_sides',
+    'irregular_tetrahedron_sqrt83'                            : 'five_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2'                           : 'four_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3'                           : 'four_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3'                           : 'four_unit_sides',
+    'fourbody_geometry_sqrt3_2'                               : 'four_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt113'                         : 'four_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt113'                         : 'four_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt113'                        : 'four_unit_sides',
+    'fourbody_geometry_sqrt113_sqrt113'                       : 'four_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt83'                    : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt113'                   : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_2'                         : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt83_sqrt113'                  : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_a'                   : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_b'                   : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_a'                 : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_b'                 : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt113_sqrt113_a'               : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt113_sqrt113_b'               : 'three_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3'                    : 'three_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt113'                  : 'three_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt113_sqrt113'                : 'three_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_a'                   : 'three_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_b'                   : 'three_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_2_a'                       : 'three_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_2_b'                       : 'three_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3'              : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113'            : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a'             : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b'             : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_2'                   : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3'               : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a'           : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b'           : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c'           : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3'              : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113'            : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3_2'                  : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113'          : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113'        : 'two_unit_sides',
+    'fourbody_geometry_sqrt83_sqrt113_sqrt113_2'              : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113'             : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt113_2'                 : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt3_2_2'                       : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113'         : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_sqrt113_sqrt113_2'               : 'two_unit_sides',
+    'fourbody_geometry_sqrt3_2_2_2'                           : 'two_unit_sides',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3'        : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113'      : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a'     : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b'     : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2'             : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2'           : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2'         : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113'      : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a'       : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b'       : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113'       : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a'   : 'one_unit_side',
+    'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b'   : 'one_unit_side',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3'        : 'one_unit_side',
+    'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113'      : 'one_unit_side',
+    'fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2'           : 'one_unit_side',
+    'fourbody_geometry_sqrt3_sqrt3_2_2_2'                     : 'one_unit_side',
+    'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113' : 'one_unit_side',
+    'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2'       : 'one_unit_side',
+    'MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT'                 : 'combinatorics',
+    'GEOMETRY_TAGS'                                           : 'point_table',
+    'GEOMETRY_TAG_INDEX'                                      : 'point_table',
+    'UNIT_GEOMETRY_POINTS'                                    : 'point_table',
+    'geometry_points'                                         : 'point_table',
+    'lattice_constant_sweep'                                  : 'point_table',
+}
+
+# the name of the function that creates the geometry of each tag
+_TAG_TO_FUNCTION_NAME = {
+    '1'                                     : 'tetrahedron',
+    'sqrt2'                                 : 'fourbody_geometry_sqrt2',
+    'sqrt83'                                : 'fourbody_geometry_sqrt83',
+    'sqrt3'                                 : 'fourbody_geometry_sqrt3',
+    'sqrt2_sqrt2'                           : 'fourbody_geometry_sqrt2_sqrt2',
+    'sqrt2_sqrt113'                         : 'fourbody_geometry_sqrt2_sqrt113',
+    'sqrt2_sqrt3'                           : 'fourbody_geometry_sqrt2_sqrt3',
+    'sqrt83_sqrt113'                        : 'fourbody_geometry_sqrt83_sqrt113',
+    'sqrt3_sqrt3'                           : 'fourbody_geometry_sqrt3_sqrt3',
+    'sqrt3_sqrt113'                         : 'fourbody_geometry_sqrt3_sqrt113',
+    'sqrt3_2'                               : 'fourbody_geometry_sqrt3_2',
+    'sqrt113_sqrt113'                       : 'fourbody_geometry_sqrt113_sqrt113',
+    'sqrt2_sqrt2_sqrt83'                    : 'fourbody_geometry_sqrt2_sqrt2_sqrt83',
+    'sqrt2_sqrt2_sqrt113'                   : 'fourbody_geometry_sqrt2_sqrt2_sqrt113',
+    'sqrt2_sqrt2_2'                         : 'fourbody_geometry_sqrt2_sqrt2_2',
+    'sqrt2_sqrt83_sqrt113'                  : 'fourbody_geometry_sqrt2_sqrt83_sqrt113',
+    'sqrt2_sqrt3_sqrt3_a'                   : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_a',
+    'sqrt2_sqrt3_sqrt3_b'                   : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_b',
+    'sqrt2_sqrt3_sqrt113_a'                 : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_a',
+    'sqrt2_sqrt3_sqrt113_b'                 : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_b',
+    'sqrt2_sqrt113_sqrt113_a'               : 'fourbody_geometry_sqrt2_sqrt113_sqrt113_a',
+    'sqrt2_sqrt113_sqrt113_b'               : 'fourbody_geometry_sqrt2_sqrt113_sqrt113_b',
+    'sqrt83_sqrt3_sqrt3'                    : 'fourbody_geometry_sqrt83_sqrt3_sqrt3',
+    'sqrt83_sqrt3_sqrt113'                  : 'fourbody_geometry_sqrt83_sqrt3_sqrt113',
+    'sqrt83_sqrt113_sqrt113'                : 'fourbody_geometry_sqrt83_sqrt113_sqrt113',
+    'sqrt3_sqrt3_sqrt3_a'                   : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_a',
+    'sqrt3_sqrt3_sqrt3_b'                   : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_b',
+    'sqrt3_sqrt3_2_a'                       : 'fourbody_geometry_sqrt3_sqrt3_2_a',
+    'sqrt3_sqrt3_2_b'                       : 'fourbody_geometry_sqrt3_sqrt3_2_b',
+    'sqrt2_sqrt2_sqrt83_sqrt3'              : 'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3',
+    'sqrt2_sqrt2_sqrt83_sqrt113'            : 'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113',
+    'sqrt2_sqrt2_sqrt3_sqrt3_a'             : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a',
+    'sqrt2_sqrt2_sqrt3_sqrt3_b'             : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b',
+    'sqrt2_sqrt2_sqrt3_2'                   : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_2',
+    'sqrt2_sqrt3_sqrt3_sqrt3'               : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3',
+    'sqrt2_sqrt3_sqrt3_sqrt113_a'           : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a',
+    'sqrt2_sqrt3_sqrt3_sqrt113_b'           : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b',
+    'sqrt2_sqrt3_sqrt3_sqrt113_c'           : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c',
+    'sqrt2_sqrt3_sqrt3_2_a'                 : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a',
+    'sqrt2_sqrt3_sqrt3_2_b'                 : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b',
+    'sqrt2_sqrt3_sqrt3_2_c'                 : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c',
+    'sqrt2_sqrt3_sqrt113_sqrt113_a'         : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a',
+    'sqrt2_sqrt3_sqrt113_sqrt113_b'         : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b',
+    'sqrt2_sqrt3_sqrt113_sqrt113_c'         : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c',
+    'sqrt2_sqrt3_sqrt113_sqrt113_d'         : 'fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d',
+    'sqrt83_sqrt83_sqrt113_sqrt113'         : 'fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113',
+    'sqrt83_sqrt3_sqrt3_sqrt3'              : 'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3',
+    'sqrt83_sqrt3_sqrt3_sqrt113'            : 'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113',
+    'sqrt83_sqrt3_sqrt3_2'                  : 'fourbody_geometry_sqrt83_sqrt3_sqrt3_2',
+    'sqrt83_sqrt3_sqrt113_sqrt113'          : 'fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113',
+    'sqrt83_sqrt113_sqrt113_sqrt113'        : 'fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113',
+    'sqrt83_sqrt113_sqrt113_2'              : 'fourbody_geometry_sqrt83_sqrt113_sqrt113_2',
+    'sqrt3_sqrt3_sqrt3_sqrt113'             : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113',
+    'sqrt3_sqrt3_sqrt3_2_a'                 : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a',
+    'sqrt3_sqrt3_sqrt3_2_b'                 : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b',
+    'sqrt3_sqrt3_sqrt3_2_c'                 : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c',
+    'sqrt3_sqrt3_sqrt113_sqrt113_a'         : 'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a',
+    'sqrt3_sqrt3_sqrt113_sqrt113_b'         : 'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b',
+    'sqrt3_sqrt3_sqrt113_sqrt113_c'         : 'fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c',
+    'sqrt3_sqrt3_sqrt113_2'                 : 'fourbody_geometry_sqrt3_sqrt3_sqrt113_2',
+    'sqrt3_sqrt3_2_2'                       : 'fourbody_geometry_sqrt3_sqrt3_2_2',
+    'sqrt3_sqrt113_sqrt113_sqrt113'         : 'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113',
+    'sqrt3_sqrt113_sqrt113_2'               : 'fourbody_geometry_sqrt3_sqrt113_sqrt113_2',
+    'sqrt3_2_2_2'                           : 'fourbody_geometry_sqrt3_2_2_2',
+    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt3'        : 'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3',
+    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt113'      : 'fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113',
+    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a'     : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a',
+    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b'     : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b',
+    'sqrt2_sqrt2_sqrt3_sqrt3_2'             : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2',
+    'sqrt2_sqrt2_sqrt3_sqrt113_2'           : 'fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2',
+    'sqrt2_sqrt2_sqrt113_sqrt113_2'         : 'fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2',
+    'sqrt2_sqrt83_sqrt3_sqrt3_sqrt113'      : 'fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113',
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a'       : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a',
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b'       : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b',
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt113'       : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113',
+    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a'   : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a',
+    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b'   : 'fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b',
+    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt3'        : 'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3',
+    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt113'      : 'fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113',
+    'sqrt3_sqrt3_sqrt3_sqrt113_2'           : 'fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2',
+    'sqrt3_sqrt3_2_2_2'                     : 'fourbody_geometry_sqrt3_sqrt3_2_2_2',
+    'sqrt3_sqrt113_sqrt113_sqrt113_sqrt113' : 'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113',
+    'sqrt3_sqrt113_sqrt113_sqrt113_2'       : 'fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2',
 }
 # fmt: on
+
+
+class _LazyGeometryMap(Mapping[str, "GeometryFunction"]):
+    """
+    A read-only map from each geometry tag to the function that creates it, where the
+    module of each function is only imported when the function is first looked up.
+    """
+
+    def __getitem__(self, tag: str) -> GeometryFunction:
+        function: GeometryFunction = __getattr__(_TAG_TO_FUNCTION_NAME[tag])
+        return function
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TAG_TO_FUNCTION_NAME)
+
+    def __len__(self) -> int:
+        return len(_TAG_TO_FUNCTION_NAME)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(_TAG_TO_FUNCTION_NAME)})"
+
+
+MAP_GEOMETRY_TAG_TO_FUNCTION = _LazyGeometryMap()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module that defines 'name' the first time it is accessed."""
+    if name not in _NAME_TO_MODULE:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = importlib.import_module(f"{__name__}.{_NAME_TO_MODULE[name]}")
+    value = getattr(module, name)
+
+    # later accesses find the name directly, without calling this function
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_NAME_TO_MODULE.keys()))
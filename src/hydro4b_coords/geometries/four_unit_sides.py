@@ -17,12 +17,9 @@ lengths are (for a lattice constant 1)
 is named 'fourbody_geometry_sqrt2_sqrt3()'.
 """
 
-import math
-
-from cartesian import Cartesian3D
 from cartesian import CartesianND
 
-from hydro4b_coords.geometries.checker import _check_lat_const_positive
+from hydro4b_coords.geometries.point_table import _cartesian_geometry_points
 
 
 def fourbody_geometry_sqrt2_sqrt2(lat_const: float) -> list[CartesianND]:
@@ -30,14 +27,7 @@ def fourbody_geometry_sqrt2_sqrt2(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(2), sqrt(2)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, 0.0),
-        lat_const * Cartesian3D(1.0, 0.0, 0.0),
-        lat_const * Cartesian3D(0.0, 1.0, 0.0),
-        lat_const * Cartesian3D(1.0, 1.0, 0.0),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -45,14 +35,7 @@ def fourbody_geometry_sqrt2_sqrt3(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(2), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, 0.0),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(0.0, math.sqrt(3.0 / 1.0), 0.0),
-        lat_const * Cartesian3D(0.0, math.sqrt(4.0 / 3.0), math.sqrt(2.0 / 3.0)),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -60,14 +43,7 @@ def fourbody_geometry_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, 0.0),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(-0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(0.0, -math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt3_2(lat_const: float) -> list[CartesianND]:
@@ -75,14 +51,7 @@ def fourbody_geometry_sqrt3_2(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(3), 2).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(-1.0, 0.0, 0.0),
-        lat_const * Cartesian3D(0.0, 0.0, 0.0),
-        lat_const * Cartesian3D(1.0, 0.0, 0.0),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-    ]
+    return _cartesian_geometry_points("sqrt3_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -90,14 +59,7 @@ def fourbody_geometry_sqrt2_sqrt113(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(2), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, math.sqrt(8.0 / 3.0)),
-        lat_const * Cartesian3D(0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(1.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -105,14 +67,7 @@ def fourbody_geometry_sqrt3_sqrt113(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, math.sqrt(8.0 / 3.0)),
-        lat_const * Cartesian3D(0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(0.5, math.sqrt(25.0 / 12.0), math.sqrt(2.0 / 3.0)),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -120,14 +75,7 @@ def fourbody_geometry_sqrt83_sqrt113(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(8/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, math.sqrt(8.0 / 3.0)),
-        lat_const * Cartesian3D(0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(0.0, 0.0, 0.0),
-    ]
+    return _cartesian_geometry_points("sqrt83_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt113_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -135,11 +83,4 @@ def fourbody_geometry_sqrt113_sqrt113(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, 1, sqrt(11/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.0, 0.0, math.sqrt(8.0 / 3.0)),
-        lat_const * Cartesian3D(0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
-        lat_const * Cartesian3D(0.5, math.sqrt(3.0 / 4.0), 0.0),
-        lat_const * Cartesian3D(-0.5, math.sqrt(3.0 / 4.0), 0.0),
-    ]
+    return _cartesian_geometry_points("sqrt113_sqrt113", lat_const)
@@ -14,10 +14,9 @@ multiple different geometries associated with it. I have arbitrarily attached a
 letter 'a', 'b', 'c, ... to distinguish them.
 """
 
-from cartesian import Cartesian3D
 from cartesian import CartesianND
 
-from hydro4b_coords.geometries.checker import _check_lat_const_positive
+from hydro4b_coords.geometries.point_table import _cartesian_geometry_points
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3(
@@ -28,15 +27,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt3(
     (1, sqrt(2), sqrt(2), sqrt(8/3), sqrt(3), sqrt(3))
     # (1.000000, 1.414214, 1.414214, 1.632993, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.500000, 0.288675, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt83_sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113(
@@ -47,15 +38,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3_sqrt113(
     (1, sqrt(2), sqrt(2), sqrt(8/3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.414214, 1.414214, 1.632993, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (1.000000, -0.577350, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt83_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a(
@@ -66,15 +49,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a(
     (1, sqrt(2), sqrt(2), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.414214, 1.414214, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.000000, -0.577350, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b(
@@ -85,15 +60,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b(
     (1, sqrt(2), sqrt(2), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.414214, 1.414214, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (1.500000, 0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2(lat_const: float) -> list[CartesianND]:
@@ -102,15 +69,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_2(lat_const: float) -> list[Cartes
     (1, sqrt(2), sqrt(2), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.414214, 1.414214, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.500000, -0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt3_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2(
@@ -121,15 +80,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt113_2(
     (1, sqrt(2), sqrt(2), sqrt(3), sqrt(11/3), 2)
     # (1.000000, 1.414214, 1.414214, 1.732051, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (1.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2(
@@ -140,15 +91,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt113_sqrt113_2(
     (1, sqrt(2), sqrt(2), sqrt(11/3), sqrt(11/3), 2)
     # (1.000000, 1.414214, 1.414214, 1.914854, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (1.000000, -0.577350, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt113_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113(
@@ -159,15 +102,7 @@ def fourbody_geometry_sqrt2_sqrt83_sqrt3_sqrt3_sqrt113(
     (1, sqrt(2), sqrt(8/3), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.414214, 1.632993, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (1.500000, 0.288675, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt83_sqrt3_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a(
@@ -178,15 +113,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a(
     (1, sqrt(2), sqrt(3), sqrt(3), sqrt(3), sqrt(3))
     # (1.000000, 1.414214, 1.732051, 1.732051, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.732051, 0.000000),
-        (1.500000, 0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b(
@@ -197,15 +124,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b(
     (1, sqrt(2), sqrt(3), sqrt(3), sqrt(3), sqrt(3))
     # (1.000000, 1.414214, 1.732051, 1.732051, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.732051, 0.000000),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113(
@@ -216,15 +135,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3_sqrt113(
     (1, sqrt(2), sqrt(3), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.414214, 1.732051, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.732051, 0.000000),
-        (1.000000, 1.154701, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a(
@@ -235,15 +146,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a(
     (1, sqrt(2), sqrt(3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.414214, 1.732051, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (1.500000, 0.288675, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b(
@@ -254,15 +157,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b(
     (1, sqrt(2), sqrt(3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.414214, 1.732051, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3(
@@ -273,15 +168,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt3(
     (1, sqrt(8/3), sqrt(3), sqrt(3), sqrt(3), sqrt(3))
     # (1.000000, 1.632993, 1.732051, 1.732051, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (-1.000000, 1.154701, 0.816497),
-        (-1.000000, 1.154701, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3_sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113(
@@ -292,15 +179,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3_sqrt113(
     (1, sqrt(8/3), sqrt(3), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.632993, 1.732051, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2(
@@ -311,15 +190,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113_2(
     (1, sqrt(3), sqrt(3), sqrt(3), sqrt(11/3), 2)
     # (1.000000, 1.732051, 1.732051, 1.732051, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (1.500000, 0.288675, -0.816497),
-        (1.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_2_2_2(lat_const: float) -> list[CartesianND]:
@@ -328,15 +199,7 @@ def fourbody_geometry_sqrt3_sqrt3_2_2_2(lat_const: float) -> list[CartesianND]:
     (1, sqrt(3), sqrt(3), 2, 2, 2)
     # (1.000000, 1.732051, 1.732051, 2.000000, 2.000000, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (1.000000, 1.732051, 0.000000),
-        (2.000000, 0.000000, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_2_2_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113(
@@ -347,15 +210,9 @@ def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_sqrt113(
     (1, sqrt(3), sqrt(11/3), sqrt(11/3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.732051, 1.914854, 1.914854, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.000000, 0.000000, 1.632993),
-        (-0.500000, 0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points(
+        "sqrt3_sqrt113_sqrt113_sqrt113_sqrt113", lat_const
+    )
 
 
 def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2(
@@ -366,12 +223,4 @@ def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113_2(
     (1, sqrt(3), sqrt(11/3), sqrt(11/3), sqrt(11/3), 2)
     # (1.000000, 1.732051, 1.914854, 1.914854, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.000000, 0.000000, 1.632993),
-        (1.500000, -0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt113_sqrt113_sqrt113_2", lat_const)
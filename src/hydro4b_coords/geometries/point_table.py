@@ -0,0 +1,621 @@
+"""
+This module contains the points of every four-body geometry of the HCP lattice, for a
+lattice constant of 1, packed into a single array of shape (n_geometries, 4, 3).
+
+The geometry functions in the other modules of this package each create the points of
+a single geometry, one point at a time. For calculations over many geometries or many
+lattice constants, 'geometry_points()' instead scales the points of any number of the
+geometries with a single multiplication.
+
+The geometries are in the same order as the tags of 'MAP_GEOMETRY_TAG_TO_FUNCTION', and
+the position of each tag in the packed array is given by 'GEOMETRY_TAG_INDEX'.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+from cartesian import Cartesian3D
+from cartesian import CartesianND
+
+from hydro4b_coords.geometries.checker import _check_lat_const_positive
+
+UnitPoints = tuple[tuple[float, float, float], ...]
+
+
+def _irregular_tetrahedron_points(irregular_tetrahedron_angle: float) -> UnitPoints:
+    """The unit points of 'irregular_tetrahedron()' in 'five_unit_sides.py'."""
+    equil_tri_height = math.sqrt(3.0 / 4.0)
+    y_pos = equil_tri_height * math.cos(irregular_tetrahedron_angle)
+    z_pos = equil_tri_height * math.sin(irregular_tetrahedron_angle)
+
+    return (
+        (-0.5, 0.0, 0.0),
+        (0.5, 0.0, 0.0),
+        (0.0, math.sqrt(3.0 / 4.0), 0.0),
+        (0.0, y_pos, z_pos),
+    )
+
+
+# fmt: off
+_UNIT_POINTS_BY_TAG: dict[str, UnitPoints] = {
+    '1' : (
+        (-0.5, 0.0, 0.0),
+        (0.5, 0.0, 0.0),
+        (0.0, math.sqrt(3.0 / 4.0), 0.0),
+        (0.0, math.sqrt(1.0 / 12.0), math.sqrt(2.0 / 3.0)),
+    ),
+    'sqrt2' : _irregular_tetrahedron_points(2.0 * math.asin(math.sqrt(2.0 / 3.0))),
+    'sqrt83' : _irregular_tetrahedron_points(2.0 * math.asin(math.sqrt(8.0 / 9.0))),
+    'sqrt3' : _irregular_tetrahedron_points(2.0 * math.asin(1.0)),
+    'sqrt2_sqrt2' : (
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (1.0, 1.0, 0.0),
+    ),
+    'sqrt2_sqrt113' : (
+        (0.0, 0.0, math.sqrt(8.0 / 3.0)),
+        (0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (1.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+    ),
+    'sqrt2_sqrt3' : (
+        (0.0, 0.0, 0.0),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (0.0, math.sqrt(3.0 / 1.0), 0.0),
+        (0.0, math.sqrt(4.0 / 3.0), math.sqrt(2.0 / 3.0)),
+    ),
+    'sqrt83_sqrt113' : (
+        (0.0, 0.0, math.sqrt(8.0 / 3.0)),
+        (0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (0.0, 0.0, 0.0),
+    ),
+    'sqrt3_sqrt3' : (
+        (0.0, 0.0, 0.0),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (-0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (0.0, -math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+    ),
+    'sqrt3_sqrt113' : (
+        (0.0, 0.0, math.sqrt(8.0 / 3.0)),
+        (0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (0.5, math.sqrt(25.0 / 12.0), math.sqrt(2.0 / 3.0)),
+    ),
+    'sqrt3_2' : (
+        (-1.0, 0.0, 0.0),
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+    ),
+    'sqrt113_sqrt113' : (
+        (0.0, 0.0, math.sqrt(8.0 / 3.0)),
+        (0.0, math.sqrt(1.0 / 3.0), math.sqrt(2.0 / 3.0)),
+        (0.5, math.sqrt(3.0 / 4.0), 0.0),
+        (-0.5, math.sqrt(3.0 / 4.0), 0.0),
+    ),
+    'sqrt2_sqrt2_sqrt83' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (-0.500000, 0.288675, -0.816497),
+    ),
+    'sqrt2_sqrt2_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.000000, 1.732051, 0.000000),
+    ),
+    'sqrt2_sqrt83_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt2_sqrt3_sqrt3_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (0.000000, -0.577350, 0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (1.500000, 0.288675, -0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.000000, 1.154701, -0.816497),
+    ),
+    'sqrt2_sqrt113_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt2_sqrt113_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt83_sqrt3_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, -0.577350, 0.816497),
+        (0.000000, -0.577350, -0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (0.000000, -0.577350, 0.816497),
+    ),
+    'sqrt83_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (1.000000, 0.000000, 0.000000),
+    ),
+    'sqrt3_sqrt3_sqrt3_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt3_sqrt3_sqrt3_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.732051, 0.000000),
+        (1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt3_sqrt3_2_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (1.500000, -0.866025, 0.000000),
+    ),
+    'sqrt3_sqrt3_2_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.732051, 0.000000),
+        (-1.000000, 0.000000, 0.000000),
+    ),
+    'sqrt2_sqrt2_sqrt83_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 0.000000, 1.632993),
+        (-1.000000, -0.577350, 0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt83_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (0.000000, 0.000000, 1.632993),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt3_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.500000, 0.288675, 0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt3_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.000000, -0.577350, 0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt3_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.000000, -0.577350, 0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.732051, 0.000000),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (-1.000000, 1.154701, -0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, -0.577350, 0.816497),
+        (1.000000, -0.577350, -0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt113_c' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (0.000000, 1.732051, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt3_2_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (-1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt3_2_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.000000, 1.732051, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt3_2_c' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (2.000000, 0.000000, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt113_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.154701, 0.816497),
+        (1.000000, 0.000000, 1.632993),
+    ),
+    'sqrt2_sqrt3_sqrt113_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, -0.577350, 0.816497),
+        (1.000000, 0.000000, 1.632993),
+    ),
+    'sqrt2_sqrt3_sqrt113_sqrt113_c' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.000000, 0.000000, 1.632993),
+    ),
+    'sqrt2_sqrt3_sqrt113_sqrt113_d' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.500000, 0.866025, 1.632993),
+        (0.500000, -0.866025, 1.632993),
+    ),
+    'sqrt83_sqrt83_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt83_sqrt3_sqrt3_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 0.000000, 1.632993),
+        (0.500000, -1.443376, 0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt3_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 0.000000, 1.632993),
+        (-1.500000, 0.288675, 0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (0.500000, -0.866025, 0.000000),
+    ),
+    'sqrt83_sqrt113_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (1.000000, 0.000000, 1.632993),
+    ),
+    'sqrt83_sqrt113_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (-0.500000, -0.866025, 0.000000),
+    ),
+    'sqrt3_sqrt3_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.500000, 0.866025, 1.632993),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt3_sqrt3_sqrt3_2_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.732051, 0.000000),
+        (-1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt3_sqrt3_sqrt3_2_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, -0.577350, 0.816497),
+        (1.500000, -0.866025, 0.000000),
+    ),
+    'sqrt3_sqrt3_sqrt3_2_c' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (-1.500000, 0.866025, 0.000000),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt3_sqrt3_sqrt113_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, -0.577350, 0.816497),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt3_sqrt3_sqrt113_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (-1.000000, 1.154701, 0.816497),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt3_sqrt3_sqrt113_sqrt113_c' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.500000, 0.866025, 1.632993),
+        (0.000000, 1.732051, 0.000000),
+    ),
+    'sqrt3_sqrt3_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (1.500000, 0.288675, -0.816497),
+        (2.000000, 0.000000, 0.000000),
+    ),
+    'sqrt3_sqrt3_2_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, -0.866025, 0.000000),
+        (2.000000, 0.000000, 0.000000),
+    ),
+    'sqrt3_sqrt113_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 1.732051, 0.000000),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt3_sqrt113_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.500000, 0.866025, 1.632993),
+        (1.000000, 1.732051, 0.000000),
+    ),
+    'sqrt3_2_2_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.000000, 1.732051, 0.000000),
+        (2.000000, 0.000000, 0.000000),
+    ),
+    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.500000, 0.288675, -0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt83_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (1.000000, -0.577350, 0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.000000, -0.577350, -0.816497),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt3_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt3_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.500000, 0.288675, 0.816497),
+        (1.500000, -0.866025, 0.000000),
+    ),
+    'sqrt2_sqrt2_sqrt3_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (1.000000, 1.732051, 0.000000),
+    ),
+    'sqrt2_sqrt2_sqrt113_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (1.000000, -0.577350, -0.816497),
+    ),
+    'sqrt2_sqrt83_sqrt3_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (1.500000, 0.288675, 0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.732051, 0.000000),
+        (1.500000, 0.866025, 0.000000),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt3_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.732051, 0.000000),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.732051, 0.000000),
+        (1.000000, 1.154701, -0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_a' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (1.500000, 0.288675, -0.816497),
+    ),
+    'sqrt2_sqrt3_sqrt3_sqrt113_sqrt113_b' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (0.000000, 1.154701, -0.816497),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt3' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (-1.000000, 1.154701, 0.816497),
+        (-1.000000, 1.154701, -0.816497),
+    ),
+    'sqrt83_sqrt3_sqrt3_sqrt3_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (0.000000, 0.000000, 1.632993),
+        (-1.000000, 1.154701, 0.816497),
+    ),
+    'sqrt3_sqrt3_sqrt3_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (1.500000, 0.288675, -0.816497),
+        (1.000000, 1.732051, 0.000000),
+    ),
+    'sqrt3_sqrt3_2_2_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.288675, 0.816497),
+        (1.000000, 1.732051, 0.000000),
+        (2.000000, 0.000000, 0.000000),
+    ),
+    'sqrt3_sqrt113_sqrt113_sqrt113_sqrt113' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.000000, 0.000000, 1.632993),
+        (-0.500000, 0.866025, 1.632993),
+    ),
+    'sqrt3_sqrt113_sqrt113_sqrt113_2' : (
+        (0.000000, 0.000000, 0.000000),
+        (0.500000, 0.866025, 0.000000),
+        (1.000000, 0.000000, 1.632993),
+        (1.500000, -0.866025, 0.000000),
+    ),
+}
+# fmt: on
+
+GEOMETRY_TAGS: tuple[str, ...] = tuple(_UNIT_POINTS_BY_TAG.keys())
+
+GEOMETRY_TAG_INDEX: dict[str, int] = {tag: i for (i, tag) in enumerate(GEOMETRY_TAGS)}
+
+UNIT_GEOMETRY_POINTS: NDArray[np.float64] = np.array(
+    list(_UNIT_POINTS_BY_TAG.values()), dtype=float
+)
+UNIT_GEOMETRY_POINTS.setflags(write=False)
+
+
+def geometry_points(
+    lat_const: float, tags: Optional[Union[str, Sequence[str]]] = None
+) -> NDArray[np.float64]:
+    """
+    The points of the four-body geometries with the tags 'tags', for the lattice constant
+    'lat_const', as a new array.
+
+    If 'tags' is a single tag, the returned array has shape (4, 3); if it is a sequence
+    of tags, it has shape (len(tags), 4, 3), in the same order as the tags; and if it is
+    None, the points of all the geometries are returned, in the order of 'GEOMETRY_TAGS'.
+    """
+    _check_lat_const_positive(lat_const)
+
+    if tags is None:
+        unit_points = UNIT_GEOMETRY_POINTS
+    elif isinstance(tags, str):
+        unit_points = UNIT_GEOMETRY_POINTS[_geometry_tag_index(tags)]
+    else:
+        unit_points = UNIT_GEOMETRY_POINTS[[_geometry_tag_index(tag) for tag in tags]]
+
+    points: NDArray[np.float64] = lat_const * unit_points
+
+    return points
+
+
+def lattice_constant_sweep(
+    lat_consts: Sequence[float], tags: Optional[Sequence[str]] = None
+) -> NDArray[np.float64]:
+    """
+    The points of the four-body geometries with the tags 'tags' (or of all of them, if
+    'tags' is None), for every lattice constant in 'lat_consts'.
+
+    Returns an array of shape (len(lat_consts), n_tags, 4, 3), where the element
+    '[i, j]' holds the points of the 'j'th geometry for the 'i'th lattice constant.
+    """
+    lat_consts_array = np.asarray(lat_consts, dtype=float)
+    _check_lat_consts(lat_consts_array)
+
+    if tags is None:
+        unit_points = UNIT_GEOMETRY_POINTS
+    else:
+        unit_points = UNIT_GEOMETRY_POINTS[[_geometry_tag_index(tag) for tag in tags]]
+
+    points: NDArray[np.float64] = (
+        lat_consts_array[:, np.newaxis, np.newaxis, np.newaxis] * unit_points
+    )
+
+    return points
+
+
+def _cartesian_geometry_points(tag: str, lat_const: float) -> list[CartesianND]:
+    """The points of a single geometry, as the geometry functions return them."""
+    points = geometry_points(lat_const, tag)
+
+    return [Cartesian3D(*p) for p in points.tolist()]
+
+
+def _geometry_tag_index(tag: str) -> int:
+    if tag not in GEOMETRY_TAG_INDEX:
+        raise ValueError(
+            "There is no four-body geometry of the HCP lattice with the given tag.\n"
+            f"Found: '{tag}'"
+        )
+
+    return GEOMETRY_TAG_INDEX[tag]
+
+
+def _check_lat_consts(lat_consts: NDArray[np.float64]) -> None:
+    if lat_consts.ndim != 1:
+        raise ValueError(
+            "The lattice constants must be a one-dimensional sequence.\n"
+            f"Found: array of shape {lat_consts.shape}"
+        )
+
+    if np.any(lat_consts <= 0.0):
+        raise ValueError(
+            "All the lattice constants must be positive.\n"
+            f"Entered: {lat_consts.tolist()}"
+        )
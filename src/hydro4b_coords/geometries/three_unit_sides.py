@@ -14,10 +14,9 @@ two different geometries associated with it. I have arbitrarily attached a
 letter 'a' or 'b' to distinguish them.
 """
 
-from cartesian import Cartesian3D
 from cartesian import CartesianND
 
-from hydro4b_coords.geometries.checker import _check_lat_const_positive
+from hydro4b_coords.geometries.point_table import _cartesian_geometry_points
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt83(lat_const: float) -> list[CartesianND]:
@@ -25,14 +24,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt83(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(2), sqrt(8/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(0.000000, 1.154701, -0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt83", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -40,14 +32,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt113(lat_const: float) -> list[CartesianND]
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(2), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(-0.500000, 0.288675, -0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_2(lat_const: float) -> list[CartesianND]:
@@ -55,14 +40,7 @@ def fourbody_geometry_sqrt2_sqrt2_2(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(2), 2).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(1.000000, 1.732051, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt2_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt83_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -70,14 +48,7 @@ def fourbody_geometry_sqrt2_sqrt83_sqrt113(lat_const: float) -> list[CartesianND
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(8/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(0.500000, 0.866025, 1.632993),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt83_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_a(lat_const: float) -> list[CartesianND]:
@@ -85,14 +56,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_a(lat_const: float) -> list[CartesianND]
     Points for the 'a'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(0.000000, -0.577350, 0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_b(lat_const: float) -> list[CartesianND]:
@@ -100,14 +64,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_b(lat_const: float) -> list[CartesianND]
     Points for the 'b'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(1.500000, 0.866025, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_a(lat_const: float) -> list[CartesianND]:
@@ -115,14 +72,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_a(lat_const: float) -> list[CartesianN
     Points for the 'a'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.288675, 0.816497),
-        lat_const * Cartesian3D(1.500000, 0.288675, -0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_b(lat_const: float) -> list[CartesianND]:
@@ -130,14 +80,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_b(lat_const: float) -> list[CartesianN
     Points for the 'b'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(1.000000, 1.154701, -0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt113_sqrt113_a(lat_const: float) -> list[CartesianND]:
@@ -145,14 +88,7 @@ def fourbody_geometry_sqrt2_sqrt113_sqrt113_a(lat_const: float) -> list[Cartesia
     Points for the 'a'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(11/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.288675, 0.816497),
-        lat_const * Cartesian3D(-0.500000, 0.866025, 1.632993),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt113_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt113_sqrt113_b(lat_const: float) -> list[CartesianND]:
@@ -160,14 +96,7 @@ def fourbody_geometry_sqrt2_sqrt113_sqrt113_b(lat_const: float) -> list[Cartesia
     Points for the 'b'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(2), sqrt(11/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.154701, 0.816497),
-        lat_const * Cartesian3D(-0.500000, 0.866025, 1.632993),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt113_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -175,14 +104,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(8/3), sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, -0.577350, 0.816497),
-        lat_const * Cartesian3D(0.000000, -0.577350, -0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -190,14 +112,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt113(lat_const: float) -> list[CartesianND
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(8/3), sqrt(3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 0.000000, 1.632993),
-        lat_const * Cartesian3D(0.000000, -0.577350, 0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt113_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -205,14 +120,7 @@ def fourbody_geometry_sqrt83_sqrt113_sqrt113(lat_const: float) -> list[Cartesian
     Points for the four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(8/3), sqrt(11/3), sqrt(11/3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 0.000000, 1.632993),
-        lat_const * Cartesian3D(1.000000, 0.000000, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt83_sqrt113_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_a(lat_const: float) -> list[CartesianND]:
@@ -220,14 +128,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_a(lat_const: float) -> list[CartesianND]
     Points for the 'a'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(3), sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.288675, 0.816497),
-        lat_const * Cartesian3D(-1.000000, 1.154701, 0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_a", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_b(lat_const: float) -> list[CartesianND]:
@@ -235,14 +136,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_b(lat_const: float) -> list[CartesianND]
     Points for the 'b'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(3), sqrt(3), sqrt(3)).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.732051, 0.000000),
-        lat_const * Cartesian3D(1.500000, 0.866025, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_b", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianND]:
@@ -250,14 +144,7 @@ def fourbody_geometry_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianND]:
     Points for the 'a'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(3), sqrt(3), 2).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.288675, 0.816497),
-        lat_const * Cartesian3D(1.500000, -0.866025, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt3_2_a", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianND]:
@@ -265,11 +152,4 @@ def fourbody_geometry_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianND]:
     Points for the 'b'-version four-body geometry with the relative pair distances
     (1, 1, 1, sqrt(3), sqrt(3), 2).
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.866025, 0.000000),
-        lat_const * Cartesian3D(0.000000, 1.732051, 0.000000),
-        lat_const * Cartesian3D(-1.000000, 0.000000, 0.000000),
-    ]
+    return _cartesian_geometry_points("sqrt3_sqrt3_2_b", lat_const)
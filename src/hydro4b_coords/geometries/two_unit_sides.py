@@ -14,10 +14,9 @@ multiple different geometries associated with it. I have arbitrarily attached a
 letter 'a', 'b', 'c, ... to distinguish them.
 """
 
-from cartesian import Cartesian3D
 from cartesian import CartesianND
 
-from hydro4b_coords.geometries.checker import _check_lat_const_positive
+from hydro4b_coords.geometries.point_table import _cartesian_geometry_points
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -26,14 +25,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt3(lat_const: float) -> list[Cartesi
     (1, 1, sqrt(2), sqrt(2), sqrt(8/3), sqrt(3)).
     # (1.000000, 1.000000, 1.414214, 1.414214, 1.632993, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-
-    return [
-        lat_const * Cartesian3D(0.000000, 0.000000, 0.000000),
-        lat_const * Cartesian3D(0.500000, 0.288675, 0.816497),
-        lat_const * Cartesian3D(0.000000, 0.000000, 1.632993),
-        lat_const * Cartesian3D(-1.000000, -0.577350, 0.816497),
-    ]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt83_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -42,16 +34,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt83_sqrt113(lat_const: float) -> list[Carte
     (1, 1, sqrt(2), sqrt(2), sqrt(8/3), sqrt(11/3)).
     # (1.000000, 1.000000, 1.414214, 1.414214, 1.632993, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (0.000000, 0.000000, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt83_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a(lat_const: float) -> list[CartesianND]:
@@ -60,15 +43,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_a(lat_const: float) -> list[Cartes
     (1, 1, sqrt(2), sqrt(2), sqrt(3), sqrt(3))
     # (1.000000, 1.000000, 1.414214, 1.414214, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (1.500000, 0.288675, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt3_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b(lat_const: float) -> list[CartesianND]:
@@ -77,15 +52,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_sqrt3_b(lat_const: float) -> list[Cartes
     (1, 1, sqrt(2), sqrt(2), sqrt(3), sqrt(3))
     # (1.000000, 1.000000, 1.414214, 1.414214, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.000000, -0.577350, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_sqrt3_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt2_sqrt3_2(lat_const: float) -> list[CartesianND]:
@@ -94,15 +61,7 @@ def fourbody_geometry_sqrt2_sqrt2_sqrt3_2(lat_const: float) -> list[CartesianND]
     (1, 1, sqrt(2), sqrt(2), sqrt(3), 2)
     # (1.000000, 1.000000, 1.414214, 1.414214, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (1.000000, -0.577350, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt2_sqrt3_2", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -111,15 +70,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt3(lat_const: float) -> list[Cartesia
     (1, 1, sqrt(2), sqrt(3), sqrt(3), sqrt(3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.732051, 0.000000),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a(
@@ -130,15 +81,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_a(
     (1, 1, sqrt(2), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (-1.000000, 1.154701, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b(
@@ -149,15 +92,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_b(
     (1, 1, sqrt(2), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, -0.577350, 0.816497),
-        (1.000000, -0.577350, -0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c(
@@ -168,15 +103,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_sqrt113_c(
     (1, 1, sqrt(2), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 1.154701, -0.816497),
-        (0.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_sqrt113_c", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianND]:
@@ -185,15 +112,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(2), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (-1.500000, 0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_2_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianND]:
@@ -202,15 +121,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(2), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_2_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c(lat_const: float) -> list[CartesianND]:
@@ -219,15 +130,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt3_2_c(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(2), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (2.000000, 0.000000, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt3_2_c", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a(
@@ -238,15 +141,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_a(
     (1, 1, sqrt(2), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.154701, 0.816497),
-        (1.000000, 0.000000, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b(
@@ -257,15 +152,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_b(
     (1, 1, sqrt(2), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, -0.577350, 0.816497),
-        (1.000000, 0.000000, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c(
@@ -276,15 +163,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_c(
     (1, 1, sqrt(2), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, 0.288675, 0.816497),
-        (1.000000, 0.000000, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_sqrt113_c", lat_const)
 
 
 def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d(
@@ -295,15 +174,7 @@ def fourbody_geometry_sqrt2_sqrt3_sqrt113_sqrt113_d(
     (1, 1, sqrt(2), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.414214, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.500000, 0.866025, 1.632993),
-        (0.500000, -0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt2_sqrt3_sqrt113_sqrt113_d", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113(
@@ -314,15 +185,7 @@ def fourbody_geometry_sqrt83_sqrt83_sqrt113_sqrt113(
     (1, 1, sqrt(8/3), sqrt(8/3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.632993, 1.632993, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (0.500000, 0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt83_sqrt113_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3(lat_const: float) -> list[CartesianND]:
@@ -331,15 +194,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt3(lat_const: float) -> list[Cartesi
     (1, 1, sqrt(8/3), sqrt(3), sqrt(3), sqrt(3))
     # (1.000000, 1.000000, 1.632993, 1.732051, 1.732051, 1.732051)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 0.000000, 1.632993),
-        (0.500000, -1.443376, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3_sqrt3", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -348,15 +203,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3_sqrt113(lat_const: float) -> list[Carte
     (1, 1, sqrt(8/3), sqrt(3), sqrt(3), sqrt(11/3))
     # (1.000000, 1.000000, 1.632993, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt3_2(lat_const: float) -> list[CartesianND]:
@@ -365,15 +212,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt3_2(lat_const: float) -> list[CartesianND
     (1, 1, sqrt(8/3), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.632993, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.000000, 0.000000, 1.632993),
-        (-1.500000, 0.288675, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt3_2", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113(
@@ -384,15 +223,7 @@ def fourbody_geometry_sqrt83_sqrt3_sqrt113_sqrt113(
     (1, 1, sqrt(8/3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.632993, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (0.500000, -0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt3_sqrt113_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113(
@@ -403,15 +234,7 @@ def fourbody_geometry_sqrt83_sqrt113_sqrt113_sqrt113(
     (1, 1, sqrt(8/3), sqrt(11/3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.632993, 1.914854, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (1.000000, 0.000000, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt113_sqrt113_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt83_sqrt113_sqrt113_2(lat_const: float) -> list[CartesianND]:
@@ -420,15 +243,7 @@ def fourbody_geometry_sqrt83_sqrt113_sqrt113_2(lat_const: float) -> list[Cartesi
     (1, 1, sqrt(8/3), sqrt(11/3), sqrt(11/3), 2)
     # (1.000000, 1.000000, 1.632993, 1.914854, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 0.000000, 1.632993),
-        (-0.500000, -0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt83_sqrt113_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113(lat_const: float) -> list[CartesianND]:
@@ -437,15 +252,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_sqrt113(lat_const: float) -> list[Cartes
     (1, 1, sqrt(3), sqrt(3), sqrt(3), sqrt(11/3)
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.732051, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.500000, 0.866025, 1.632993),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianND]:
@@ -454,15 +261,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_a(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(3), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.732051, 0.000000),
-        (-1.500000, 0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_2_a", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianND]:
@@ -471,15 +270,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_b(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(3), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, -0.577350, 0.816497),
-        (1.500000, -0.866025, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_2_b", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c(lat_const: float) -> list[CartesianND]:
@@ -488,15 +279,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt3_2_c(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(3), sqrt(3), sqrt(3), 2)
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.732051, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (-1.500000, 0.866025, 0.000000),
-        (-1.000000, 1.154701, 0.816497),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt3_2_c", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a(
@@ -507,15 +290,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_a(
     (1, 1, sqrt(3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, -0.577350, 0.816497),
-        (-0.500000, 0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt113_sqrt113_a", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b(
@@ -526,15 +301,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_b(
     (1, 1, sqrt(3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (-1.000000, 1.154701, 0.816497),
-        (-0.500000, 0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt113_sqrt113_b", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c(
@@ -545,15 +312,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt113_sqrt113_c(
     (1, 1, sqrt(3), sqrt(3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.732051, 1.732051, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.500000, 0.866025, 1.632993),
-        (0.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt113_sqrt113_c", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_sqrt113_2(lat_const: float) -> list[CartesianND]:
@@ -562,15 +321,7 @@ def fourbody_geometry_sqrt3_sqrt3_sqrt113_2(lat_const: float) -> list[CartesianN
     (1, 1, sqrt(3), sqrt(3), sqrt(11/3), 2)
     (1.000000, 1.000000, 1.732051, 1.732051, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (1.500000, 0.288675, -0.816497),
-        (2.000000, 0.000000, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt3_2_2(lat_const: float) -> list[CartesianND]:
@@ -579,15 +330,7 @@ def fourbody_geometry_sqrt3_sqrt3_2_2(lat_const: float) -> list[CartesianND]:
     (1, 1, sqrt(3), sqrt(3), 2, 2)
     # (1.000000, 1.000000, 1.732051, 1.732051, 2.000000, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.500000, -0.866025, 0.000000),
-        (2.000000, 0.000000, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt3_2_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113(
@@ -598,15 +341,7 @@ def fourbody_geometry_sqrt3_sqrt113_sqrt113_sqrt113(
     (1, 1, sqrt(3), sqrt(11/3), sqrt(11/3), sqrt(11/3))
     # (1.000000, 1.000000, 1.732051, 1.914854, 1.914854, 1.914854)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (0.000000, 1.732051, 0.000000),
-        (-0.500000, 0.866025, 1.632993),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt113_sqrt113_sqrt113", lat_const)
 
 
 def fourbody_geometry_sqrt3_sqrt113_sqrt113_2(lat_const: float) -> list[CartesianND]:
@@ -615,15 +350,7 @@ def fourbody_geometry_sqrt3_sqrt113_sqrt113_2(lat_const: float) -> list[Cartesia
     (1, 1, sqrt(3), sqrt(11/3), sqrt(11/3), 2)
     # (1.000000, 1.000000, 1.732051, 1.914854, 1.914854, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.288675, 0.816497),
-        (0.500000, 0.866025, 1.632993),
-        (1.000000, 1.732051, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_sqrt113_sqrt113_2", lat_const)
 
 
 def fourbody_geometry_sqrt3_2_2_2(lat_const: float) -> list[CartesianND]:
@@ -632,15 +359,7 @@ def fourbody_geometry_sqrt3_2_2_2(lat_const: float) -> list[CartesianND]:
     (1, 1, sqrt(3), 2, 2, 2)
     # (1.000000, 1.000000, 1.732051, 2.000000, 2.000000, 2.000000)
     """
-    _check_lat_const_positive(lat_const)
-    points = [
-        (0.000000, 0.000000, 0.000000),
-        (0.500000, 0.866025, 0.000000),
-        (1.000000, 1.732051, 0.000000),
-        (2.000000, 0.000000, 0.000000),
-    ]
-
-    return [lat_const * Cartesian3D(*p) for p in points]
+    return _cartesian_geometry_points("sqrt3_2_2_2", lat_const)
 
 
 # def fourbody_geometry_(lat_const: float) -> list[CartesianND]:
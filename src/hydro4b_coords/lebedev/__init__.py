@@ -2,6 +2,9 @@ from .schemes import LebedevScheme  # noqa
 from .schemes import Lebedev3  # noqa
 from .schemes import Lebedev5  # noqa
 from .schemes import LEBEDEV_SCHEME_MAP  # noqa
+from .schemes import LebedevSchemeInfo  # noqa
 from .orientation import LebedevOrientation  # noqa
 from .orientation_generator import LebedevOrientationGenerator  # noqa
 from .orientation_generator import total_number_of_orientations  # noqa
+from .symmetry import symmetry_operations  # noqa
+from .symmetry import unique_orientation_combinations  # noqa
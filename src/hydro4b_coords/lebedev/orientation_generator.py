@@ -1,11 +1,18 @@
 """
 LebedevOrientationGenerator
  - a generator that iterates over all combinations of Lebedev orientations
+
+Besides iterating over lists of orientations, the combinations can also be enumerated
+as arrays of orientation indices, or of angles, in the same order as the iterator.
 """
 
 from __future__ import annotations
 
 import itertools
+from typing import Iterator
+
+import numpy as np
+from numpy.typing import NDArray
 
 from hydro4b_coords.lebedev.orientation import LebedevOrientation
 from hydro4b_coords.lebedev.schemes import LebedevScheme
@@ -29,6 +36,8 @@ def total_number_of_orientations(scheme: LebedevScheme, n_particles: int) -> int
 class LebedevOrientationGenerator:
     _orientations: list[LebedevScheme]
     _orientations_to_angles_map: dict[LebedevScheme, LebedevOrientation]
+    _polar_angles: NDArray[np.float64]
+    _azimuthal_angles: NDArray[np.float64]
     _n_yielded_orients: int
 
     def __init__(self, scheme: LebedevScheme, n_yielded_orients: int) -> None:
@@ -41,6 +50,7 @@ class LebedevOrientationGenerator:
         scheme_info = LEBEDEV_SCHEME_MAP[scheme]  # type: ignore
         self._orientations = scheme_info.ordered_orientations
         self._orientations_to_angles_map = scheme_info.angles
+        self._polar_angles, self._azimuthal_angles = scheme_info.angle_arrays()
 
         self.set_number_of_yielded_orientations(n_yielded_orients)
 
@@ -64,6 +74,53 @@ class LebedevOrientationGenerator:
     def orientations_to_angles_map(self) -> dict[LebedevScheme, LebedevOrientation]:
         return self._orientations_to_angles_map
 
+    @property
+    def number_of_combinations(self) -> int:
+        return int(self.number_of_orientations**self._n_yielded_orients)
+
+    def index_array(self) -> NDArray[np.intp]:
+        """
+        The orientation indices of every combination, as an array of shape
+        (number_of_combinations, n_yielded_orients). The rows are in the same order
+        as the combinations yielded by the iterator.
+        """
+        return self._index_rows(0, self.number_of_combinations)
+
+    def index_chunks(self, chunk_size: int) -> Iterator[NDArray[np.intp]]:
+        """
+        Like 'index_array()', but yields the rows 'chunk_size' at a time, so that the
+        entire array never needs to be held in memory.
+        """
+        _check_chunk_size(chunk_size)
+
+        n_combinations = self.number_of_combinations
+        for i_start in range(0, n_combinations, chunk_size):
+            i_stop = min(i_start + chunk_size, n_combinations)
+            yield self._index_rows(i_start, i_stop)
+
+    def angle_chunks(
+        self, chunk_size: int
+    ) -> Iterator[tuple[NDArray[np.float64], NDArray[np.float64]]]:
+        """
+        Yield the polar and azimuthal angles of the combinations, 'chunk_size' at a time,
+        as pairs of arrays of shape (chunk_size, n_yielded_orients); the last chunk may be
+        shorter. The angles can be passed directly to batched code, such as
+        'spherical.hydrogen_molecule_atomic_positions_array()'.
+        """
+        for indices in self.index_chunks(chunk_size):
+            yield (self._polar_angles[indices], self._azimuthal_angles[indices])
+
+    def _index_rows(self, i_start: int, i_stop: int) -> NDArray[np.intp]:
+        """
+        The rows of the index array from 'i_start' to 'i_stop'; each row holds the digits
+        of its row number in base 'number_of_orientations', which is the same order that
+        'itertools.product()' uses.
+        """
+        dims = (self.number_of_orientations,) * self._n_yielded_orients
+        flat_indices = np.arange(i_start, i_stop)
+
+        return np.stack(np.unravel_index(flat_indices, dims), axis=-1)
+
     def __iter__(self):
         n_total_orients = len(self._orientations)
         self._product_indices = itertools.product(
@@ -75,3 +132,11 @@ class LebedevOrientationGenerator:
     def __next__(self):
         next_indices = next(self._product_indices)
         return self.combination(*next_indices)
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(
+            "The number of combinations in each chunk must be positive.\n"
+            f"Entered: {chunk_size}"
+        )
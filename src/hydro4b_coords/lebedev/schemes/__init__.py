@@ -2,6 +2,7 @@ from .lebedev3 import Lebedev3
 from .lebedev3 import LEBEDEV3_SCHEME_INFO
 from .lebedev5 import Lebedev5
 from .lebedev5 import LEBEDEV5_SCHEME_INFO
+from .schemeinfo import LebedevSchemeInfo
 
 LebedevScheme = Lebedev3 | Lebedev5
 
@@ -1,16 +1,88 @@
+import collections
 import dataclasses
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from hydro4b_coords.lebedev.orientation import LebedevOrientation
+from hydro4b_coords import spherical
+
+# the number of bond lengths whose bond vectors are kept by each scheme; a calculation
+# normally uses one bond length, so only a scan over many of them ever evicts a table
+_BOND_VECTORS_CACHE_SIZE = 32
+
 
 # NOTE: several operations depend on the order of the orientations with a given
 # Lebedev scheme to be the same each time. Even though both `_angles` and
 # `_ordered_orientations` have the same objects, and dictionaries are ordered in
 # Python 3.6 and above, I would prefer to have an object that *explicitly* orders
 # them; hence why `_ordered_orientations` exists
+#
+# The remaining fields are tables derived from the angles when the instance is created;
+# they follow the order of `ordered_orientations`, and let the positions of the atoms
+# of a molecule be found without any trigonometric functions
 @dataclasses.dataclass(frozen=True)  # noqa
 class LebedevSchemeInfo:
     angles: dict[Any, LebedevOrientation]
     weights: list[float]
     ordered_orientations: list[Any]
     n_orientations: int
+    unit_vectors: NDArray[np.float64] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    orientation_indices: dict[Any, int] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _bond_vectors_cache: collections.OrderedDict[
+        float, NDArray[np.float64]
+    ] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        polar, azimuthal = self.angle_arrays()
+        unit_vectors = spherical.spherical_to_cartesian_array(1.0, polar, azimuthal)
+        unit_vectors.setflags(write=False)
+
+        orientation_indices = {
+            orient: i for (i, orient) in enumerate(self.ordered_orientations)
+        }
+
+        # the dataclass is frozen, so the derived fields must be set this way
+        object.__setattr__(self, "unit_vectors", unit_vectors)
+        object.__setattr__(self, "orientation_indices", orientation_indices)
+        object.__setattr__(self, "_bond_vectors_cache", collections.OrderedDict())
+
+    def bond_vectors(self, bondlength: float) -> NDArray[np.float64]:
+        """
+        The positions of the two atoms of a hydrogen molecule with a bond length of
+        'bondlength', relative to its centre of mass, for every orientation. The returned
+        read-only array has shape (n_orientations, 2, 3).
+
+        The arrays of the most recently used bond lengths are cached, so each is normally
+        created only once.
+        """
+        bondlength = float(bondlength)
+        cache = self._bond_vectors_cache
+        bond_vectors = cache.get(bondlength)
+
+        if bond_vectors is None:
+            polar, azimuthal = self.angle_arrays()
+            bond_vectors = spherical.hydrogen_molecule_atomic_positions_array(
+                np.zeros(3), bondlength, polar, azimuthal
+            )
+            bond_vectors.setflags(write=False)
+            cache[bondlength] = bond_vectors
+            if len(cache) > _BOND_VECTORS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(bondlength)
+
+        return bond_vectors
+
+    def angle_arrays(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """The polar and azimuthal angles of all the orientations, as two arrays."""
+        sphere_angles = [self.angles[orient] for orient in self.ordered_orientations]
+        polar = np.array([angles.polar for angles in sphere_angles])
+        azimuthal = np.array([angles.azimuthal for angles in sphere_angles])
+
+        return (polar, azimuthal)
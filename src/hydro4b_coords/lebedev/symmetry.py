@@ -0,0 +1,186 @@
+"""
+This module contains functions for enumerating only the symmetry-unique combinations of
+Lebedev orientations of the molecules of a geometry.
+
+A symmetry operation of the geometry is an orthogonal transformation (a rotation, a
+reflection, or a combination of both) about its centroid, that maps the centres of mass
+of the molecules onto each other. If the transformation also maps every direction of the
+Lebedev scheme onto another direction of the scheme (up to a sign, because the hydrogen
+molecule is homonuclear), then it maps each combination of orientations onto another
+combination with the same energy.
+
+The combinations are grouped into the orbits of these operations, and only one
+representative of each orbit, along with the size of the orbit, needs to be calculated.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydro4b_coords.lebedev.schemes import LebedevScheme
+from hydro4b_coords.lebedev.schemes import LEBEDEV_SCHEME_MAP
+
+SymmetryOperation = tuple[NDArray[np.float64], tuple[int, ...]]
+
+# either an array of shape (n_points, 3), or a list of Cartesian3D instances
+CentresOfMass = Union[Sequence[Any], NDArray[np.float64]]
+
+
+def symmetry_operations(
+    centres_of_mass: CentresOfMass,
+    *,
+    tolerance: float = 1.0e-6,
+) -> list[SymmetryOperation]:
+    """
+    Find the symmetry operations of the geometry formed by the centres of mass. Each
+    operation is a pair of an orthogonal (3, 3) matrix 'R', and a permutation 'perm' of
+    the points, such that 'R @ points[i]' is 'points[perm[i]]' (relative to the centroid).
+
+    For each permutation of the points, the best orthogonal matrix is found by solving the
+    orthogonal Procrustes problem, and is kept if it maps the points onto each other within
+    'tolerance' times the size of the geometry. For planar geometries, the reflection
+    through the plane is also combined with each operation.
+    """
+    points = _as_points_array(centres_of_mass)
+    points = points - points.mean(axis=0)
+    n_points = points.shape[0]
+
+    scale = max(float(np.max(np.linalg.norm(points, axis=1))), 1.0e-12)
+    max_residual = tolerance * scale
+
+    candidates = []
+    for perm in itertools.permutations(range(n_points)):
+        target = points[list(perm)]
+        u, _, vt = np.linalg.svd(target.T @ points)
+        candidates.append((u @ vt, perm))
+
+    plane_normal = _plane_normal(points, max_residual)
+    if plane_normal is not None:
+        mirror = np.eye(3) - 2.0 * np.outer(plane_normal, plane_normal)
+        candidates += [(rotation @ mirror, perm) for (rotation, perm) in candidates]
+
+    operations = []
+    for (rotation, perm) in candidates:
+        residual = np.max(np.abs(points @ rotation.T - points[list(perm)]))
+        if residual <= max_residual:
+            operations.append((rotation, perm))
+
+    return operations
+
+
+def unique_orientation_combinations(
+    centres_of_mass: CentresOfMass,
+    scheme: LebedevScheme,
+    *,
+    tolerance: float = 1.0e-6,
+) -> Iterator[tuple[tuple[int, ...], int]]:
+    """
+    Yield one representative of each set of symmetry-equivalent combinations of Lebedev
+    orientations of the molecules at 'centres_of_mass', along with the number of
+    combinations in the set (its multiplicity weight).
+
+    The representatives are tuples of orientation indices, as used by
+    'LebedevOrientationGenerator.combination()'; each is the first combination of its set
+    in the order of the generator, and they are yielded in that order. The multiplicities
+    add up to 'total_number_of_orientations(scheme, len(centres_of_mass))'.
+    """
+    points = _as_points_array(centres_of_mass)
+    n_particles = points.shape[0]
+
+    scheme_info = LEBEDEV_SCHEME_MAP[scheme]  # type: ignore
+    n_orients = scheme_info.n_orientations
+    dims = (n_orients,) * n_particles
+
+    combinations = np.stack(
+        np.unravel_index(np.arange(n_orients**n_particles), dims), axis=-1
+    )
+
+    images = []
+    for (rotation, perm) in symmetry_operations(points, tolerance=tolerance):
+        direction_map = _direction_map(rotation, scheme_info.unit_vectors, tolerance)
+        if direction_map is None:
+            continue
+
+        # the molecule at point 'i' moves to point 'perm[i]', and its orientation is rotated
+        image = np.empty_like(combinations)
+        image[:, list(perm)] = direction_map[combinations]
+        images.append(np.ravel_multi_index(tuple(image.T), dims))
+
+    labels = _orbit_labels(n_orients**n_particles, images)
+    representatives, multiplicities = np.unique(labels, return_counts=True)
+
+    for (i_rep, multiplicity) in zip(representatives.tolist(), multiplicities.tolist()):
+        yield (tuple(combinations[i_rep].tolist()), multiplicity)
+
+
+def _orbit_labels(n_elements: int, images: list[NDArray[np.intp]]) -> NDArray[np.intp]:
+    """
+    Label every element with the smallest index in its orbit, where each array in
+    'images' maps every element onto its image under one operation. The smallest labels
+    are propagated along the operations in both directions until nothing changes, so the
+    operations do not need to form a closed group.
+    """
+    labels = np.arange(n_elements)
+
+    changed = True
+    while changed:
+        previous = labels.copy()
+        for image in images:
+            np.minimum(labels, labels[image], out=labels)
+            np.minimum.at(labels, image, labels.copy())
+        changed = not np.array_equal(labels, previous)
+
+    return labels
+
+
+def _direction_map(
+    rotation: NDArray[np.float64], unit_vectors: NDArray[np.float64], tolerance: float
+) -> Optional[NDArray[np.intp]]:
+    """
+    The index of the Lebedev direction that each Lebedev direction is mapped onto by
+    'rotation', up to a sign. Returns None if any direction is not mapped onto the grid.
+    """
+    overlaps = np.abs((unit_vectors @ rotation.T) @ unit_vectors.T)
+    direction_map: NDArray[np.intp] = np.argmax(overlaps, axis=1)
+
+    best_overlaps = overlaps[np.arange(len(direction_map)), direction_map]
+    if np.any(best_overlaps < 1.0 - tolerance):
+        return None
+
+    return direction_map
+
+
+def _plane_normal(
+    points: NDArray[np.float64], max_residual: float
+) -> Optional[NDArray[np.float64]]:
+    """The unit normal of the plane containing the centred points, if they are planar."""
+    _, singular_values, vt = np.linalg.svd(points)
+    if singular_values.size < 3 or singular_values[-1] > max_residual:
+        return None
+
+    normal: NDArray[np.float64] = vt[-1]
+
+    return normal
+
+
+def _as_points_array(centres_of_mass: CentresOfMass) -> NDArray[np.float64]:
+    """Accept either an array of shape (n_points, 3), or a list of Cartesian3D instances."""
+    if not isinstance(centres_of_mass, np.ndarray):
+        centres_of_mass = [getattr(c, "coordinates", c) for c in centres_of_mass]
+
+    points = np.asarray(centres_of_mass, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(
+            "The centres of mass must be an array of shape (n_points, 3).\n"
+            f"Found: array of shape {points.shape}"
+        )
+
+    return points
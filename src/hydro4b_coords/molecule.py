@@ -5,9 +5,16 @@ the electronic structure input file.
 
 from __future__ import annotations
 
+from typing import Optional
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
 from cartesian import Cartesian3D
 
 from hydro4b_coords.lebedev import LebedevScheme
+from hydro4b_coords.lebedev import LebedevSchemeInfo
+from hydro4b_coords.lebedev import LEBEDEV_SCHEME_MAP
 from hydro4b_coords.lebedev import LebedevOrientation
 from hydro4b_coords import spherical
 
@@ -49,20 +56,171 @@ class HydrogenMoleculeInfo:
         return HydrogenMoleculeInfo(atoms[0], atoms[1])  # type: ignore
 
 
+class MoleculeBatch:
+    """
+    A compact, array-backed collection of hydrogen molecules. The positions of the atoms
+    are held in a single array of shape (n_molecules, 2, 3), and whether or not each
+    molecule is a ghost is held in a boolean mask of shape (n_molecules,).
+
+    It can be used in place of a list of HydrogenMoleculeInfo instances when creating
+    MRCC input files, without creating any Cartesian3D instances.
+
+    The arrays passed to the constructor are copied, so later changes to them do not
+    affect the batch.
+    """
+
+    _coordinates: NDArray[np.float64]
+    _ghosts: NDArray[np.bool_]
+
+    def __init__(
+        self,
+        coordinates: NDArray[np.float64],
+        ghosts: Optional[NDArray[np.bool_]] = None,
+    ) -> None:
+        coordinates = np.array(coordinates, dtype=float)
+        _check_coordinates_shape(coordinates)
+
+        n_molecules = coordinates.shape[0]
+        if ghosts is None:
+            ghosts = np.zeros(n_molecules, dtype=bool)
+        ghosts = np.array(ghosts, dtype=bool)
+        _check_ghosts_shape(ghosts, n_molecules)
+
+        self._coordinates = coordinates
+        self._ghosts = ghosts
+
+    @classmethod
+    def from_molecules(cls, molecules: list[HydrogenMoleculeInfo]) -> MoleculeBatch:
+        coordinates = np.array(
+            [[atom.coordinates for atom in mol.atoms] for mol in molecules],
+            dtype=float,
+        ).reshape(-1, 2, 3)
+        ghosts = np.array([mol.is_ghost for mol in molecules], dtype=bool)
+
+        return cls(coordinates, ghosts)
+
+    def to_molecules(self) -> list[HydrogenMoleculeInfo]:
+        molecules = []
+        for (atom_coords, is_ghost) in zip(self._coordinates.tolist(), self._ghosts):
+            mol = HydrogenMoleculeInfo(
+                Cartesian3D(*atom_coords[0]), Cartesian3D(*atom_coords[1])
+            )
+            mol.set_ghost(bool(is_ghost))
+            molecules.append(mol)
+
+        return molecules
+
+    def set_ghost(self, i_molecule: int, ghost: bool) -> None:
+        self._ghosts[i_molecule] = ghost
+
+    def __len__(self) -> int:
+        return len(self._coordinates)
+
+    @property
+    def coordinates(self) -> NDArray[np.float64]:
+        return self._coordinates
+
+    @property
+    def ghosts(self) -> NDArray[np.bool_]:
+        return self._ghosts
+
+    @property
+    def atom_positions(self) -> NDArray[np.float64]:
+        """The positions of all the atoms, as an array of shape (2 * n_molecules, 3)."""
+        return self._coordinates.reshape(-1, 3)
+
+    @property
+    def atom_ghost_statuses(self) -> NDArray[np.bool_]:
+        """Whether or not each atom is a ghost, as an array of shape (2 * n_molecules,)."""
+        return np.repeat(self._ghosts, 2)
+
+
+def as_molecule_batch(
+    molecules: Union[list[HydrogenMoleculeInfo], MoleculeBatch]
+) -> MoleculeBatch:
+    """Convert a list of molecules to a MoleculeBatch; a MoleculeBatch is returned as-is."""
+    if isinstance(molecules, MoleculeBatch):
+        return molecules
+
+    return MoleculeBatch.from_molecules(molecules)
+
+
 def get_molecules(
     centres_of_mass: list[Cartesian3D],
     orientations: list[LebedevScheme],
     angle_map: dict[LebedevScheme, LebedevOrientation],
     bondlength: float,
 ) -> list[HydrogenMoleculeInfo]:
+    """
+    Create the hydrogen molecules at the centres of mass, with the given orientations.
+
+    If 'angle_map' is the map of angles of the orientations' own Lebedev scheme, the
+    positions of the atoms are found by looking up the scheme's table of bond vectors;
+    otherwise, they are calculated from the angles in 'angle_map'.
+    """
     assert len(centres_of_mass) == len(orientations)
 
-    sphere_angles = [angle_map[orient] for orient in orientations]
+    scheme_info = _scheme_info_with_angle_map(orientations, angle_map)
+    if scheme_info is None:
+        sphere_angles = [angle_map[orient] for orient in orientations]
+
+        return [
+            HydrogenMoleculeInfo.from_orientation(com, angles, bondlength)
+            for (com, angles) in zip(centres_of_mass, sphere_angles)
+        ]
+
+    bond_vectors = scheme_info.bond_vectors(bondlength).tolist()
+    molecules = []
+    for (com, orient) in zip(centres_of_mass, orientations):
+        offset0, offset1 = bond_vectors[scheme_info.orientation_indices[orient]]
+        atom0 = com + Cartesian3D(*offset0)
+        atom1 = com + Cartesian3D(*offset1)
+        molecules.append(HydrogenMoleculeInfo(atom0, atom1))
+
+    return molecules
+
+
+def get_molecule_batch(
+    centres_of_mass: NDArray[np.float64],
+    orientations: list[LebedevScheme],
+    bondlength: float,
+) -> MoleculeBatch:
+    """
+    Like 'get_molecules()', but the centres of mass are an array of shape (n_molecules, 3),
+    and the molecules are returned as a MoleculeBatch. The angles of the orientations are
+    those of their own Lebedev scheme.
+    """
+    _check_orientations_nonempty(orientations)
+
+    centres_of_mass = np.asarray(centres_of_mass, dtype=float)
+    assert centres_of_mass.shape == (len(orientations), 3)
+
+    scheme_info = LEBEDEV_SCHEME_MAP[type(orientations[0])]  # type: ignore
+    indices = [scheme_info.orientation_indices[orient] for orient in orientations]
+    bond_vectors = scheme_info.bond_vectors(bondlength)
+
+    return MoleculeBatch(centres_of_mass[:, np.newaxis, :] + bond_vectors[indices])
+
+
+def _scheme_info_with_angle_map(
+    orientations: list[LebedevScheme],
+    angle_map: dict[LebedevScheme, LebedevOrientation],
+) -> Optional[LebedevSchemeInfo]:
+    """
+    The info of the orientations' Lebedev scheme, if 'angle_map' holds the same angles
+    as its map of angles; the scheme's own map is recognized without comparing them.
+    """
+    if len(orientations) == 0:
+        return None
+
+    scheme_info = LEBEDEV_SCHEME_MAP.get(type(orientations[0]))  # type: ignore
+    if scheme_info is None:
+        return None
+
+    if angle_map is not scheme_info.angles and angle_map != scheme_info.angles:
+        return None
 
-    return [
-        HydrogenMoleculeInfo.from_orientation(com, angles, bondlength)
-        for (com, angles) in zip(centres_of_mass, sphere_angles)
-    ]
+    return scheme_info
 
 
 def atoms_from_molecules(molecules: list[HydrogenMoleculeInfo]) -> list[Cartesian3D]:
@@ -82,3 +240,28 @@ def ghost_status_from_molecules(molecules: list[HydrogenMoleculeInfo]) -> list[b
         ghost_statuses.extend(mol_ghosts)
 
     return ghost_statuses
+
+
+def _check_coordinates_shape(coordinates: NDArray[np.float64]) -> None:
+    if coordinates.ndim != 3 or coordinates.shape[1:] != (2, 3):
+        raise ValueError(
+            "The coordinates of the molecules must be an array of shape (n_molecules, 2, 3).\n"
+            f"Found: array of shape {coordinates.shape}"
+        )
+
+
+def _check_orientations_nonempty(orientations: list[LebedevScheme]) -> None:
+    if len(orientations) == 0:
+        raise ValueError(
+            "At least one orientation is needed to create a batch of molecules; the\n"
+            "Lebedev scheme of the bond vectors is taken from the orientations."
+        )
+
+
+def _check_ghosts_shape(ghosts: NDArray[np.bool_], n_molecules: int) -> None:
+    if ghosts.shape != (n_molecules,):
+        raise ValueError(
+            "There must be one ghost status for each molecule.\n"
+            f"Expected shape: {(n_molecules,)}\n"
+            f"Found shape: {ghosts.shape}"
+        )
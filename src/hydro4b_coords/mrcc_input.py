@@ -4,17 +4,29 @@ This module contains functions for creating MRCC input files.
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import os
 import pathlib
 import sys
+import time
+import uuid
 
 from typing import Any
+from typing import Iterable
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
 
 from hydro4b_coords import molecule
 from hydro4b_coords.molecule import HydrogenMoleculeInfo
-
-from cartesian import Cartesian3D
-from cartesian import operations
+from hydro4b_coords.molecule import MoleculeBatch
 
 
 _CALC_OPTIONS = ["ccsd(t)"]
@@ -123,7 +135,9 @@ class MRCCInputFileData:
         self._check_valid_options(_funcname(), basis, _MIDBOND_BASIS_OPTIONS)
         self._fields["midbond_basis"] = basis
 
-    def set_molecules(self, molecules: list[HydrogenMoleculeInfo]) -> None:
+    def set_molecules(
+        self, molecules: Union[list[HydrogenMoleculeInfo], MoleculeBatch]
+    ) -> None:
         # TODO: think of requirements for the list of hydrogen molecules; are there any?
         self._fields["molecules"] = molecules
 
@@ -132,58 +146,178 @@ class MRCCInputFileData:
         return self._fields
 
 
+@dataclasses.dataclass(frozen=True)
+class WriteReport:
+    """The number of files and bytes written by a call to 'write_files()', and how long it took."""
+
+    n_files: int
+    n_bytes: int
+    elapsed_seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        if self.elapsed_seconds <= 0.0:
+            return float("inf")
+        return self.n_files / self.elapsed_seconds
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0.0:
+            return float("inf")
+        return self.n_bytes / (1024**2 * self.elapsed_seconds)
+
+
 class MRCCInputFileWriter:
+    _templates: dict[tuple[Any, ...], MRCCInputTemplate]
+
     def __init__(self) -> None:
-        pass
+        self._templates = {}
 
     def write_file(self, mrccdata: MRCCInputFileData, filename: str | pathlib.Path):
-        calc_type_line = self._kvpair_line("calc", mrccdata.fields["calc"])
-        memory_in_mb_line = self._kvpair_line("mem", mrccdata.fields["mem_mb"])
-        cc_tolerance_line = self._kvpair_line("cctol", mrccdata.fields["cctol"])
-        cc_maxiterations_line = self._kvpair_line("ccmaxit", mrccdata.fields["ccmaxit"])
-        scf_energy_tolerance_line = self._kvpair_line(
-            "scftol", mrccdata.fields["scftol"]
-        )
-        scf_density_tolerance_line = self._kvpair_line(
-            "scfdtol", mrccdata.fields["scfdtol"]
-        )
-        scf_maxiterations_line = self._kvpair_line(
-            "scfmaxit", mrccdata.fields["scfmaxit"]
+        with open(filename, "w") as fout:
+            fout.write(self.render(mrccdata))
+
+    def render(self, mrccdata: MRCCInputFileData) -> str:
+        """
+        Create the contents of the MRCC input file described by 'mrccdata'.
+
+        The parts of the file that do not depend on the positions of the atoms are only
+        rendered once for each configuration of settings and number of molecules, and are
+        reused by later calls; see 'compile_template()'.
+        """
+        molecules = mrccdata.fields["molecules"]
+        n_molecules = len(molecules)
+
+        config_key = _configuration_key(mrccdata, n_molecules)
+        template = self._templates.get(config_key)
+        if template is None:
+            template = self.compile_template(mrccdata, n_molecules)
+            self._templates[config_key] = template
+
+        positions, ghost_statuses = _positions_and_ghost_statuses(molecules)
+
+        return template.render(positions, ghost_statuses)
+
+    def compile_template(
+        self, mrccdata: MRCCInputFileData, n_molecules: int
+    ) -> MRCCInputTemplate:
+        """
+        Render the parts of the MRCC input file that are the same for every job with the
+        settings in 'mrccdata' and 'n_molecules' molecules; the molecules in 'mrccdata'
+        itself are ignored.
+        """
+        n_hydro_atoms_per_molecule = 2
+        n_atoms = n_hydro_atoms_per_molecule * n_molecules
+        has_midbond = mrccdata.fields["midbond_basis"] is not None
+
+        header = "\n".join(
+            [
+                self._calculation_lines(mrccdata),
+                "",
+                self._basis_lines(mrccdata, n_molecules=n_molecules),
+                "",
+                self._position_header_lines(n_atoms, has_midbond),
+                "",
+                "",
+            ]
         )
 
-        basis_lines = self._basis_lines(mrccdata)
-        geometry_lines = self._molecule_geometry_lines(mrccdata)
+        return MRCCInputTemplate(header, n_atoms, has_midbond)
 
-        with open(filename, "w") as fout:
-            contents = "\n".join(
-                [
-                    calc_type_line,
-                    memory_in_mb_line,
-                    cc_tolerance_line,
-                    cc_maxiterations_line,
-                    scf_energy_tolerance_line,
-                    scf_density_tolerance_line,
-                    scf_maxiterations_line,
-                    "",
-                    basis_lines,
-                    "",
-                    geometry_lines,
-                ]
-            )
-            fout.write(contents)
+    def write_files(
+        self,
+        jobs: Iterable[Tuple[MRCCInputFileData, str | pathlib.Path]],
+        *,
+        max_workers: int = 8,
+    ) -> WriteReport:
+        """
+        Write many MRCC input files, given as pairs of (mrccdata, filename), and report
+        how many files and bytes were written, and how long it took.
+
+        The contents of each file are rendered in the calling thread, as soon as its pair
+        is taken from 'jobs'; this means the same MRCCInputFileData instance can be modified
+        and reused for the next job. The rendered contents are then written by a pool of
+        'max_workers' threads, which overlaps the latency of many writes on slow (e.g.
+        network) filesystems. At most '2 * max_workers' rendered files wait to be written
+        at any time, so 'jobs' can be an arbitrarily long generator.
+
+        Each file is written atomically; the contents are written to a temporary file in
+        the same directory, which is then renamed to 'filename'. A reader never sees a
+        partially-written input file.
+        """
+        rendered = ((self.render(mrccdata), filename) for (mrccdata, filename) in jobs)
+
+        return self.write_rendered(rendered, max_workers=max_workers)
+
+    def write_rendered(
+        self,
+        rendered: Iterable[Tuple[str, str | pathlib.Path]],
+        *,
+        max_workers: int = 8,
+    ) -> WriteReport:
+        """
+        Like 'write_files()', but for pairs of (contents, filename), where the contents of
+        each file have already been rendered.
+        """
+        _check_max_workers(max_workers)
+        max_pending = 2 * max_workers
+
+        n_files = 0
+        n_bytes = 0
+        start_time = time.perf_counter()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: set[concurrent.futures.Future[int]] = set()
+
+            for (contents, filename) in rendered:
+                pending.add(executor.submit(_write_atomic, contents, filename))
+
+                if len(pending) >= max_pending:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    n_files += len(done)
+                    n_bytes += sum([future.result() for future in done])
+
+            for future in concurrent.futures.as_completed(pending):
+                n_files += 1
+                n_bytes += future.result()
+
+        elapsed_seconds = time.perf_counter() - start_time
+
+        return WriteReport(n_files, n_bytes, elapsed_seconds)
+
+    def _calculation_lines(self, mrccdata: MRCCInputFileData) -> str:
+        """Write the lines that set the type of calculation and its parameters."""
+        return "\n".join(
+            [
+                self._kvpair_line("calc", mrccdata.fields["calc"]),
+                self._kvpair_line("mem", mrccdata.fields["mem_mb"]),
+                self._kvpair_line("cctol", mrccdata.fields["cctol"]),
+                self._kvpair_line("ccmaxit", mrccdata.fields["ccmaxit"]),
+                self._kvpair_line("scftol", mrccdata.fields["scftol"]),
+                self._kvpair_line("scfdtol", mrccdata.fields["scfdtol"]),
+                self._kvpair_line("scfmaxit", mrccdata.fields["scfmaxit"]),
+            ]
+        )
 
     def _kvpair_line(self, key: str, value: Any, *, err_if_none: bool = True) -> str:
         if value is None:
             raise ValueError(f"The value for '{key}' cannot be None")
         return f"{key}={value}"
 
-    def _basis_lines(self, mrccdata: MRCCInputFileData) -> str:
+    def _basis_lines(
+        self, mrccdata: MRCCInputFileData, *, n_molecules: Optional[int] = None
+    ) -> str:
         """
         Write the set of lines that describe the atom-centred and (optionally) the
         midbond-centred basis sets used in the electronic structure calculation.
+
+        The number of molecules is taken from 'mrccdata', unless 'n_molecules' is given.
         """
         if mrccdata.fields["midbond_basis"] is not None:
-            n_molecules = len(mrccdata.fields["molecules"])
+            if n_molecules is None:
+                n_molecules = len(mrccdata.fields["molecules"])
             n_hydro_atoms_per_molecule = 2
             n_atoms = n_hydro_atoms_per_molecule * n_molecules
 
@@ -200,81 +334,160 @@ class MRCCInputFileWriter:
 
         return basis_line
 
-    def _molecule_geometry_lines(self, mrccdata: MRCCInputFileData) -> str:
-        """
-        Write the positions of all the hydrogen atoms, and optionally also the midbond
-        ghost atom.
-        """
-        molecules = mrccdata.fields["molecules"]
-        has_midbond = mrccdata.fields["midbond_basis"] is not None
+    def _position_header_lines(self, n_atoms: int, has_midbond: bool) -> str:
+        if has_midbond:
+            n_positions = n_atoms + 1
+        else:
+            n_positions = n_atoms
 
-        n_molecules = len(molecules)
-        n_hydro_atoms_per_molecule = 2
-        n_atoms = n_hydro_atoms_per_molecule * n_molecules
+        position_header_lines = "\n".join(["unit=angs", "geom=xyz", f"{n_positions}"])
 
-        position_header_lines = self._position_header_lines(n_atoms, has_midbond)
+        return position_header_lines
 
-        atoms = molecule.atoms_from_molecules(molecules)
-        ghost_statuses = molecule.ghost_status_from_molecules(molecules)
+
+class MRCCInputTemplate:
+    """
+    A precompiled MRCC input file, for a fixed configuration of settings and a fixed
+    number of atoms. The header (everything above the atomic positions) is rendered only
+    once, when the template is created by 'MRCCInputFileWriter.compile_template()'.
+
+    Rendering a job only fills in the block of atomic coordinates, which is formatted
+    from a NumPy array in a single string-formatting operation, and the ghost atom block.
+    """
+
+    _header: str
+    _n_atoms: int
+    _has_midbond: bool
+
+    def __init__(self, header: str, n_atoms: int, has_midbond: bool) -> None:
+        self._header = header
+        self._n_atoms = n_atoms
+        self._has_midbond = has_midbond
+
+    @property
+    def n_atoms(self) -> int:
+        return self._n_atoms
+
+    def render(
+        self,
+        positions: NDArray[np.float64],
+        ghost_statuses: Union[Sequence[bool], NDArray[np.bool_]],
+    ) -> str:
+        """
+        Create the contents of the MRCC input file, given the positions of the hydrogen
+        atoms as an array of shape (n_atoms, 3), and whether or not each atom is a ghost.
+        """
+        positions = np.asarray(positions, dtype=float)
+        ghost_statuses = tuple([bool(status) for status in ghost_statuses])
+        self._check_number_of_atoms(positions, ghost_statuses)
 
         # The midbond atom isn't a real atom, but rather just a position. However, in the
         # language of the MRCC program, the only way to include additional basis sets in space
         # is to create an atom and make it a ghost.
         # For the current project, it is located at the centroid of all the real atoms.
-        if has_midbond:
-            midbond_atom = operations.centroid(atoms)
-            atoms.append(midbond_atom)  # type: ignore
-            ghost_statuses.append(True)
+        if self._has_midbond:
+            midbond_atom = positions.mean(axis=0)
+            positions = np.vstack([positions, midbond_atom])
+            ghost_statuses = ghost_statuses + (True,)
+
+        coordinate_format = _coordinate_block_format(ghost_statuses)
+        coordinate_block = coordinate_format % tuple(positions.ravel().tolist())
+        ghost_block = _ghost_indicator_lines(ghost_statuses)
+
+        return "".join([self._header, coordinate_block, "\n\n", ghost_block])
+
+    def _check_number_of_atoms(
+        self, positions: NDArray[np.float64], ghost_statuses: tuple[bool, ...]
+    ) -> None:
+        if (
+            positions.shape != (self._n_atoms, 3)
+            or len(ghost_statuses) != self._n_atoms
+        ):
+            raise ValueError(
+                f"This template requires the positions and ghost statuses of {self._n_atoms} atoms.\n"
+                f"Found: positions of shape {positions.shape}, and {len(ghost_statuses)} ghost statuses"
+            )
 
-        atom_lines = "\n".join(
-            [
-                self._coordinates_line(atom, is_ghost=gstat)
-                for (atom, gstat) in zip(atoms, ghost_statuses)
-            ]
-        )
-        ghost_lines = self._ghost_indicator_lines(ghost_statuses)
 
-        return "\n".join([position_header_lines, "", atom_lines, "", ghost_lines])
+def _configuration_key(
+    mrccdata: MRCCInputFileData, n_molecules: int
+) -> tuple[Any, ...]:
+    """All the information that a template depends on; every field besides the molecules."""
+    settings = [value for (key, value) in mrccdata.fields.items() if key != "molecules"]
+    return tuple(settings + [n_molecules])
 
-    def _position_header_lines(self, n_atoms: int, has_midbond: bool) -> str:
-        if has_midbond:
-            n_positions = n_atoms + 1
-        else:
-            n_positions = n_atoms
 
-        position_header_lines = "\n".join(["unit=angs", "geom=xyz", f"{n_positions}"])
+def _positions_and_ghost_statuses(
+    molecules: Union[list[HydrogenMoleculeInfo], MoleculeBatch],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    batch = molecule.as_molecule_batch(molecules)
+    return (batch.atom_positions, batch.atom_ghost_statuses)
 
-        return position_header_lines
 
-    def _coordinates_line(self, atom: Cartesian3D, *, is_ghost: bool) -> str:
-        """
-        Format the line describing the atom and its cartesian position. Also included
-        is a comment for the user, indicating whether or not that atom is a ghost.
-        """
-        atom_symbol = "H"
-        x, y, z = atom.coordinates
+@functools.lru_cache(maxsize=1024)
+def _coordinate_block_format(ghost_statuses: tuple[bool, ...]) -> str:
+    """
+    The %-format string for the lines of all the atoms; each line holds the symbol and
+    cartesian position of an atom, and a comment for the user indicating whether or not
+    that atom is a ghost. There are only a handful of different patterns of ghost atoms,
+    so the format strings are cached.
+    """
+    atom_symbol = "H"
+    lines = []
+    for is_ghost in ghost_statuses:
+        comment = "# GHOST ATOM" if is_ghost else "# REAL ATOM"
+        lines.append(f"{atom_symbol}   % 12.9f   % 12.9f   % 12.9f   {comment}")
 
-        if is_ghost:
-            comment = "# GHOST ATOM"
-        else:
-            comment = "# REAL ATOM"
+    return "\n".join(lines)
 
-        return f"{atom_symbol}   {x: 12.9f}   {y: 12.9f}   {z: 12.9f}   {comment}"
 
-    def _ghost_indicator_lines(self, ghost_statuses: list[bool]) -> str:
-        """
-        A comma-separated list of indices indicating which of the atoms are ghost atoms.
-        The MRCC code uses 1-index notation.
-        """
-        ghost_index_line = ",".join(
-            [str(i + 1) for (i, status) in enumerate(ghost_statuses) if status]
-        )
+@functools.lru_cache(maxsize=1024)
+def _ghost_indicator_lines(ghost_statuses: tuple[bool, ...]) -> str:
+    """
+    A comma-separated list of indices indicating which of the atoms are ghost atoms.
+    The MRCC code uses 1-index notation.
+    """
+    ghost_index_line = ",".join(
+        [str(i + 1) for (i, status) in enumerate(ghost_statuses) if status]
+    )
 
-        ghost_lines = "\n".join(
-            [
-                "ghost=serialno",
-                ghost_index_line,
-            ]
-        )
+    ghost_lines = "\n".join(
+        [
+            "ghost=serialno",
+            ghost_index_line,
+        ]
+    )
 
-        return ghost_lines
+    return ghost_lines
+
+
+def _write_atomic(contents: str, filename: str | pathlib.Path) -> int:
+    """
+    Write 'contents' to a temporary file in the same directory as 'filename', then rename
+    it to 'filename'. Returns the number of bytes written.
+
+    The temporary file is created with the same permissions that 'open()' would give it.
+    """
+    filepath = pathlib.Path(filename)
+    tmp_filepath = filepath.with_name(f".{filepath.name}.{uuid.uuid4().hex}")
+    encoded = contents.encode()
+
+    fd = os.open(tmp_filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as fout:
+            fout.write(encoded)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_filepath)
+        raise
+
+    return len(encoded)
+
+
+def _check_max_workers(max_workers: int) -> None:
+    if max_workers < 1:
+        raise ValueError(
+            "The number of threads used to write the files must be positive.\n"
+            f"Entered: {max_workers}"
+        )
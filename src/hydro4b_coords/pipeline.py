@@ -0,0 +1,195 @@
+"""
+This module contains a lazy, generator-based pipeline that streams electronic structure
+jobs from a source of four-body geometries, through the expansion over all combinations
+of Lebedev orientations, to MRCC input files on disk.
+
+Every stage is a generator that holds at most one geometry (or one batch of sampled
+geometries) at a time, so the memory used does not grow with the number of jobs.
+
+A typical pipeline looks like:
+
+    geometries = tagged_geometries(lat_const)
+    jobs = orientation_jobs(geometries, lebedev.Lebedev3, bondlength)
+    write_jobs(jobs, mrccdata, output_dir)
+
+Each job carries a 'weight'. For the geometries of the HCP lattice, it is the number of
+times the geometry appears around a single molecule, from
+'MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT', and it is passed on to every job created
+from the geometry.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import pathlib
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+from cartesian import Cartesian3D
+
+from hydro4b_coords import geometries
+from hydro4b_coords import molecule
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from hydro4b_coords.generate.generate import sample_fourbody_geometries
+from hydro4b_coords.lebedev import LebedevOrientationGenerator
+from hydro4b_coords.lebedev import LebedevScheme
+from hydro4b_coords.lebedev import LEBEDEV_SCHEME_MAP
+from hydro4b_coords.molecule import HydrogenMoleculeInfo
+from hydro4b_coords.mrcc_input import MRCCInputFileData
+from hydro4b_coords.mrcc_input import MRCCInputFileWriter
+
+
+@dataclasses.dataclass(frozen=True)
+class GeometryJob:
+    """
+    The centres of mass of the molecules of a single geometry, a unique label, and the
+    weight of the geometry (its combinatorial count, for the geometries of the lattice).
+    """
+
+    label: str
+    centres_of_mass: list[Cartesian3D]
+    weight: int = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class MoleculeJob:
+    """
+    The hydrogen molecules for a single electronic structure calculation. The 'label'
+    is a relative path, which is unique to the job, and is used as its directory name.
+    """
+
+    label: str
+    molecules: list[HydrogenMoleculeInfo]
+    weight: int = 1
+
+
+def tagged_geometries(
+    lat_const: float, tags: Optional[Iterable[str]] = None
+) -> Iterator[GeometryJob]:
+    """
+    Yield the four-body geometries of the HCP lattice, from 'MAP_GEOMETRY_TAG_TO_FUNCTION',
+    with the lattice constant 'lat_const'. If 'tags' is given, only those geometries are
+    yielded; otherwise, all of them are yielded.
+    """
+    if tags is None:
+        tags = geometries.MAP_GEOMETRY_TAG_TO_FUNCTION.keys()
+
+    for tag in tags:
+        function = geometries.MAP_GEOMETRY_TAG_TO_FUNCTION[tag]
+        weight = geometries.MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT[tag]
+        yield GeometryJob(tag, function(lat_const), weight)
+
+
+def lattice_sweep_geometries(
+    lat_consts: Sequence[float], tags: Optional[Sequence[str]] = None
+) -> Iterator[GeometryJob]:
+    """
+    Yield the four-body geometries of the HCP lattice (or only those in 'tags') for every
+    lattice constant in 'lat_consts', for example to build an equation-of-state curve.
+
+    The points of all the geometries are created at once with 'lattice_constant_sweep()'.
+    The label of each geometry is the position of the lattice constant in 'lat_consts' and
+    its value, followed by the tag; for example, 'lat_002_3.200000/sqrt2'. The position
+    keeps the labels unique, even if two lattice constants are equal to 6 decimal places.
+    """
+    if tags is None:
+        tags = geometries.GEOMETRY_TAGS
+
+    all_points = geometries.lattice_constant_sweep(lat_consts, tags)
+    weights = [geometries.MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT[tag] for tag in tags]
+
+    for (i_lat, (lat_const, points)) in enumerate(zip(lat_consts, all_points.tolist())):
+        for (tag, weight, centres) in zip(tags, weights, points):
+            label = f"lat_{i_lat:03d}_{lat_const:.6f}/{tag}"
+            yield GeometryJob(label, [Cartesian3D(*c) for c in centres], weight)
+
+
+def sampled_geometries(
+    distrib: DiscretizedDistribution,
+    n_geometries: int,
+    rng: np.random.Generator,
+    *,
+    batch_size: int = 4096,
+) -> Iterator[GeometryJob]:
+    """
+    Yield 'n_geometries' four-body geometries whose side lengths are sampled from 'distrib'.
+    The geometries are sampled 'batch_size' at a time, and only one batch is held in memory.
+    """
+    n_yielded = 0
+    while n_yielded < n_geometries:
+        n_batch = min(batch_size, n_geometries - n_yielded)
+        points = sample_fourbody_geometries(distrib, n_batch, rng)
+
+        for centres in points:
+            label = f"sample_{n_yielded:06d}"
+            yield GeometryJob(label, [Cartesian3D(*centre) for centre in centres])
+            n_yielded += 1
+
+
+def orientation_jobs(
+    geometry_jobs: Iterable[GeometryJob],
+    scheme: LebedevScheme,
+    bondlength: float,
+) -> Iterator[MoleculeJob]:
+    """
+    For each geometry, yield one job for every combination of Lebedev orientations of the
+    molecules. The label of each job is the label of the geometry, followed by the indices
+    of the orientations of the molecules; for example, 'sqrt2/orient_0_2_1_1'.
+    """
+    angle_map = LEBEDEV_SCHEME_MAP[scheme].angles  # type: ignore
+
+    for geometry in geometry_jobs:
+        n_molecules = len(geometry.centres_of_mass)
+        lebedevgen = LebedevOrientationGenerator(scheme, n_molecules)
+        all_indices = itertools.product(
+            range(lebedevgen.number_of_orientations), repeat=n_molecules
+        )
+
+        for indices in all_indices:
+            orientations = lebedevgen.combination(*indices)
+            molecules = molecule.get_molecules(
+                geometry.centres_of_mass, orientations, angle_map, bondlength
+            )
+            label = "/".join([geometry.label, _orientation_label(indices)])
+
+            yield MoleculeJob(label, molecules, geometry.weight)
+
+
+def write_jobs(
+    jobs: Iterable[MoleculeJob],
+    mrccdata: MRCCInputFileData,
+    output_dir: str | pathlib.Path,
+    *,
+    filename: str = "MINP",
+    max_workers: int = 8,
+) -> int:
+    """
+    Write an MRCC input file for every job, into the directory 'output_dir/<job label>'.
+    All the settings besides the molecules are taken from 'mrccdata'; its molecules are
+    replaced for each job.
+
+    The jobs are consumed one at a time, and the files are written by a pool of
+    'max_workers' threads. Returns the number of files written.
+    """
+    output_dir = pathlib.Path(output_dir)
+
+    def mrccdata_and_filenames() -> Iterator[tuple[MRCCInputFileData, pathlib.Path]]:
+        for job in jobs:
+            job_dir = output_dir / job.label
+            job_dir.mkdir(parents=True, exist_ok=True)
+
+            mrccdata.set_molecules(job.molecules)
+            yield (mrccdata, job_dir / filename)
+
+    filewriter = MRCCInputFileWriter()
+    report = filewriter.write_files(mrccdata_and_filenames(), max_workers=max_workers)
+
+    return report.n_files
+
+
+def _orientation_label(indices: tuple[int, ...]) -> str:
+    return "_".join(["orient"] + [str(i) for i in indices])
@@ -1,5 +1,16 @@
 from hydro4b_coords.sidelength_swap.common_types import SixSideLengths
 from hydro4b_coords.sidelength_swap.comparison import LessThanRounded
 from hydro4b_coords.sidelength_swap.comparison import LessThanEpsilon
+from hydro4b_coords.sidelength_swap.comparison import SnapToGrid
 
+from hydro4b_coords.sidelength_swap.index_permutations import canonical_key
+from hydro4b_coords.sidelength_swap.index_permutations import (
+    canonical_key_from_quantized,
+)
 from hydro4b_coords.sidelength_swap.index_permutations import minimum_permutation
+from hydro4b_coords.sidelength_swap.index_permutations import minimum_permutation_array
+from hydro4b_coords.sidelength_swap.deduplication import DeduplicationIndex
+from hydro4b_coords.sidelength_swap.lattice import encode_lattice_sidelengths
+from hydro4b_coords.sidelength_swap.lattice import decode_lattice_code
+from hydro4b_coords.sidelength_swap.lattice import minimum_permutation_lattice
+from hydro4b_coords.sidelength_swap.lattice import lattice_geometry_tag
@@ -6,3 +6,4 @@ from typing import Tuple
 
 SixSideLengths = Tuple[float, float, float, float, float, float]
 Permutation = Tuple[int, int, int, int, int, int]
+QuantizedSideLengths = Tuple[int, int, int, int, int, int]
@@ -6,10 +6,15 @@ sometimes two instances *should* be equal, but one ends up larger than the other
 only due to floating-point errors. This happens frequently enough, especially when
 comparing the sidelengths of geometries from a frozen lattice, that special functions
 should be used.
+
+Neither 'LessThanRounded' nor 'LessThanEpsilon' is cheap to call many times, and
+'LessThanEpsilon' is not transitive; 'SnapToGrid' instead quantizes the side lengths
+into integers once, after which they can be compared exactly.
 """
 
 from dataclasses import dataclass
 
+from hydro4b_coords.sidelength_swap.common_types import QuantizedSideLengths
 from hydro4b_coords.sidelength_swap.common_types import SixSideLengths
 
 
@@ -37,6 +42,9 @@ class LessThanEpsilon:
     """
     Usual element-wise comparison of two tuples, except two floating-point values are
     considered equal if they are within 'self.epsilon' of each other.
+
+    NOTE: this comparison is not transitive; 'a' can be equal to 'b', and 'b' equal to 'c',
+    while 'a' is less than 'c'. Use 'SnapToGrid' when a consistent order is needed.
     """
 
     epsilon: float
@@ -48,3 +56,30 @@ class LessThanEpsilon:
         for (sidelen0, sidelen1) in zip(s0, s1):
             if abs(sidelen0 - sidelen1) > self.epsilon:
                 return sidelen0 < sidelen1
+
+        # all the elements are within 'self.epsilon' of each other; the tuples are equal
+        return False
+
+
+@dataclass(frozen=True)
+class SnapToGrid:
+    """
+    Snap each side length to the nearest multiple of '10^(-n_round)', and represent it as
+    that integer multiple. The integer tuples are compared exactly, so the order is a
+    total order, and the quantized side lengths can be used as keys for hashing.
+
+    Side lengths that are nearly equal are snapped to the same integer, unless they fall
+    on either side of the midpoint between two grid points.
+    """
+
+    n_round: int
+
+    def __post_init__(self) -> None:
+        assert self.n_round >= 1
+
+    def quantize(self, s: SixSideLengths) -> QuantizedSideLengths:
+        scale = 10**self.n_round
+        return tuple([round(val * scale) for val in s])  # type: ignore
+
+    def __call__(self, s0: SixSideLengths, s1: SixSideLengths) -> bool:
+        return self.quantize(s0) < self.quantize(s1)
@@ -0,0 +1,143 @@
+"""
+This module contains the DeduplicationIndex class, which finds four-body geometries that
+are duplicates of each other, using the canonical ordering of their six side lengths.
+
+Two geometries are duplicates if their side lengths are equal, to within a certain number
+of decimal places, after both are put into their minimum permutation. The side lengths
+are snapped to a grid of integers before they are permuted, and the minimum permutation
+of the integers is used as a key in a dictionary, so that each geometry can be checked
+and added in constant time.
+
+Two nearly equal side lengths on either side of the midpoint between two grid points are
+snapped to different integers. To still find such duplicates, the grid points on both
+sides of the midpoint are tried for every side length that lies close to one.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+from hydro4b_coords.sidelength_swap.common_types import QuantizedSideLengths
+from hydro4b_coords.sidelength_swap.common_types import SixSideLengths
+from hydro4b_coords.sidelength_swap.comparison import SnapToGrid
+from hydro4b_coords.sidelength_swap.index_permutations import canonical_key
+from hydro4b_coords.sidelength_swap.index_permutations import (
+    canonical_key_from_quantized,
+)
+
+# side lengths within this fraction of a grid spacing of the midpoint between two grid
+# points are looked up under both of them; for the default of 4 decimal places, this is
+# 1.0e-5, well above the noise of about 1.0e-6 in the side lengths of the lattice geometries
+_MIDPOINT_MARGIN = 0.1
+
+
+class DeduplicationIndex:
+    """
+    Keeps track of the unique geometries in a stream of side lengths, and how many times
+    each of them has been seen (its multiplicity).
+
+    The side lengths are compared after rounding them to 'n_round' decimal places, so the
+    tolerance should be well above the noise in the side lengths; the geometries taken
+    from the lattice differ by about 1.0e-6 depending on where they are in the lattice.
+    Each unique geometry can also be given an 'item' when it is first added (for example,
+    a label, or the geometry itself), which is kept as its representative.
+    """
+
+    _snap: SnapToGrid
+    _multiplicities: dict[QuantizedSideLengths, int]
+    _representatives: dict[QuantizedSideLengths, Any]
+
+    def __init__(self, n_round: int = 4) -> None:
+        self._snap = SnapToGrid(n_round)
+        self._multiplicities = {}
+        self._representatives = {}
+
+    def canonical_key(self, sidelens: SixSideLengths) -> QuantizedSideLengths:
+        """
+        The key shared by all the geometries that are duplicates of 'sidelens'; the side
+        lengths, scaled and rounded to integers, in their minimum permutation.
+
+        If a side length lies close to the midpoint between two grid points, and a
+        duplicate with the side length snapped to the other grid point is already in the
+        index, the key of that duplicate is returned instead.
+        """
+        key = canonical_key(tuple(sidelens), self._snap)  # type: ignore
+        if key in self._multiplicities:
+            return key
+
+        for neighbour in self._midpoint_neighbours(sidelens):
+            neighbour_key = canonical_key_from_quantized(neighbour)
+            if neighbour_key in self._multiplicities:
+                return neighbour_key
+
+        return key
+
+    def add(self, sidelens: SixSideLengths, item: Optional[Any] = None) -> bool:
+        """
+        Add a geometry to the index. Returns True if it is the first geometry with these
+        side lengths, and False if it is a duplicate of a geometry already in the index.
+        """
+        key = self.canonical_key(sidelens)
+        multiplicity = self._multiplicities.get(key, 0)
+        self._multiplicities[key] = multiplicity + 1
+
+        if multiplicity == 0:
+            self._representatives[key] = item
+            return True
+
+        return False
+
+    def multiplicity(self, sidelens: SixSideLengths) -> int:
+        """The number of times a geometry with these side lengths has been added."""
+        return self._multiplicities.get(self.canonical_key(sidelens), 0)
+
+    def representative(self, sidelens: SixSideLengths) -> Any:
+        """The item given when the first geometry with these side lengths was added."""
+        return self._representatives[self.canonical_key(sidelens)]
+
+    def entries(self) -> Iterator[tuple[QuantizedSideLengths, Any, int]]:
+        """
+        Yield the key, the representative item, and the multiplicity of each unique
+        geometry, in the order in which they were first added.
+        """
+        for (key, multiplicity) in self._multiplicities.items():
+            yield (key, self._representatives[key], multiplicity)
+
+    @property
+    def n_added(self) -> int:
+        """The total number of geometries added, including the duplicates."""
+        return sum(self._multiplicities.values())
+
+    def _midpoint_neighbours(
+        self, sidelens: SixSideLengths
+    ) -> Iterator[QuantizedSideLengths]:
+        """
+        Yield the other ways of snapping 'sidelens' to the grid, where each side length
+        close to a midpoint can be snapped to the grid point on either side of it.
+        """
+        scale = 10**self._snap.n_round
+
+        choices: list[tuple[int, ...]] = []
+        for val in sidelens:
+            scaled = val * scale
+            nearest = round(scaled)
+            if abs(abs(scaled - nearest) - 0.5) < _MIDPOINT_MARGIN:
+                other = nearest + 1 if scaled > nearest else nearest - 1
+                choices.append((nearest, other))
+            else:
+                choices.append((nearest,))
+
+        # the first product is the nearest grid point of every side length
+        neighbours = itertools.product(*choices)
+        next(neighbours)
+
+        yield from neighbours
+
+    def __contains__(self, sidelens: SixSideLengths) -> bool:
+        return self.canonical_key(sidelens) in self._multiplicities
+
+    def __len__(self) -> int:
+        return len(self._multiplicities)
@@ -7,8 +7,13 @@ import copy
 from typing import Tuple
 from typing import Callable
 
+import numpy as np
+from numpy.typing import NDArray
+
+from hydro4b_coords.sidelength_swap.common_types import QuantizedSideLengths
 from hydro4b_coords.sidelength_swap.common_types import SixSideLengths
 from hydro4b_coords.sidelength_swap.common_types import Permutation
+from hydro4b_coords.sidelength_swap.comparison import SnapToGrid
 
 # an exhaustive, hard-coded list of all the possible permutations of index swaps,
 # except for the identity (0, 1, 2, 3, 4, 5), which would otherwise be the first
@@ -39,6 +44,14 @@ INDEX_SWAP_PERMUTATIONS = [
     (5, 4, 2, 3, 1, 0),
 ]
 
+# all 24 permutations, with the identity first, as an array for fancy indexing; the
+# order is the same as the order in which 'minimum_permutation()' tries them
+ALL_PERMUTATIONS_ARRAY = np.array([(0, 1, 2, 3, 4, 5)] + INDEX_SWAP_PERMUTATIONS)
+
+# the number of rows canonicalized at once by 'minimum_permutation_array()'; each row
+# needs an intermediate array of 24 * 6 floats
+_CHUNK_SIZE = 16384
+
 
 def minimum_permutation(
     sidelens: SixSideLengths,
@@ -59,5 +72,83 @@ def minimum_permutation(
     return current_sidelens
 
 
+def canonical_key(sidelens: SixSideLengths, snap: SnapToGrid) -> QuantizedSideLengths:
+    """
+    The quantized side lengths of the minimum permutation of 'sidelens'. The side lengths
+    are snapped to the grid once, and the 24 permutations of the resulting integers are
+    compared exactly. Unlike 'minimum_permutation()' with a tolerant comparator, the
+    result does not depend on the order of the original side lengths, so it can be used
+    as a key for caching and deduplication.
+    """
+    return canonical_key_from_quantized(snap.quantize(sidelens))
+
+
+def canonical_key_from_quantized(
+    quantized: QuantizedSideLengths,
+) -> QuantizedSideLengths:
+    """Like 'canonical_key()', for side lengths that are already snapped to the grid."""
+    identity = (0, 1, 2, 3, 4, 5)
+
+    return min(
+        [
+            _sidelengths_permutation(quantized, perm)  # type: ignore
+            for perm in [identity] + INDEX_SWAP_PERMUTATIONS
+        ]
+    )
+
+
 def _sidelengths_permutation(s: SixSideLengths, p: Permutation) -> SixSideLengths:
     return (s[p[0]], s[p[1]], s[p[2]], s[p[3]], s[p[4]], s[p[5]])
+
+
+def minimum_permutation_array(
+    sidelens: NDArray[np.float64], n_round: int
+) -> Tuple[NDArray[np.float64], NDArray[np.intp]]:
+    """
+    Like 'minimum_permutation()' with the 'LessThanRounded(n_round)' comparator, but for
+    an array of side lengths of shape (N, 6). All 24 permutations of every row are compared
+    at once, with the side lengths rounded to 'n_round' decimal places.
+
+    Returns the minimum permutation of each row (with the original, unrounded values),
+    and the index of the permutation in 'ALL_PERMUTATIONS_ARRAY' that produces it. If
+    several permutations give the same minimum, the first one is chosen, which matches
+    the result of 'minimum_permutation()'.
+    """
+    sidelens = np.asarray(sidelens, dtype=float)
+    if sidelens.ndim != 2 or sidelens.shape[1] != 6:
+        raise ValueError(
+            "The side lengths must be an array of shape (N, 6).\n"
+            f"Found: array of shape {sidelens.shape}"
+        )
+    assert n_round >= 1
+
+    perm_indices = np.empty(sidelens.shape[0], dtype=int)
+    for i_start in range(0, sidelens.shape[0], _CHUNK_SIZE):
+        chunk = sidelens[i_start : i_start + _CHUNK_SIZE]
+        perm_indices[i_start : i_start + _CHUNK_SIZE] = _minimum_permutation_indices(
+            np.round(chunk, n_round)
+        )
+
+    permutations = ALL_PERMUTATIONS_ARRAY[perm_indices]
+    canonical = np.take_along_axis(sidelens, permutations, axis=1)
+
+    return (canonical, perm_indices)
+
+
+def _minimum_permutation_indices(sidelens: NDArray[np.float64]) -> NDArray[np.intp]:
+    """
+    The index of the first of the 24 permutations of each row that gives the
+    lexicographically smallest tuple. Starting from all permutations as candidates, each
+    column in turn keeps only the candidates that have the smallest value in that column.
+    """
+    permuted = sidelens[:, ALL_PERMUTATIONS_ARRAY]  # shape (N, 24, 6)
+    is_candidate = np.ones(permuted.shape[:2], dtype=bool)
+
+    for i_col in range(6):
+        column = permuted[:, :, i_col]
+        column_min = np.min(np.where(is_candidate, column, np.inf), axis=1)
+        is_candidate &= column == column_min[:, np.newaxis]
+
+    perm_indices: NDArray[np.intp] = np.argmax(is_candidate, axis=1)
+
+    return perm_indices
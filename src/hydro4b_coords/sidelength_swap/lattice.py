@@ -0,0 +1,163 @@
+"""
+This module contains an exact, integer-based version of 'minimum_permutation()' for the
+side lengths of four-body geometries taken from the HCP lattice.
+
+In units of the lattice constant, every side length of these geometries is one of only
+six values: 1, sqrt(2), sqrt(8/3), sqrt(3), sqrt(11/3), and 2. Each side length is
+encoded as its index in this (sorted) alphabet, and the six indices are combined into a
+single base-6 integer code. Because the alphabet is sorted, comparing two codes is the
+same as comparing the two tuples of side lengths lexicographically.
+
+There are only 6^6 = 46656 possible codes, so the minimum permutation of every code is
+precomputed once, and finding the minimum permutation becomes a single table lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydro4b_coords.sidelength_swap.common_types import SixSideLengths
+from hydro4b_coords.sidelength_swap.index_permutations import ALL_PERMUTATIONS_ARRAY
+
+# the side lengths of the lattice geometries, in units of the lattice constant
+LATTICE_SIDE_LENGTHS = (
+    1.0,
+    math.sqrt(2.0),
+    math.sqrt(8.0 / 3.0),
+    math.sqrt(3.0),
+    math.sqrt(11.0 / 3.0),
+    2.0,
+)
+
+N_LATTICE_CODES = len(LATTICE_SIDE_LENGTHS) ** 6
+
+# the weight of the digit of each of the six side lengths in the code
+_DIGIT_WEIGHTS = np.array([len(LATTICE_SIDE_LENGTHS) ** (5 - i) for i in range(6)])
+
+
+def encode_lattice_sidelengths(
+    sidelens: Sequence[float], lat_const: float = 1.0, *, tolerance: float = 1.0e-4
+) -> int:
+    """
+    Encode the six side lengths of a lattice geometry with lattice constant 'lat_const'
+    as an integer code. Each side length must be within 'tolerance' (in units of the
+    lattice constant) of one of the values in 'LATTICE_SIDE_LENGTHS'.
+    """
+    _check_six_side_lengths(sidelens)
+
+    scaled = np.asarray(sidelens, dtype=float) / lat_const
+    differences = np.abs(scaled[:, np.newaxis] - np.array(LATTICE_SIDE_LENGTHS))
+    digits = np.argmin(differences, axis=1)
+
+    if np.any(differences[np.arange(6), digits] > tolerance):
+        raise ValueError(
+            "The side lengths are not those of a geometry from the lattice.\n"
+            f"Found (in units of the lattice constant): {scaled.tolist()}"
+        )
+
+    return int(digits @ _DIGIT_WEIGHTS)
+
+
+def decode_lattice_code(code: int, lat_const: float = 1.0) -> SixSideLengths:
+    """The six side lengths of the lattice geometry with the integer code 'code'."""
+    digits = np.unravel_index(code, (len(LATTICE_SIDE_LENGTHS),) * 6)
+    return tuple([lat_const * LATTICE_SIDE_LENGTHS[d] for d in digits])  # type: ignore
+
+
+def canonical_lattice_code(code: int) -> int:
+    """The code of the minimum permutation of the side lengths with the code 'code'."""
+    minimum_codes, _ = _lattice_orbit_tables()
+    return int(minimum_codes[code])
+
+
+def minimum_permutation_lattice(
+    sidelens: SixSideLengths, lat_const: float = 1.0, *, tolerance: float = 1.0e-4
+) -> SixSideLengths:
+    """
+    Like 'minimum_permutation()', for the side lengths of a geometry from the lattice.
+    The side lengths are encoded once, and the minimum permutation is looked up in the
+    precomputed table, instead of being found by comparing floating-point values.
+
+    The returned side lengths are a permutation of the original values.
+    """
+    code = encode_lattice_sidelengths(sidelens, lat_const, tolerance=tolerance)
+    _, permutation_indices = _lattice_orbit_tables()
+    perm = ALL_PERMUTATIONS_ARRAY[permutation_indices[code]]
+
+    return tuple([sidelens[i] for i in perm])  # type: ignore
+
+
+def lattice_geometry_tag(
+    sidelens: SixSideLengths, lat_const: float = 1.0, *, tolerance: float = 1.0e-4
+) -> str:
+    """
+    The tag (in 'MAP_GEOMETRY_TAG_TO_FUNCTION') of the lattice geometry with these side
+    lengths, in any order of the four points.
+    """
+    code = encode_lattice_sidelengths(sidelens, lat_const, tolerance=tolerance)
+    canonical_code = canonical_lattice_code(code)
+
+    tags = _canonical_code_to_geometry_tag()
+    if canonical_code not in tags:
+        raise ValueError(
+            "None of the lattice geometries have these side lengths.\n"
+            f"Found: {decode_lattice_code(canonical_code, lat_const)}"
+        )
+
+    return tags[canonical_code]
+
+
+@functools.lru_cache(maxsize=1)
+def _canonical_code_to_geometry_tag() -> dict[int, str]:
+    # imported here, because the geometries are only needed for this lookup
+    from hydro4b_coords.geometries import GEOMETRY_TAGS
+    from hydro4b_coords.geometries import UNIT_GEOMETRY_POINTS
+
+    i_points, j_points = np.triu_indices(4, 1)
+    all_sidelens = np.linalg.norm(
+        UNIT_GEOMETRY_POINTS[:, i_points] - UNIT_GEOMETRY_POINTS[:, j_points], axis=-1
+    )
+
+    tags = {}
+    for (tag, sidelens) in zip(GEOMETRY_TAGS, all_sidelens):
+        tags[canonical_lattice_code(encode_lattice_sidelengths(sidelens))] = tag
+
+    return tags
+
+
+@functools.lru_cache(maxsize=1)
+def _lattice_orbit_tables() -> Tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """
+    For every code, the code of its minimum permutation, and the index (in
+    'ALL_PERMUTATIONS_ARRAY') of the first permutation that produces it. The tables are
+    created the first time they are needed.
+    """
+    all_codes = np.arange(N_LATTICE_CODES)
+    digits = np.stack(
+        np.unravel_index(all_codes, (len(LATTICE_SIDE_LENGTHS),) * 6), axis=-1
+    )
+
+    permuted_codes = np.stack(
+        [digits[:, perm] @ _DIGIT_WEIGHTS for perm in ALL_PERMUTATIONS_ARRAY], axis=-1
+    )
+    permutation_indices = np.argmin(permuted_codes, axis=1)
+    minimum_codes = permuted_codes[all_codes, permutation_indices]
+
+    minimum_codes.setflags(write=False)
+    permutation_indices.setflags(write=False)
+
+    return (minimum_codes, permutation_indices)
+
+
+def _check_six_side_lengths(sidelens: Sequence[float]) -> None:
+    if len(sidelens) != 6:
+        raise ValueError(
+            "A four-body geometry must have exactly six side lengths.\n"
+            f"Found: {len(sidelens)}"
+        )
@@ -8,6 +8,8 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 from cartesian import Cartesian3D
 from cartesian import CartesianND
 
@@ -78,3 +80,61 @@ def hydrogen_molecule_atomic_positions(
     car_point2 = spherical_to_cartesian(sph_point2)
 
     return (centre_of_mass + car_point1, centre_of_mass + car_point2)
+
+
+def spherical_to_cartesian_array(
+    length: float, polar: NDArray[np.float64], azimuthal: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Like 'spherical_to_cartesian()', but for arrays of polar and azimuthal angles with
+    broadcastable shapes. The angles are wrapped the same way as in 'Spherical3D'.
+
+    Returns an array of Cartesian coordinates, with an extra trailing axis of size 3.
+    """
+    if length <= 0.0:
+        raise ValueError("Distance from origin to point must be positive.")
+
+    polar = np.asarray(polar, dtype=float) % (2.0 * math.pi)
+    azimuthal = np.asarray(azimuthal, dtype=float) % (2.0 * math.pi)
+
+    sin_pol = np.sin(polar)
+    cos_pol = np.cos(polar)
+    sin_azi = np.sin(azimuthal)
+    cos_azi = np.cos(azimuthal)
+
+    x, y, z = np.broadcast_arrays(
+        length * cos_azi * sin_pol,
+        length * sin_azi * sin_pol,
+        length * cos_pol,
+    )
+
+    return np.stack([x, y, z], axis=-1)
+
+
+def hydrogen_molecule_atomic_positions_array(
+    centres_of_mass: NDArray[np.float64],
+    bondlength: float,
+    polar: NDArray[np.float64],
+    azimuthal: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Like 'hydrogen_molecule_atomic_positions()', but for many molecules at once. The
+    centres of mass have shape (..., 3), and the polar and azimuthal angles have shapes
+    that broadcast with (...); for example, centres of shape (n_mol, 1, 3) and angles of
+    shape (n_orient,) give the positions of every molecule in every orientation.
+
+    Returns an array of shape (..., 2, 3), where the second-to-last axis holds the two
+    atoms of each molecule. The second atom uses the same convention as the scalar
+    function, with the angles (pi - polar, azimuthal + pi).
+    """
+    centres_of_mass = np.asarray(centres_of_mass, dtype=float)
+    polar = np.asarray(polar, dtype=float)
+    azimuthal = np.asarray(azimuthal, dtype=float)
+
+    length = bondlength / 2.0
+
+    offset1 = spherical_to_cartesian_array(length, polar, azimuthal)
+    offset2 = spherical_to_cartesian_array(length, math.pi - polar, azimuthal + math.pi)
+    offsets = np.stack([offset1, offset2], axis=-2)
+
+    return centres_of_mass[..., np.newaxis, :] + offsets
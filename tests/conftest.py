@@ -0,0 +1,11 @@
+import numpy as np
+import pytest
+
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+
+
+@pytest.fixture(scope="session")
+def uniform_distribution():
+    yield DiscretizedDistribution(
+        lambda x: np.ones_like(x), 101, 1.0, 2.0, vectorized=True
+    )
@@ -0,0 +1,48 @@
+"""
+Functions that create the inputs shared by several of the test modules.
+"""
+
+import itertools
+from typing import Optional
+
+from cartesian.measure import euclidean_distance
+from hydro4b_coords import geometries
+from hydro4b_coords import lebedev
+from hydro4b_coords import molecule
+from hydro4b_coords.mrcc_input import MRCCInputFileData
+
+
+def get_mrccdata(
+    molecules: Optional[list[molecule.HydrogenMoleculeInfo]] = None,
+) -> MRCCInputFileData:
+    """The settings of a typical calculation, with the molecules if they are given."""
+    mrccdata = MRCCInputFileData()
+    mrccdata.set_calculation_type("ccsd(t)")
+    mrccdata.set_memory_in_mb(4096)
+    mrccdata.set_coupledcluster_tolerance(9)
+    mrccdata.set_coupledcluster_maxiterations(100)
+    mrccdata.set_scf_energy_tolerance(7)
+    mrccdata.set_scf_density_tolerance(7)
+    mrccdata.set_scf_maxiterations(100)
+    mrccdata.set_atom_centred_basis("aug-cc-pVDZ")
+    mrccdata.set_midbond_basis("midbond-3s3p2d")
+    if molecules is not None:
+        mrccdata.set_molecules(molecules)
+
+    return mrccdata
+
+
+def get_four_molecules() -> list[molecule.HydrogenMoleculeInfo]:
+    """Four molecules, none of them ghosts, at the corners of a tetrahedron."""
+    centres_of_mass = geometries.tetrahedron(3.0)
+    lebedevgen = lebedev.LebedevOrientationGenerator(lebedev.Lebedev3, 4)
+    orientations = lebedevgen.combination(1, 0, 2, 1)
+    angle_map = lebedev.LEBEDEV_SCHEME_MAP[lebedev.Lebedev3].angles
+
+    return molecule.get_molecules(centres_of_mass, orientations, angle_map, 0.74)
+
+
+def sidelengths_from_points(points) -> tuple[float, ...]:
+    return tuple(
+        [euclidean_distance(p0, p1) for (p0, p1) in itertools.combinations(points, 2)]
+    )
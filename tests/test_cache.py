@@ -0,0 +1,233 @@
+import os
+import shutil
+import sys
+
+import numpy as np
+import pytest
+
+from hydro4b_coords.generate.cache import DiscretizedDistributionCache
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+
+
+def decay(x, rate):
+    return np.exp(-rate * x)
+
+
+DECAY_RATE = 1.0
+
+
+def global_decay(x):
+    return np.exp(-DECAY_RATE * x)
+
+
+def recursive_decay(x, depth=0):
+    if depth > 0:
+        return recursive_decay(x, depth - 1)
+    return np.exp(-x)
+
+
+class CallCounter:
+    # a class attribute, because the globals a function refers to are part of its key,
+    # and a class is described by its name alone
+    n_calls = 0
+
+
+def counting_decay(x):
+    CallCounter.n_calls += 1
+    return np.exp(-x)
+
+
+class TestDiscretizedDistributionCache:
+    def test_matches_uncached_distribution(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        cached = cache.get(decay, 1001, 0.0, 3.0, args=[2.0], vectorized=True)
+        uncached = DiscretizedDistribution(decay, 1001, 0.0, 3.0, args=[2.0])
+
+        np.testing.assert_allclose(cached.discretized_cdf, uncached.discretized_cdf)
+
+        samples0 = cached.sample_many(100, np.random.default_rng(0))
+        samples1 = uncached.sample_many(100, np.random.default_rng(0))
+        np.testing.assert_allclose(samples0, samples1)
+
+    def test_loads_memory_mapped_arrays(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        cache.get(decay, 1001, 0.0, 3.0, args=[2.0])
+        distrib = cache.get(decay, 1001, 0.0, 3.0, args=[2.0])
+
+        assert isinstance(distrib.discretized_cdf, np.memmap)
+        assert not distrib.discretized_cdf.flags.writeable
+
+    def test_function_not_called_on_hit(self, tmp_path):
+        CallCounter.n_calls = 0
+        cache = DiscretizedDistributionCache(tmp_path)
+        cache.get(counting_decay, 101, 0.0, 1.0, vectorized=True)
+        cache.get(counting_decay, 101, 0.0, 1.0, vectorized=True)
+
+        assert CallCounter.n_calls == 1
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_different_parameters_different_keys(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        key = cache.cache_key(decay, 101, 0.0, 1.0, args=[2.0])
+
+        assert key == cache.cache_key(decay, 101, 0.0, 1.0, args=[2.0])
+        assert key != cache.cache_key(decay, 101, 0.0, 1.0, args=[3.0])
+        assert key != cache.cache_key(decay, 102, 0.0, 1.0, args=[2.0])
+        assert key != cache.cache_key(decay, 101, 0.0, 2.0, args=[2.0])
+        assert key != cache.cache_key(decay, 101, 0.0, 1.0, args=[2.0], vectorized=True)
+
+    def test_closure_values_change_key(self, tmp_path):
+        def make_decay(rate):
+            def closure_decay(x):
+                return np.exp(-rate * x)
+
+            return closure_decay
+
+        cache = DiscretizedDistributionCache(tmp_path)
+        key0 = cache.cache_key(make_decay(1.0), 101, 0.0, 1.0)
+        key1 = cache.cache_key(make_decay(1.0), 101, 0.0, 1.0)
+        key2 = cache.cache_key(make_decay(2.0), 101, 0.0, 1.0)
+
+        assert key0 == key1
+        assert key0 != key2
+
+    def test_global_values_change_key(self, tmp_path, monkeypatch):
+        cache = DiscretizedDistributionCache(tmp_path)
+        key0 = cache.cache_key(global_decay, 101, 0.0, 1.0)
+
+        monkeypatch.setattr(sys.modules[__name__], "DECAY_RATE", 2.0)
+        key1 = cache.cache_key(global_decay, 101, 0.0, 1.0)
+
+        assert key0 != key1
+
+    def test_large_array_values_change_key(self, tmp_path):
+        def make_decay(rates):
+            def closure_decay(x):
+                return np.exp(-rates.mean() * x)
+
+            return closure_decay
+
+        rates0 = np.ones(10000)
+        rates1 = rates0.copy()
+        rates1[5000] = 2.0
+
+        # the repr of both arrays is the same, because it is truncated
+        assert repr(rates0) == repr(rates1)
+
+        cache = DiscretizedDistributionCache(tmp_path)
+        key0 = cache.cache_key(make_decay(rates0), 101, 0.0, 1.0)
+        key1 = cache.cache_key(make_decay(rates1), 101, 0.0, 1.0)
+        key2 = cache.cache_key(decay, 101, 0.0, 1.0, args=[rates0])
+        key3 = cache.cache_key(decay, 101, 0.0, 1.0, args=[rates1])
+
+        assert key0 != key1
+        assert key2 != key3
+
+    def test_salt_changes_key(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        key0 = cache.cache_key(decay, 101, 0.0, 1.0, args=[2.0])
+        key1 = cache.cache_key(decay, 101, 0.0, 1.0, args=[2.0], salt="v2")
+
+        assert key0 != key1
+
+    def test_recursive_function_key(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        key = cache.cache_key(recursive_decay, 101, 0.0, 1.0)
+
+        assert key == cache.cache_key(recursive_decay, 101, 0.0, 1.0)
+
+    def test_rebuilds_entry_evicted_before_load(self, tmp_path, monkeypatch):
+        cache = DiscretizedDistributionCache(tmp_path)
+        expected = cache.get(decay, 101, 0.0, 1.0, args=[2.0])
+
+        original_load = cache._load
+
+        def evicting_load(entry_dir, *args):
+            # another process removes the entry between the check and the load
+            shutil.rmtree(entry_dir)
+            monkeypatch.setattr(cache, "_load", original_load)
+            return original_load(entry_dir, *args)
+
+        monkeypatch.setattr(cache, "_load", evicting_load)
+        distrib = cache.get(decay, 101, 0.0, 1.0, args=[2.0])
+
+        np.testing.assert_allclose(distrib.discretized_cdf, expected.discretized_cdf)
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_eviction_skips_entries_removed_by_another_process(
+        self, tmp_path, monkeypatch
+    ):
+        n_terms = 1001
+        entry_size = 2 * n_terms * np.dtype(float).itemsize
+        cache = DiscretizedDistributionCache(
+            tmp_path, max_size_bytes=int(2.5 * entry_size)
+        )
+        cache.get(decay, n_terms, 0.0, 1.0, args=[1.0])
+        cache.get(decay, n_terms, 0.0, 1.0, args=[2.0])
+
+        original_entries = cache._entries
+
+        def entries_then_removed():
+            # another process evicts every listed entry right after they are listed
+            entries = original_entries()
+            for entry_dir in entries:
+                shutil.rmtree(entry_dir)
+            return entries
+
+        monkeypatch.setattr(cache, "_entries", entries_then_removed)
+        distrib = cache.get(decay, n_terms, 0.0, 1.0, args=[3.0])
+        monkeypatch.setattr(cache, "_entries", original_entries)
+
+        assert distrib.discretized_cdf.size == n_terms
+        assert cache.total_size <= int(2.5 * entry_size)
+
+    def test_table_sampling_method(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        distrib = cache.get(decay, 101, 0.0, 1.0, args=[2.0], sampling_method="table")
+
+        assert distrib.sampling_method == "table"
+
+    def test_eviction_bounded_by_size(self, tmp_path):
+        n_terms = 1001
+        entry_size = 2 * n_terms * np.dtype(float).itemsize
+        cache = DiscretizedDistributionCache(
+            tmp_path, max_size_bytes=int(2.5 * entry_size)
+        )
+
+        for rate in [1.0, 2.0, 3.0, 4.0]:
+            cache.get(decay, n_terms, 0.0, 1.0, args=[rate])
+
+        assert cache.total_size <= int(2.5 * entry_size)
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_eviction_removes_least_recently_used(self, tmp_path):
+        n_terms = 1001
+        entry_size = 2 * n_terms * np.dtype(float).itemsize
+        cache = DiscretizedDistributionCache(
+            tmp_path, max_size_bytes=int(2.5 * entry_size)
+        )
+
+        key1 = cache.cache_key(decay, n_terms, 0.0, 1.0, args=[1.0])
+        key2 = cache.cache_key(decay, n_terms, 0.0, 1.0, args=[2.0])
+        key3 = cache.cache_key(decay, n_terms, 0.0, 1.0, args=[3.0])
+
+        cache.get(decay, n_terms, 0.0, 1.0, args=[1.0])
+        cache.get(decay, n_terms, 0.0, 1.0, args=[2.0])
+        os.utime(tmp_path / key1, (0, 0))
+        os.utime(tmp_path / key2, (0, 1))
+        # using entry 1 again makes entry 2 the least recently used
+        cache.get(decay, n_terms, 0.0, 1.0, args=[1.0])
+        cache.get(decay, n_terms, 0.0, 1.0, args=[3.0])
+
+        assert sorted(os.listdir(tmp_path)) == sorted([key1, key3])
+
+    def test_clear(self, tmp_path):
+        cache = DiscretizedDistributionCache(tmp_path)
+        cache.get(decay, 101, 0.0, 1.0, args=[2.0])
+        cache.clear()
+
+        assert cache.total_size == 0
+
+    def test_raises_non_positive_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            DiscretizedDistributionCache(tmp_path, max_size_bytes=0)
@@ -0,0 +1,49 @@
+import pytest
+
+from hydro4b_coords import counterpoise
+from hydro4b_coords.mrcc_input import MRCCInputFileWriter
+from tests.helpers import get_four_molecules
+from tests.helpers import get_mrccdata
+
+
+class Test_counterpoise_subsets:
+    def test_three_molecules(self):
+        expected = [(0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2)]
+        assert counterpoise.counterpoise_subsets(3) == expected
+
+    def test_four_molecules(self):
+        assert len(counterpoise.counterpoise_subsets(4)) == 15
+
+    def test_raises_no_molecules(self):
+        with pytest.raises(ValueError):
+            counterpoise.counterpoise_subsets(0)
+
+
+class Test_counterpoise_jobs:
+    def test_same_as_setting_ghosts(self):
+        mrccdata = get_mrccdata(get_four_molecules())
+        jobs = list(counterpoise.counterpoise_jobs(mrccdata))
+
+        mrccwriter = MRCCInputFileWriter()
+        for job in jobs:
+            molecules = get_four_molecules()
+            for (i, mol) in enumerate(molecules):
+                mol.set_ghost(i not in job.subset)
+            mrccdata.set_molecules(molecules)
+
+            assert job.contents == mrccwriter.render(mrccdata)
+
+    def test_labels(self):
+        mrccdata = get_mrccdata(get_four_molecules())
+        labels = [job.label for job in counterpoise.counterpoise_jobs(mrccdata)]
+
+        assert len(set(labels)) == 15
+        assert labels[0] == "cp_0"
+        assert labels[-1] == "cp_0_1_2_3"
+
+    def test_write_counterpoise_jobs(self, tmp_path):
+        mrccdata = get_mrccdata(get_four_molecules())
+        report = counterpoise.write_counterpoise_jobs(mrccdata, tmp_path)
+
+        assert report.n_files == 15
+        assert (tmp_path / "cp_1_3" / "MINP").is_file()
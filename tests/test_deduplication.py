@@ -0,0 +1,103 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from cartesian import Cartesian3D
+from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
+from hydro4b_coords.sidelength_swap import DeduplicationIndex
+from tests.helpers import sidelengths_from_points
+
+
+def lattice_translations(n_cells: int):
+    """All the translations by up to 'n_cells' lattice vectors along each axis of the HCP lattice."""
+    lattice_vectors = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.5, math.sqrt(3.0 / 4.0), 0.0],
+            [0.0, 0.0, 2.0 * math.sqrt(2.0 / 3.0)],
+        ]
+    )
+    for steps in itertools.product(range(-n_cells, n_cells + 1), repeat=3):
+        yield np.array(steps) @ lattice_vectors
+
+
+class TestDeduplicationIndex:
+    def test_relabelled_geometries_are_duplicates(self):
+        points = MAP_GEOMETRY_TAG_TO_FUNCTION["sqrt2_sqrt3_sqrt3_a"](1.0)
+        index = DeduplicationIndex()
+
+        n_new = 0
+        for perm in itertools.permutations(range(4)):
+            relabelled = [points[i] for i in perm]
+            n_new += index.add(sidelengths_from_points(relabelled), item=perm)
+
+        assert n_new == 1
+        assert len(index) == 1
+        assert index.n_added == 24
+        assert index.multiplicity(sidelengths_from_points(points)) == 24
+        assert index.representative(sidelengths_from_points(points)) == (0, 1, 2, 3)
+
+    def test_lattice_geometries_are_unique(self):
+        index = DeduplicationIndex()
+        for (tag, function) in MAP_GEOMETRY_TAG_TO_FUNCTION.items():
+            assert index.add(sidelengths_from_points(function(1.0)), item=tag)
+
+        assert len(index) == len(MAP_GEOMETRY_TAG_TO_FUNCTION)
+
+    def test_same_geometry_from_different_lattice_positions(self):
+        # the positions of the lattice sites are only known to 6 decimal places, so the
+        # side lengths of a geometry differ by about 1.0e-6 from one position to the next
+        for (tag, function) in MAP_GEOMETRY_TAG_TO_FUNCTION.items():
+            points = np.array([point.coordinates for point in function(1.0)])
+            index = DeduplicationIndex()
+            for translation in lattice_translations(2):
+                lattice_points = np.round(points + translation, 6)
+                index.add(
+                    sidelengths_from_points(
+                        [Cartesian3D(*point) for point in lattice_points.tolist()]
+                    )
+                )
+
+            assert len(index) == 1, tag
+
+    def test_duplicates_across_grid_midpoint(self):
+        index = DeduplicationIndex(n_round=4)
+        sidelens = (1.0, 1.5, 2.0, 1.25, 1.75, 2.00005 - 1.0e-10)
+        across = (1.0, 1.5, 2.0, 1.25, 1.75, 2.00005 + 1.0e-10)
+
+        assert index.add(sidelens)
+        assert not index.add(across)
+        assert index.multiplicity(sidelens) == 2
+        assert len(index) == 1
+
+    def test_within_rounding_are_duplicates(self):
+        index = DeduplicationIndex(n_round=6)
+        sidelens = (1.0, 1.5, 2.0, 1.25, 1.75, 2.25)
+        perturbed = tuple([val + 1.0e-9 for val in sidelens])
+
+        assert index.add(sidelens)
+        assert not index.add(perturbed)
+        assert perturbed in index
+
+    def test_entries(self):
+        index = DeduplicationIndex()
+        index.add((1.0, 1.0, 1.0, 1.0, 1.0, 1.0), item="a")
+        index.add((2.0, 1.0, 1.0, 1.0, 1.0, 1.0), item="b")
+        index.add((1.0, 1.0, 1.0, 1.0, 1.0, 2.0), item="c")
+
+        entries = list(index.entries())
+        assert [(item, multiplicity) for (_, item, multiplicity) in entries] == [
+            ("a", 1),
+            ("b", 2),
+        ]
+
+    def test_missing_geometry(self):
+        index = DeduplicationIndex()
+        sidelens = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+
+        assert sidelens not in index
+        assert index.multiplicity(sidelens) == 0
+        with pytest.raises(KeyError):
+            index.representative(sidelens)
@@ -7,7 +7,9 @@ from dataclasses import dataclass
 import numpy as np
 
 from hydro4b_coords.generate.discretized_distribution import _discretize_pdf
+from hydro4b_coords.generate.discretized_distribution import _discretize_pdf_vectorized
 from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from hydro4b_coords.generate.distributions import exponential_decay_distribution
 
 
 def test_discretize_pdf():
@@ -25,6 +27,27 @@ def test_discretize_pdf():
         assert discretized[i] == pytest.approx(mult_factor*domain[i])
 
 
+def test_discretize_pdf_vectorized():
+    """
+    The '_discretize_pdf_vectorized()' function should give the same values as the
+    '_discretize_pdf()' function, with only one call to the entered function.
+    """
+    domain = np.linspace(0.0, 1.0, 101)
+
+    n_calls = 0
+
+    def decay(x):
+        nonlocal n_calls
+        n_calls += 1
+        return np.exp(-x)
+
+    discretized = _discretize_pdf_vectorized(decay, domain)
+    expected = _discretize_pdf(lambda x: np.exp(-x), domain)
+
+    assert n_calls == 1
+    np.testing.assert_allclose(discretized, expected)
+
+
 # --- TEST DISTRIBUTION PROPERTIES ---
 
 @pytest.fixture(scope="class")
@@ -112,3 +135,194 @@ class TestDiscretizedDistribution_raises:
                 ddargs.x_max
             )
 
+
+# --- TEST BATCH SAMPLING ---
+
+
+@pytest.fixture(scope="class")
+def linear01_distribution():
+    yield DiscretizedDistribution(lambda x: x, 101, 0.0, 1.0)
+
+
+@pytest.mark.usefixtures('linear01_distribution')
+class TestDiscretizedDistribution_batch:
+    def test_sample_many_shape(self, linear01_distribution):
+        rng = np.random.default_rng(0)
+        samples = linear01_distribution.sample_many(1000, rng)
+        assert samples.shape == (1000,)
+
+    @pytest.mark.parametrize('shape', [(10, 6), (2, 3, 4), 5])
+    def test_sample_array_shape(self, linear01_distribution, shape):
+        rng = np.random.default_rng(0)
+        samples = linear01_distribution.sample_array(shape, rng)
+        assert samples.shape == np.empty(shape).shape
+
+    def test_samples_in_range(self, linear01_distribution):
+        rng = np.random.default_rng(0)
+        samples = linear01_distribution.sample_many(10000, rng)
+        assert np.all((0.0 <= samples) & (samples <= 1.0))
+
+    def test_more_samples_in_upper_half(self, linear01_distribution):
+        rng = np.random.default_rng(0)
+        samples = linear01_distribution.sample_many(10000, rng)
+        assert np.count_nonzero(samples > 0.5) > samples.size / 2
+
+    def test_reproducible_with_same_seed(self, linear01_distribution):
+        samples0 = linear01_distribution.sample_many(100, np.random.default_rng(1234))
+        samples1 = linear01_distribution.sample_many(100, np.random.default_rng(1234))
+        np.testing.assert_array_equal(samples0, samples1)
+
+    def test_raises_negative_number_of_samples(self, linear01_distribution):
+        rng = np.random.default_rng(0)
+        with pytest.raises(ValueError):
+            linear01_distribution.sample_many(-1, rng)
+
+
+# --- TEST INVERSE CDF LOOKUP TABLE ---
+
+def exp_decay(x):
+    return np.exp(-2.0 * x)
+
+
+def zero_density_gap(x):
+    return np.where((0.4 < x) & (x < 0.6), 0.0, 1.0)
+
+
+class TestDiscretizedDistribution_table:
+    def test_matches_interp_for_same_uniforms(self):
+        interp_dd = DiscretizedDistribution(exp_decay, 1001, 0.0, 3.0)
+        table_dd = DiscretizedDistribution(
+            exp_decay, 1001, 0.0, 3.0, sampling_method="table", n_table=100001
+        )
+
+        interp_samples = interp_dd.sample_many(10000, np.random.default_rng(0))
+        table_samples = table_dd.sample_many(10000, np.random.default_rng(0))
+
+        np.testing.assert_allclose(table_samples, interp_samples, atol=1.0e-3)
+
+    def test_statistically_equivalent_to_interp(self):
+        """
+        Compare the empirical CDFs of independent samples from both sampling methods
+        using the two-sample Kolmogorov-Smirnov statistic.
+        """
+        interp_dd = DiscretizedDistribution(exp_decay, 1001, 0.0, 3.0)
+        table_dd = DiscretizedDistribution(
+            exp_decay, 1001, 0.0, 3.0, sampling_method="table"
+        )
+
+        n_samples = 20000
+        interp_samples = np.sort(interp_dd.sample_many(n_samples, np.random.default_rng(0)))
+        table_samples = np.sort(table_dd.sample_many(n_samples, np.random.default_rng(1)))
+
+        grid = np.concatenate([interp_samples, table_samples])
+        interp_ecdf = np.searchsorted(interp_samples, grid, side="right") / n_samples
+        table_ecdf = np.searchsorted(table_samples, grid, side="right") / n_samples
+        ks_statistic = np.max(np.abs(interp_ecdf - table_ecdf))
+
+        # critical value at a significance level of 0.001
+        ks_critical = 1.95 * np.sqrt(2.0 / n_samples)
+        assert ks_statistic < ks_critical
+
+    def test_samples_in_range(self):
+        table_dd = DiscretizedDistribution(
+            exp_decay, 101, 1.0, 2.0, sampling_method="table"
+        )
+        samples = table_dd.sample_many(10000, np.random.default_rng(0))
+        assert np.all((1.0 <= samples) & (samples <= 2.0))
+
+    def test_scalar_sample(self):
+        table_dd = DiscretizedDistribution(
+            exp_decay, 101, 1.0, 2.0, sampling_method="table"
+        )
+        assert 1.0 <= table_dd.sample() <= 2.0
+
+    def test_memory_footprint(self):
+        interp_dd = DiscretizedDistribution(exp_decay, 1001, 0.0, 3.0)
+        table_dd = DiscretizedDistribution(
+            exp_decay, 1001, 0.0, 3.0, sampling_method="table", n_table=5001
+        )
+
+        float_size = np.dtype(float).itemsize
+        assert interp_dd.memory_footprint == 2 * 1001 * float_size
+        # the table also has one boolean flag per bucket
+        assert table_dd.memory_footprint == (2 * 1001 + 5001 + 5000) * float_size + 5000
+
+    @pytest.mark.parametrize("sampling_method", ["interp", "table"])
+    def test_no_samples_where_pdf_is_zero(self, sampling_method):
+        dd = DiscretizedDistribution(
+            zero_density_gap, 1001, 0.0, 1.0, sampling_method=sampling_method, vectorized=True
+        )
+        samples = dd.sample_many(200000, np.random.default_rng(0))
+
+        # the PDF is evaluated at the left end of each interval, so the zero density
+        # starts one interval after 0.4
+        assert not np.any((0.401 < samples) & (samples < 0.6))
+        assert np.any(samples < 0.4) and np.any(samples > 0.6)
+
+    def test_scalar_samples_where_pdf_is_zero(self):
+        dd = DiscretizedDistribution(
+            zero_density_gap, 1001, 0.0, 1.0, sampling_method="table", vectorized=True
+        )
+        np.random.seed(0)
+        samples = np.array([dd.sample() for _ in range(2000)])
+
+        assert not np.any((0.401 < samples) & (samples < 0.6))
+
+    def test_raises_invalid_sampling_method(self):
+        with pytest.raises(ValueError):
+            DiscretizedDistribution(exp_decay, 101, 0.0, 1.0, sampling_method="alias")
+
+    def test_raises_too_few_table_entries(self):
+        with pytest.raises(ValueError):
+            DiscretizedDistribution(
+                exp_decay, 101, 0.0, 1.0, sampling_method="table", n_table=1
+            )
+
+
+# --- TEST VECTORIZED PDF EVALUATION ---
+
+class TestDiscretizedDistribution_vectorized:
+    def test_matches_scalar_evaluation(self):
+        scalar_dd = DiscretizedDistribution(lambda x: x**2, 1001, 0.0, 1.0)
+        vector_dd = DiscretizedDistribution(
+            lambda x: x**2, 1001, 0.0, 1.0, vectorized=True
+        )
+
+        samples0 = scalar_dd.sample_many(1000, np.random.default_rng(0))
+        samples1 = vector_dd.sample_many(1000, np.random.default_rng(0))
+        np.testing.assert_allclose(samples0, samples1)
+
+    def test_args_and_kwargs(self):
+        def power(x, exponent, *, coeff):
+            return coeff * x**exponent
+
+        vector_dd = DiscretizedDistribution(
+            power, 101, 0.0, 1.0, args=[2], kwargs={"coeff": 3.0}, vectorized=True
+        )
+        scalar_dd = DiscretizedDistribution(
+            power, 101, 0.0, 1.0, args=[2], kwargs={"coeff": 3.0}
+        )
+        np.testing.assert_allclose(
+            vector_dd._discretized_cdf, scalar_dd._discretized_cdf
+        )
+
+    def test_raises_nonnegative_values(self):
+        with pytest.raises(ValueError):
+            DiscretizedDistribution(lambda x: x - 0.5, 101, 0.0, 1.0, vectorized=True)
+
+    def test_raises_wrong_shape(self):
+        with pytest.raises(ValueError):
+            DiscretizedDistribution(lambda x: 1.0, 101, 0.0, 1.0, vectorized=True)
+
+    def test_exponential_decay_distribution(self):
+        dd = exponential_decay_distribution(101, 1.0, 2.0, coeff=1.0, decay_rate=2.0)
+        samples = dd.sample_many(10000, np.random.default_rng(0))
+
+        x_mid = 1.5
+        assert np.all((1.0 <= samples) & (samples <= 2.0))
+        assert np.count_nonzero(samples < x_mid) > samples.size / 2
+
+
+def test_from_arrays_raises_mismatched_sizes():
+    with pytest.raises(ValueError):
+        DiscretizedDistribution.from_arrays(np.linspace(0.0, 1.0, 10), np.linspace(0.0, 1.0, 11))
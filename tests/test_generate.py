@@ -0,0 +1,184 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from hydro4b_coords.generate.generate import sample_fourbody_geometries
+from hydro4b_coords.generate.generate import sample_fourbody_geometry_with_reattempts
+from hydro4b_coords.generate.generate import six_side_lengths_to_cartesian
+from hydro4b_coords.generate.generate import six_side_lengths_to_cartesian_array
+from hydro4b_coords.generate.statistics import SamplingStatistics
+from hydro4b_coords.generate.validity import tetrahedron_validity_mask
+
+
+def pair_distances_array(points: np.ndarray) -> np.ndarray:
+    """Calculate the six relative pair distances of each geometry in an (N, 4, 3) array."""
+    pairs = list(itertools.combinations(range(4), 2))
+    return np.stack(
+        [np.linalg.norm(points[:, i] - points[:, j], axis=-1) for (i, j) in pairs],
+        axis=-1,
+    )
+
+
+class Test_sample_fourbody_geometries:
+    def test_number_of_geometries(self, uniform_distribution):
+        rng = np.random.default_rng(0)
+        geometries = sample_fourbody_geometries(
+            uniform_distribution, 1000, rng, batch_size=256
+        )
+        assert geometries.shape == (1000, 4, 3)
+
+    def test_pair_distances_in_range(self, uniform_distribution):
+        rng = np.random.default_rng(0)
+        geometries = sample_fourbody_geometries(uniform_distribution, 1000, rng)
+        pair_distances = pair_distances_array(geometries)
+
+        tolerance = 1.0e-8
+        assert np.all(pair_distances >= 1.0 - tolerance)
+        assert np.all(pair_distances <= 2.0 + tolerance)
+
+    def test_geometries_are_valid_tetrahedra(self, uniform_distribution):
+        rng = np.random.default_rng(0)
+        geometries = sample_fourbody_geometries(uniform_distribution, 1000, rng)
+        pair_distances = pair_distances_array(geometries)
+
+        assert np.all(tetrahedron_validity_mask(pair_distances))
+
+    def test_reproducible_with_same_seed(self, uniform_distribution):
+        geometries0 = sample_fourbody_geometries(
+            uniform_distribution, 100, np.random.default_rng(1234)
+        )
+        geometries1 = sample_fourbody_geometries(
+            uniform_distribution, 100, np.random.default_rng(1234)
+        )
+        np.testing.assert_array_equal(geometries0, geometries1)
+
+    def test_zero_geometries(self, uniform_distribution):
+        rng = np.random.default_rng(0)
+        geometries = sample_fourbody_geometries(uniform_distribution, 0, rng)
+        assert geometries.shape == (0, 4, 3)
+
+    def test_raises_when_batches_exhausted(self):
+        # side lengths in [1, 100] almost never form a valid tetrahedron
+        distrib = DiscretizedDistribution(lambda x: 1.0, 101, 1.0, 100.0)
+        rng = np.random.default_rng(0)
+        with pytest.raises(RuntimeError):
+            sample_fourbody_geometries(
+                distrib, 1000, rng, batch_size=4, n_max_batches=2
+            )
+
+
+class Test_six_side_lengths_to_cartesian_array:
+    def test_matches_scalar_version(self):
+        rng = np.random.default_rng(0)
+        side_lengths = rng.uniform(1.0, 2.0, size=(200, 6))
+
+        points, _ = six_side_lengths_to_cartesian_array(side_lengths)
+
+        for (row, row_points) in zip(side_lengths, points):
+            expect_points = six_side_lengths_to_cartesian(*row)
+            for (expect, actual) in zip(expect_points, row_points):
+                np.testing.assert_allclose(actual, expect.coordinates, atol=1.0e-12)
+
+    def test_frame_conventions(self):
+        rng = np.random.default_rng(0)
+        side_lengths = rng.uniform(1.0, 2.0, size=(200, 6))
+
+        points, is_valid = six_side_lengths_to_cartesian_array(side_lengths)
+        points = points[is_valid]
+
+        assert np.all(points[:, 0] == 0.0)
+        assert np.all(points[:, 1, 0] > 0.0)
+        assert np.all(points[:, 1, 1:] == 0.0)
+        assert np.all(points[:, 2, 1] >= 0.0)
+        assert np.all(points[:, 2, 2] == 0.0)
+        assert np.all(points[:, 3, 2] >= 0.0)
+
+    def test_valid_rows_recover_side_lengths(self):
+        rng = np.random.default_rng(0)
+        side_lengths = rng.uniform(1.0, 2.0, size=(200, 6))
+
+        points, is_valid = six_side_lengths_to_cartesian_array(side_lengths)
+
+        assert np.any(is_valid)
+        np.testing.assert_allclose(
+            pair_distances_array(points[is_valid]), side_lengths[is_valid]
+        )
+
+    @pytest.mark.parametrize(
+        "invalid_side_lengths",
+        [
+            (1.0, 1.0, 1.0, 1.0, 1.0, 3.0),  # violates triangle inequality
+            (1.0, 2.0, 1.0, 1.0, 1.0, 1.0),  # points 0, 1, 2 are collinear
+            (0.0, 1.0, 1.0, 1.0, 1.0, 1.0),  # points 0 and 1 coincide
+        ],
+    )
+    def test_invalid_rows_masked(self, invalid_side_lengths):
+        side_lengths = np.array([(1.0,) * 6, invalid_side_lengths])
+        _, is_valid = six_side_lengths_to_cartesian_array(side_lengths)
+
+        np.testing.assert_array_equal(is_valid, [True, False])
+
+    def test_raises_wrong_shape(self):
+        with pytest.raises(ValueError):
+            six_side_lengths_to_cartesian_array(np.ones((10, 5)))
+
+
+class Test_SamplingStatistics:
+    def test_batched_sampler(self, uniform_distribution):
+        stats = SamplingStatistics()
+        rng = np.random.default_rng(0)
+        sample_fourbody_geometries(
+            uniform_distribution, 1000, rng, batch_size=256, stats=stats
+        )
+
+        n_rejected = sum(stats.rejection_histogram.values())
+        assert stats.n_attempts % 256 == 0
+        assert stats.n_accepted >= 1000
+        assert stats.n_attempts == stats.n_accepted + n_rejected
+        assert 0.0 < stats.acceptance_rate < 1.0
+        assert set(stats.stage_times) == {"sample", "validate", "coordinates"}
+
+    def test_scalar_sampler(self, uniform_distribution):
+        stats = SamplingStatistics()
+        n_geometries = 20
+        for _ in range(n_geometries):
+            sample_fourbody_geometry_with_reattempts(uniform_distribution, stats=stats)
+
+        n_rejected = sum(stats.rejection_histogram.values())
+        assert stats.n_accepted == n_geometries
+        assert stats.n_attempts == stats.n_accepted + n_rejected
+        assert sum(stats.attempts_per_accepted) == stats.n_attempts
+        assert stats.mean_attempts_per_accepted >= 1.0
+
+    def test_scalar_sampler_not_timed_without_statistics(
+        self, uniform_distribution, monkeypatch
+    ):
+        def fail_time_stage(self, stage):
+            raise AssertionError("no statistics were asked for")
+
+        monkeypatch.setattr(SamplingStatistics, "time_stage", fail_time_stage)
+        for _ in range(20):
+            sample_fourbody_geometry_with_reattempts(uniform_distribution)
+
+    def test_rejection_reasons(self):
+        # side lengths in [1, 10] are rejected for both reasons often enough
+        distrib = DiscretizedDistribution(lambda x: 1.0, 101, 1.0, 10.0)
+        stats = SamplingStatistics()
+        rng = np.random.default_rng(0)
+        sample_fourbody_geometries(distrib, 10, rng, batch_size=1024, stats=stats)
+
+        assert stats.rejection_histogram["triangle_inequality"] > 0
+        assert stats.rejection_histogram["cayley_menger"] > 0
+
+    def test_statistics_recorded_on_failure(self):
+        distrib = DiscretizedDistribution(lambda x: 1.0, 101, 1.0, 100.0)
+        stats = SamplingStatistics()
+        rng = np.random.default_rng(0)
+        with pytest.raises(RuntimeError):
+            sample_fourbody_geometries(
+                distrib, 1000, rng, batch_size=4, n_max_batches=2, stats=stats
+            )
+
+        assert stats.n_attempts == 8
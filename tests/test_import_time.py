@@ -0,0 +1,107 @@
+"""
+The geometry functions are imported lazily, so that short-lived processes that only
+import the package do not pay for importing all of the geometry modules.
+
+Each measurement is done in a fresh interpreter, so that no modules are already cached.
+The tests only check which modules are imported; the wall-clock time of the import
+depends on the machine, so it is only checked as a benchmark, when the environment
+variable 'HYDRO4B_RUN_BENCHMARKS' is set.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# the budget for 'import hydro4b_coords.geometries', not including interpreter startup
+IMPORT_TIME_BUDGET_SECONDS = 0.1
+
+# the modules that define the geometries, and their dependencies, which are only
+# imported once a geometry is first used
+LAZY_MODULES = [
+    "hydro4b_coords.geometries.one_unit_side",
+    "hydro4b_coords.geometries.two_unit_sides",
+    "hydro4b_coords.geometries.three_unit_sides",
+    "hydro4b_coords.geometries.four_unit_sides",
+    "hydro4b_coords.geometries.five_unit_sides",
+    "hydro4b_coords.geometries.tetrahedron",
+    "hydro4b_coords.geometries.triangles",
+    "hydro4b_coords.geometries.combinatorics",
+    "hydro4b_coords.geometries.checker",
+    "hydro4b_coords.geometries.point_table",
+    "cartesian",
+]
+
+_MEASURE_IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import hydro4b_coords
+import hydro4b_coords.geometries
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import() -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    return json.loads(result.stdout)
+
+
+def test_geometry_modules_not_imported():
+    modules = measure_import()["modules"]
+
+    assert "hydro4b_coords.geometries" in modules
+    for module in LAZY_MODULES:
+        assert module not in modules
+
+
+@pytest.mark.skipif(
+    "HYDRO4B_RUN_BENCHMARKS" not in os.environ,
+    reason="the import time is only checked as a benchmark",
+)
+def test_import_time_within_budget():
+    # the fastest of several attempts, to reduce noise from the rest of the system
+    elapsed = min([measure_import()["elapsed"] for _ in range(3)])
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS
+
+
+class Test_lazy_names:
+    def test_names_still_importable(self):
+        from hydro4b_coords.geometries import fourbody_geometry_sqrt2_sqrt3_sqrt3_a
+        from hydro4b_coords.geometries import irregular_tetrahedron
+        from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT
+        from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
+
+        assert (
+            MAP_GEOMETRY_TAG_TO_FUNCTION["sqrt2_sqrt3_sqrt3_a"]
+            is fourbody_geometry_sqrt2_sqrt3_sqrt3_a
+        )
+        assert callable(irregular_tetrahedron)
+        assert set(MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT) == set(
+            MAP_GEOMETRY_TAG_TO_FUNCTION
+        )
+
+    def test_unknown_name_raises(self):
+        import hydro4b_coords.geometries as geometries
+
+        with pytest.raises(AttributeError):
+            geometries.not_a_geometry
+
+    def test_unknown_tag_raises(self):
+        from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
+
+        assert "not_a_tag" not in MAP_GEOMETRY_TAG_TO_FUNCTION
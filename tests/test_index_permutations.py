@@ -2,12 +2,20 @@ import itertools
 from typing import Sequence
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from cartesian import CartesianND
 from cartesian.measure import euclidean_distance
 from hydro4b_coords.sidelength_swap import LessThanEpsilon
+from hydro4b_coords.sidelength_swap import LessThanRounded
+from hydro4b_coords.sidelength_swap import SnapToGrid
+from hydro4b_coords.sidelength_swap import canonical_key
 from hydro4b_coords.sidelength_swap import minimum_permutation
+from hydro4b_coords.sidelength_swap import minimum_permutation_array
+from hydro4b_coords.sidelength_swap.index_permutations import ALL_PERMUTATIONS_ARRAY
+from hydro4b_coords.sidelength_swap.index_permutations import INDEX_SWAP_PERMUTATIONS
+from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
 from hydro4b_coords.geometries import fourbody_geometry_sqrt2_sqrt3_sqrt3_a
 from hydro4b_coords.geometries import fourbody_geometry_sqrt2_sqrt3_sqrt3_b
 
@@ -35,3 +43,87 @@ class Test_minium_permutation:
 
         assert not all_approx_equal(pairdists0, pairdists1)
         assert all_approx_equal(sorted_pairdists0, sorted_pairdists1)
+
+
+class Test_minimum_permutation_array:
+    def all_sidelengths(self) -> np.ndarray:
+        rng = np.random.default_rng(42)
+        random_sidelens = rng.uniform(1.0, 2.0, size=(200, 6))
+
+        # many repeated values, so that several permutations give the same minimum
+        repeated_sidelens = rng.choice([1.0, 1.5, 2.0], size=(200, 6))
+
+        lattice_sidelens = np.array(
+            [
+                relative_pair_distances(function(1.0))
+                for function in MAP_GEOMETRY_TAG_TO_FUNCTION.values()
+            ]
+        )
+
+        return np.vstack([random_sidelens, repeated_sidelens, lattice_sidelens])
+
+    def test_same_as_minimum_permutation(self):
+        sidelens = self.all_sidelengths()
+        canonical, perm_indices = minimum_permutation_array(sidelens, 6)
+
+        less_than_comparator = LessThanRounded(6)
+        for (row, canon_row, i_perm) in zip(sidelens, canonical, perm_indices):
+            expected = minimum_permutation(tuple(row), less_than_comparator)
+            assert tuple(canon_row) == expected
+            assert tuple(row[ALL_PERMUTATIONS_ARRAY[i_perm]]) == expected
+
+    def test_identity_is_first_permutation(self):
+        sidelens = np.ones((1, 6))
+        _, perm_indices = minimum_permutation_array(sidelens, 6)
+
+        assert perm_indices[0] == 0
+        assert tuple(ALL_PERMUTATIONS_ARRAY[0]) == (0, 1, 2, 3, 4, 5)
+
+    def test_raises_bad_shape(self):
+        with pytest.raises(ValueError):
+            minimum_permutation_array(np.ones((3, 5)), 6)
+
+
+class Test_LessThanEpsilon:
+    def test_equal_within_epsilon_is_false(self):
+        less_than = LessThanEpsilon(1.0e-4)
+        s0 = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+        s1 = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0 + 1.0e-6)
+
+        assert less_than(s0, s1) is False
+        assert less_than(s1, s0) is False
+
+
+class Test_canonical_key:
+    def test_independent_of_relabelling(self):
+        lat_const = 1.0
+        points = fourbody_geometry_sqrt2_sqrt3_sqrt3_b(lat_const)
+        snap = SnapToGrid(6)
+
+        keys = set()
+        for perm in itertools.permutations(range(4)):
+            pairdists = relative_pair_distances([points[i] for i in perm])
+            keys.add(canonical_key(pairdists, snap))
+
+        assert len(keys) == 1
+
+    def test_total_order_with_nearly_equal_values(self):
+        # with a tolerant comparison, 'a ~ b' and 'b ~ c', but 'a < c'; the result of
+        # the tolerant 'minimum_permutation' depends on the starting order
+        eps = 1.0e-4
+        values = (1.0, 1.0 + 0.6 * eps, 1.0 + 1.2 * eps, 2.0, 2.0, 2.0)
+        snap = SnapToGrid(6)
+
+        keys = set()
+        for perm in [(0, 1, 2, 3, 4, 5)] + INDEX_SWAP_PERMUTATIONS:
+            permuted = tuple([values[i] for i in perm])
+            keys.add(canonical_key(permuted, snap))
+
+        assert len(keys) == 1
+
+    def test_snap_to_grid_as_comparator(self):
+        snap = SnapToGrid(3)
+        assert snap((1.0, 1.0, 1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0, 1.0, 1.01))
+        assert not snap(
+            (1.0, 1.0, 1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0, 1.0, 1.0001)
+        )
@@ -0,0 +1,57 @@
+import itertools
+import math
+
+import pytest
+
+from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
+from hydro4b_coords.sidelength_swap import LessThanRounded
+from hydro4b_coords.sidelength_swap import decode_lattice_code
+from hydro4b_coords.sidelength_swap import encode_lattice_sidelengths
+from hydro4b_coords.sidelength_swap import lattice_geometry_tag
+from hydro4b_coords.sidelength_swap import minimum_permutation
+from hydro4b_coords.sidelength_swap import minimum_permutation_lattice
+from tests.helpers import sidelengths_from_points
+
+
+class Test_lattice_codes:
+    def test_encode_decode(self):
+        sidelens = (1.0, math.sqrt(2.0), 2.0, math.sqrt(3.0), 1.0, math.sqrt(11 / 3))
+        code = encode_lattice_sidelengths(sidelens)
+
+        assert decode_lattice_code(code) == pytest.approx(sidelens)
+
+    def test_code_order_same_as_tuple_order(self):
+        sidelens0 = (1.0, 1.0, 2.0, 1.0, 1.0, 1.0)
+        sidelens1 = (1.0, math.sqrt(3.0), 1.0, 1.0, 1.0, 1.0)
+
+        assert sidelens0 < sidelens1
+        assert encode_lattice_sidelengths(sidelens0) < encode_lattice_sidelengths(
+            sidelens1
+        )
+
+    def test_lattice_constant(self):
+        sidelens = (2.5, 2.5, 2.5, 2.5, 2.5, 2.5 * math.sqrt(2.0))
+        code = encode_lattice_sidelengths(sidelens, lat_const=2.5)
+
+        assert decode_lattice_code(code, lat_const=2.5) == pytest.approx(sidelens)
+
+    def test_raises_not_lattice(self):
+        with pytest.raises(ValueError):
+            encode_lattice_sidelengths((1.0, 1.0, 1.0, 1.0, 1.0, 1.2))
+
+
+class Test_minimum_permutation_lattice:
+    @pytest.mark.parametrize("tag", list(MAP_GEOMETRY_TAG_TO_FUNCTION.keys()))
+    def test_same_as_minimum_permutation(self, tag):
+        points = MAP_GEOMETRY_TAG_TO_FUNCTION[tag](1.0)
+        sidelens = sidelengths_from_points(points)
+
+        expected = minimum_permutation(sidelens, LessThanRounded(4))
+        assert minimum_permutation_lattice(sidelens) == expected
+
+    @pytest.mark.parametrize("tag", ["1", "sqrt2_sqrt3_sqrt3_a", "sqrt2_sqrt3_sqrt3_b"])
+    def test_lattice_geometry_tag(self, tag):
+        points = MAP_GEOMETRY_TAG_TO_FUNCTION[tag](3.0)
+        for perm in itertools.permutations(range(4)):
+            sidelens = sidelengths_from_points([points[i] for i in perm])
+            assert lattice_geometry_tag(sidelens, lat_const=3.0) == tag
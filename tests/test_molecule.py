@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+
+from hydro4b_coords import geometries
+from hydro4b_coords import lebedev
+from hydro4b_coords import molecule
+from hydro4b_coords.molecule import MoleculeBatch
+from tests.helpers import get_four_molecules
+
+
+class TestMoleculeBatch:
+    def test_from_molecules(self):
+        molecules = get_four_molecules()
+        molecules[2].set_ghost(True)
+        batch = MoleculeBatch.from_molecules(molecules)
+
+        atoms = molecule.atoms_from_molecules(molecules)
+        expected = np.array([atom.coordinates for atom in atoms])
+
+        assert len(batch) == 4
+        assert batch.coordinates.shape == (4, 2, 3)
+        np.testing.assert_array_equal(batch.atom_positions, expected)
+        np.testing.assert_array_equal(
+            batch.atom_ghost_statuses, molecule.ghost_status_from_molecules(molecules)
+        )
+
+    def test_round_trip(self):
+        molecules = get_four_molecules()
+        molecules[2].set_ghost(True)
+        batch = MoleculeBatch.from_molecules(molecules)
+        new_batch = MoleculeBatch.from_molecules(batch.to_molecules())
+
+        np.testing.assert_array_equal(batch.coordinates, new_batch.coordinates)
+        np.testing.assert_array_equal(batch.ghosts, new_batch.ghosts)
+
+    def test_no_ghosts_by_default(self):
+        batch = MoleculeBatch(np.zeros((3, 2, 3)))
+        assert not batch.ghosts.any()
+
+    def test_set_ghost(self):
+        batch = MoleculeBatch(np.zeros((3, 2, 3)))
+        batch.set_ghost(1, True)
+        expected = [False, False, True, True, False, False]
+        assert batch.atom_ghost_statuses.tolist() == expected
+
+    def test_raises_bad_coordinates_shape(self):
+        with pytest.raises(ValueError):
+            MoleculeBatch(np.zeros((3, 3)))
+
+    def test_raises_bad_ghosts_shape(self):
+        with pytest.raises(ValueError):
+            MoleculeBatch(np.zeros((3, 2, 3)), np.zeros(2, dtype=bool))
+
+    def test_inputs_are_copied(self):
+        coordinates = np.zeros((3, 2, 3))
+        ghosts = np.zeros(3, dtype=bool)
+        batch = MoleculeBatch(coordinates, ghosts)
+
+        coordinates[0, 0, 0] = 1.0
+        batch.set_ghost(1, True)
+
+        assert batch.coordinates[0, 0, 0] == 0.0
+        assert not ghosts[1]
+
+
+class TestLebedevSchemeInfoTables:
+    @pytest.mark.parametrize("scheme", [lebedev.Lebedev3, lebedev.Lebedev5])
+    def test_unit_vectors(self, scheme):
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[scheme]
+
+        assert scheme_info.unit_vectors.shape == (scheme_info.n_orientations, 3)
+        np.testing.assert_allclose(
+            np.linalg.norm(scheme_info.unit_vectors, axis=1), 1.0
+        )
+
+    @pytest.mark.parametrize("scheme", [lebedev.Lebedev3, lebedev.Lebedev5])
+    def test_bond_vectors(self, scheme):
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[scheme]
+        bond_vectors = scheme_info.bond_vectors(0.74)
+
+        assert bond_vectors.shape == (scheme_info.n_orientations, 2, 3)
+        np.testing.assert_allclose(bond_vectors[:, 0], 0.37 * scheme_info.unit_vectors)
+        np.testing.assert_allclose(bond_vectors[:, 1], -bond_vectors[:, 0], atol=1e-12)
+
+    def test_bond_vectors_cached(self):
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[lebedev.Lebedev5]
+        assert scheme_info.bond_vectors(0.74) is scheme_info.bond_vectors(0.74)
+
+    def test_bond_vectors_cache_bounded(self):
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[lebedev.Lebedev3]
+        first = scheme_info.bond_vectors(0.5)
+        for i in range(100):
+            scheme_info.bond_vectors(1.0 + 0.01 * i)
+
+        assert len(scheme_info._bond_vectors_cache) < 100
+        assert scheme_info.bond_vectors(0.5) is not first
+        np.testing.assert_array_equal(scheme_info.bond_vectors(0.5), first)
+
+
+class Test_get_molecules:
+    @pytest.mark.parametrize("scheme", [lebedev.Lebedev3, lebedev.Lebedev5])
+    def test_table_lookup_matches_angles(self, scheme):
+        centres_of_mass = geometries.tetrahedron(3.0)
+        lebedevgen = lebedev.LebedevOrientationGenerator(scheme, 4)
+        orientations = lebedevgen.combination(2, 0, 1, 2)
+        angle_map = lebedev.LEBEDEV_SCHEME_MAP[scheme].angles
+
+        from_table = molecule.get_molecules(
+            centres_of_mass, orientations, angle_map, 0.74
+        )
+
+        # changing the angle of an unused orientation means the map is no longer the
+        # scheme's map of angles, so the angles are used instead of the table
+        other_angle_map = dict(angle_map)
+        unused = lebedev.LEBEDEV_SCHEME_MAP[scheme].ordered_orientations[-1]
+        other_angle_map[unused] = lebedev.LebedevOrientation(0.0, 0.0)
+
+        from_angles = molecule.get_molecules(
+            centres_of_mass, orientations, other_angle_map, 0.74
+        )
+
+        np.testing.assert_allclose(
+            MoleculeBatch.from_molecules(from_table).coordinates,
+            MoleculeBatch.from_molecules(from_angles).coordinates,
+            atol=1.0e-12,
+        )
+
+    def test_get_molecule_batch(self):
+        centres_of_mass = geometries.tetrahedron(3.0)
+        lebedevgen = lebedev.LebedevOrientationGenerator(lebedev.Lebedev5, 4)
+        orientations = lebedevgen.combination(6, 3, 0, 2)
+        angle_map = lebedev.LEBEDEV_SCHEME_MAP[lebedev.Lebedev5].angles
+
+        molecules = molecule.get_molecules(
+            centres_of_mass, orientations, angle_map, 0.74
+        )
+        centres_array = np.array([com.coordinates for com in centres_of_mass])
+        batch = molecule.get_molecule_batch(centres_array, orientations, 0.74)
+
+        np.testing.assert_allclose(
+            batch.coordinates, MoleculeBatch.from_molecules(molecules).coordinates
+        )
+
+    def test_get_molecule_batch_raises_no_orientations(self):
+        with pytest.raises(ValueError):
+            molecule.get_molecule_batch(np.empty((0, 3)), [], 0.74)
+
+    def test_scheme_info_found_from_equal_angle_map(self):
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[lebedev.Lebedev5]
+        orientations = [lebedev.Lebedev5.ORIENT_X]
+
+        found = molecule._scheme_info_with_angle_map(
+            orientations, dict(scheme_info.angles)
+        )
+        assert found is scheme_info
+
+        angle_map = dict(scheme_info.angles)
+        angle_map[lebedev.Lebedev5.ORIENT_X] = lebedev.LebedevOrientation(0.1, 0.2)
+        assert molecule._scheme_info_with_angle_map(orientations, angle_map) is None
@@ -1,11 +1,14 @@
 import pytest
 
+import numpy as np
+
 from hydro4b_coords.mrcc_input import MRCCInputFileData
 from hydro4b_coords.mrcc_input import MRCCInputFileWriter
 from hydro4b_coords import geometries
 from hydro4b_coords import lebedev
 from hydro4b_coords import molecule
 from hydro4b_coords import mrcc_input
+from tests.helpers import get_mrccdata
 
 
 class TestMRCCInputFileData:
@@ -135,5 +138,161 @@ def test_ghost_indices_string():
     ghost_statuses = [True, False, True, True, False, False, True]
     expect_line = "\n".join(["ghost=serialno", "1,3,4,7"])
 
+    assert mrcc_input._ghost_indicator_lines(tuple(ghost_statuses)) == expect_line
+
+
+class TestMRCCInputFileWriter_write_files:
+    def test_same_contents_as_write_file(self, tmp_path):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+
+        mrccwriter.write_file(mrccdata, tmp_path / "expected")
+        jobs = [(mrccdata, tmp_path / f"MINP{i}") for i in range(20)]
+        mrccwriter.write_files(jobs, max_workers=4)
+
+        expected = (tmp_path / "expected").read_text()
+        for i in range(20):
+            assert (tmp_path / f"MINP{i}").read_text() == expected
+
+    def test_report(self, tmp_path):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+
+        jobs = ((mrccdata, tmp_path / f"MINP{i}") for i in range(50))
+        report = mrccwriter.write_files(jobs, max_workers=2)
+
+        n_bytes_each = len(mrccwriter.render(mrccdata).encode())
+        assert report.n_files == 50
+        assert report.n_bytes == 50 * n_bytes_each
+        assert report.files_per_second > 0.0
+
+    def test_no_temporary_files_left(self, tmp_path):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+
+        jobs = [(mrccdata, tmp_path / f"MINP{i}") for i in range(10)]
+        mrccwriter.write_files(jobs)
+
+        assert sorted([p.name for p in tmp_path.iterdir()]) == sorted(
+            [f"MINP{i}" for i in range(10)]
+        )
+
+    def test_overwrites_existing_file(self, tmp_path):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+
+        filename = tmp_path / "MINP"
+        filename.write_text("old contents")
+        mrccwriter.write_files([(mrccdata, filename)])
+
+        assert filename.read_text() == mrccwriter.render(mrccdata)
+
+    def test_raises_non_positive_max_workers(self, tmp_path):
+        mrccwriter = MRCCInputFileWriter()
+        with pytest.raises(ValueError):
+            mrccwriter.write_files([], max_workers=0)
+
+
+def render_without_template(mrccdata: MRCCInputFileData) -> str:
+    """The contents of the file, created line by line from the molecules."""
+    mrccwriter = MRCCInputFileWriter()
+
+    molecules = mrccdata.fields["molecules"]
+    atoms = molecule.atoms_from_molecules(molecules)
+    positions = [tuple(atom.coordinates) for atom in atoms]
+    ghost_statuses = molecule.ghost_status_from_molecules(molecules)
+
+    if mrccdata.fields["midbond_basis"] is not None:
+        positions.append(tuple(np.mean(positions, axis=0)))
+        ghost_statuses.append(True)
+
+    atom_lines = []
+    for ((x, y, z), is_ghost) in zip(positions, ghost_statuses):
+        comment = "# GHOST ATOM" if is_ghost else "# REAL ATOM"
+        atom_lines.append(f"H   {x: 12.9f}   {y: 12.9f}   {z: 12.9f}   {comment}")
+
+    ghost_indices = [str(i + 1) for (i, status) in enumerate(ghost_statuses) if status]
+
+    return "\n".join(
+        [
+            mrccwriter._calculation_lines(mrccdata),
+            "",
+            mrccwriter._basis_lines(mrccdata),
+            "",
+            "unit=angs",
+            "geom=xyz",
+            f"{len(positions)}",
+            "",
+            *atom_lines,
+            "",
+            "ghost=serialno",
+            ",".join(ghost_indices),
+        ]
+    )
+
+
+class TestMRCCInputTemplate:
+    @pytest.mark.parametrize("has_midbond", [True, False])
+    def test_same_as_without_template(self, has_midbond):
+        mrccdata = get_mrccdata(get_six_molecules())
+        if not has_midbond:
+            mrccdata.fields["midbond_basis"] = None
+
+        mrccwriter = MRCCInputFileWriter()
+        assert mrccwriter.render(mrccdata) == render_without_template(mrccdata)
+
+    def test_same_as_without_template_with_ghosts(self):
+        mrccdata = get_mrccdata(get_six_molecules())
+        molecules = get_six_molecules()
+        molecules[1].set_ghost(True)
+        mrccdata.set_molecules(molecules)
+
+        mrccwriter = MRCCInputFileWriter()
+        assert mrccwriter.render(mrccdata) == render_without_template(mrccdata)
+
+    def test_template_reused(self):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+
+        mrccwriter.render(mrccdata)
+        mrccwriter.render(mrccdata)
+        assert len(mrccwriter._templates) == 1
+
+        mrccdata.set_memory_in_mb(1024)
+        mrccwriter.render(mrccdata)
+        assert len(mrccwriter._templates) == 2
+
+    def test_render_from_array(self):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+        template = mrccwriter.compile_template(mrccdata, n_molecules=3)
+
+        molecules = mrccdata.fields["molecules"]
+        atoms = molecule.atoms_from_molecules(molecules)
+        positions = np.array([atom.coordinates for atom in atoms])
+        ghost_statuses = molecule.ghost_status_from_molecules(molecules)
+
+        assert template.render(positions, ghost_statuses) == render_without_template(
+            mrccdata
+        )
+
+    def test_raises_wrong_number_of_atoms(self):
+        mrccdata = get_mrccdata(get_six_molecules())
+        mrccwriter = MRCCInputFileWriter()
+        template = mrccwriter.compile_template(mrccdata, n_molecules=3)
+
+        with pytest.raises(ValueError):
+            template.render(np.zeros((4, 3)), [False] * 4)
+
+
+def test_render_molecule_batch():
+    mrccdata = get_mrccdata(get_six_molecules())
+    molecules = get_six_molecules()
+    molecules[0].set_ghost(True)
+    mrccdata.set_molecules(molecules)
+
     mrccwriter = MRCCInputFileWriter()
-    assert mrccwriter._ghost_indicator_lines(ghost_statuses) == expect_line
+    expected = mrccwriter.render(mrccdata)
+
+    mrccdata.set_molecules(molecule.MoleculeBatch.from_molecules(molecules))
+    assert mrccwriter.render(mrccdata) == expected
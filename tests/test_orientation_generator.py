@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from hydro4b_coords import lebedev
+from hydro4b_coords.lebedev import LebedevOrientationGenerator
+
+
+class TestLebedevOrientationGenerator:
+    @pytest.mark.parametrize(
+        "scheme, n_particles",
+        [(lebedev.Lebedev3, 1), (lebedev.Lebedev3, 4), (lebedev.Lebedev5, 3)],
+    )
+    def test_index_array_same_order_as_iterator(self, scheme, n_particles):
+        lebedevgen = LebedevOrientationGenerator(scheme, n_particles)
+        index_array = lebedevgen.index_array()
+
+        n_orients = lebedevgen.number_of_orientations
+        expected = list(itertools.product(range(n_orients), repeat=n_particles))
+
+        assert index_array.shape == (n_orients**n_particles, n_particles)
+        assert [tuple(row) for row in index_array.tolist()] == expected
+
+        for (indices, orientations) in zip(index_array, lebedevgen):
+            assert lebedevgen.combination(*indices) == orientations
+
+    def test_index_chunks(self):
+        lebedevgen = LebedevOrientationGenerator(lebedev.Lebedev5, 4)
+        chunks = list(lebedevgen.index_chunks(1000))
+
+        assert [chunk.shape[0] for chunk in chunks] == [1000, 1000, 401]
+        np.testing.assert_array_equal(np.vstack(chunks), lebedevgen.index_array())
+
+    def test_angle_chunks(self):
+        lebedevgen = LebedevOrientationGenerator(lebedev.Lebedev3, 2)
+        angle_map = lebedevgen.orientations_to_angles_map
+
+        chunks = list(lebedevgen.angle_chunks(4))
+        polars = np.vstack([polar for (polar, _) in chunks])
+        azimuthals = np.vstack([azimuthal for (_, azimuthal) in chunks])
+
+        for (i, orientations) in enumerate(lebedevgen):
+            angles = [angle_map[orient] for orient in orientations]
+            assert polars[i].tolist() == [a.polar for a in angles]
+            assert azimuthals[i].tolist() == [a.azimuthal for a in angles]
+
+    def test_raises_non_positive_chunk_size(self):
+        lebedevgen = LebedevOrientationGenerator(lebedev.Lebedev3, 2)
+        with pytest.raises(ValueError):
+            next(lebedevgen.index_chunks(0))
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from hydro4b_coords.generate.parallel import sample_fourbody_geometries_parallel
+from hydro4b_coords.generate.statistics import SamplingStatistics
+
+
+class Test_sample_fourbody_geometries_parallel:
+    def test_number_of_geometries(self, uniform_distribution):
+        geometries = sample_fourbody_geometries_parallel(
+            uniform_distribution, 1000, 1234, n_workers=1, chunk_size=300
+        )
+        assert geometries.shape == (1000, 4, 3)
+
+    def test_same_result_for_any_number_of_workers(self, uniform_distribution):
+        kwargs = {"chunk_size": 250, "batch_size": 512}
+        serial = sample_fourbody_geometries_parallel(
+            uniform_distribution, 1000, 1234, n_workers=1, **kwargs
+        )
+        parallel = sample_fourbody_geometries_parallel(
+            uniform_distribution, 1000, 1234, n_workers=2, **kwargs
+        )
+        np.testing.assert_array_equal(serial, parallel)
+
+    def test_different_seeds(self, uniform_distribution):
+        geometries0 = sample_fourbody_geometries_parallel(
+            uniform_distribution, 100, 0, n_workers=1
+        )
+        geometries1 = sample_fourbody_geometries_parallel(
+            uniform_distribution, 100, 1, n_workers=1
+        )
+        assert not np.array_equal(geometries0, geometries1)
+
+    def test_chunks_are_independent(self, uniform_distribution):
+        geometries = sample_fourbody_geometries_parallel(
+            uniform_distribution, 200, 1234, n_workers=1, chunk_size=100
+        )
+        assert not np.array_equal(geometries[:100], geometries[100:])
+
+    def test_merged_statistics(self, uniform_distribution):
+        stats = SamplingStatistics()
+        sample_fourbody_geometries_parallel(
+            uniform_distribution, 1000, 1234, n_workers=2, chunk_size=250, stats=stats
+        )
+        assert stats.n_accepted >= 1000
+
+    def test_zero_geometries(self, uniform_distribution):
+        geometries = sample_fourbody_geometries_parallel(
+            uniform_distribution, 0, 1234, n_workers=1
+        )
+        assert geometries.shape == (0, 4, 3)
+
+    def test_raises_negative_n_geometries(self, uniform_distribution):
+        with pytest.raises(ValueError):
+            sample_fourbody_geometries_parallel(
+                uniform_distribution, -5, 1234, n_workers=1
+            )
+
+    @pytest.mark.parametrize("n_geometries", [10.0, 10.5, "10", True])
+    def test_raises_non_integer_n_geometries(self, uniform_distribution, n_geometries):
+        with pytest.raises(ValueError):
+            sample_fourbody_geometries_parallel(
+                uniform_distribution, n_geometries, 1234, n_workers=1
+            )
+
+    def test_accepts_numpy_integer(self, uniform_distribution):
+        geometries = sample_fourbody_geometries_parallel(
+            uniform_distribution, np.int64(10), 1234, n_workers=1
+        )
+        assert geometries.shape == (10, 4, 3)
+
+    def test_raises_non_positive_chunk_size(self, uniform_distribution):
+        with pytest.raises(ValueError):
+            sample_fourbody_geometries_parallel(
+                uniform_distribution, 10, 1234, chunk_size=0
+            )
+
+    def test_raises_negative_chunk_size(self, uniform_distribution):
+        with pytest.raises(ValueError):
+            sample_fourbody_geometries_parallel(
+                uniform_distribution, 10, 1234, n_workers=1, chunk_size=-3
+            )
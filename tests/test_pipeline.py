@@ -0,0 +1,105 @@
+import itertools
+
+import numpy as np
+
+from hydro4b_coords import geometries
+from hydro4b_coords import lebedev
+from hydro4b_coords import pipeline
+from hydro4b_coords.generate.discretized_distribution import DiscretizedDistribution
+from tests.helpers import get_mrccdata
+
+
+class Test_pipeline:
+    def test_tagged_geometries(self):
+        geometry_jobs = list(pipeline.tagged_geometries(2.0, ["1", "sqrt2"]))
+
+        assert [job.label for job in geometry_jobs] == ["1", "sqrt2"]
+        assert all([len(job.centres_of_mass) == 4 for job in geometry_jobs])
+
+    def test_all_tagged_geometries(self):
+        geometry_jobs = pipeline.tagged_geometries(2.0)
+        n_geometries = len(geometries.MAP_GEOMETRY_TAG_TO_FUNCTION)
+        assert sum([1 for _ in geometry_jobs]) == n_geometries
+
+    def test_sampled_geometries(self):
+        distrib = DiscretizedDistribution(lambda x: 1.0, 101, 2.0, 4.0)
+        rng = np.random.default_rng(0)
+        geometry_jobs = list(
+            pipeline.sampled_geometries(distrib, 25, rng, batch_size=10)
+        )
+
+        assert len(geometry_jobs) == 25
+        assert len({job.label for job in geometry_jobs}) == 25
+
+    def test_orientation_jobs(self):
+        geometry_jobs = pipeline.tagged_geometries(2.0, ["1"])
+        jobs = pipeline.orientation_jobs(geometry_jobs, lebedev.Lebedev3, 0.74)
+
+        first_job = next(jobs)
+        assert first_job.label == "1/orient_0_0_0_0"
+        assert len(first_job.molecules) == 4
+
+        n_remaining = sum([1 for _ in jobs])
+        assert n_remaining == 3**4 - 1
+
+    def test_orientation_jobs_are_lazy(self):
+        geometry_jobs = pipeline.tagged_geometries(2.0)
+        jobs = pipeline.orientation_jobs(geometry_jobs, lebedev.Lebedev5, 0.74)
+
+        first_jobs = list(itertools.islice(jobs, 10))
+        assert len(first_jobs) == 10
+
+    def test_write_jobs(self, tmp_path):
+        geometry_jobs = pipeline.tagged_geometries(2.0, ["1", "sqrt2"])
+        jobs = pipeline.orientation_jobs(geometry_jobs, lebedev.Lebedev3, 0.74)
+        n_written = pipeline.write_jobs(jobs, get_mrccdata(), tmp_path)
+
+        assert n_written == 2 * 3**4
+
+        minp_files = sorted(tmp_path.glob("*/*/MINP"))
+        assert len(minp_files) == n_written
+        assert (
+            "geom=xyz" in (tmp_path / "sqrt2" / "orient_0_1_2_0" / "MINP").read_text()
+        )
+
+    def test_tagged_geometries_weights(self):
+        geometry_jobs = pipeline.tagged_geometries(2.0, ["1", "sqrt2"])
+        assert [job.weight for job in geometry_jobs] == [8, 48]
+
+    def test_lattice_sweep_geometries(self):
+        lat_consts = [2.0, 3.5]
+        geometry_jobs = list(pipeline.lattice_sweep_geometries(lat_consts))
+
+        n_geometries = len(geometries.MAP_GEOMETRY_TAG_TO_FUNCTION)
+        assert len(geometry_jobs) == 2 * n_geometries
+
+        for (i, tag) in enumerate(geometries.MAP_GEOMETRY_TAG_TO_FUNCTION):
+            function = geometries.MAP_GEOMETRY_TAG_TO_FUNCTION[tag]
+            weight = geometries.MAP_GEOMETRY_TAG_TO_COMBINATORIAL_COUNT[tag]
+            job = geometry_jobs[n_geometries + i]
+
+            assert job.label == f"lat_001_3.500000/{tag}"
+            assert job.weight == weight
+            np.testing.assert_array_equal(
+                [point.coordinates for point in job.centres_of_mass],
+                [point.coordinates for point in function(3.5)],
+            )
+
+    def test_orientation_jobs_keep_weight(self):
+        geometry_jobs = pipeline.lattice_sweep_geometries([2.0, 3.0], ["sqrt3_2"])
+        jobs = list(pipeline.orientation_jobs(geometry_jobs, lebedev.Lebedev3, 0.74))
+
+        assert len(jobs) == 2 * 3**4
+        assert jobs[0].label == "lat_000_2.000000/sqrt3_2/orient_0_0_0_0"
+        assert all([job.weight == 96 for job in jobs])
+
+    def test_lattice_sweep_labels_unique(self):
+        lat_consts = [3.0, 3.0 + 1.0e-8, 3.0]
+        geometry_jobs = list(pipeline.lattice_sweep_geometries(lat_consts, ["sqrt2"]))
+
+        labels = [job.label for job in geometry_jobs]
+        assert labels == [
+            "lat_000_3.000000/sqrt2",
+            "lat_001_3.000000/sqrt2",
+            "lat_002_3.000000/sqrt2",
+        ]
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from hydro4b_coords.geometries import GEOMETRY_TAG_INDEX
+from hydro4b_coords.geometries import GEOMETRY_TAGS
+from hydro4b_coords.geometries import MAP_GEOMETRY_TAG_TO_FUNCTION
+from hydro4b_coords.geometries import UNIT_GEOMETRY_POINTS
+from hydro4b_coords.geometries import geometry_points
+from hydro4b_coords.geometries import lattice_constant_sweep
+
+
+def function_points(tag: str, lat_const: float) -> np.ndarray:
+    points = MAP_GEOMETRY_TAG_TO_FUNCTION[tag](lat_const)
+    return np.array([point.coordinates for point in points])
+
+
+class Test_geometry_points:
+    def test_tags_match_registry(self):
+        assert list(GEOMETRY_TAGS) == list(MAP_GEOMETRY_TAG_TO_FUNCTION)
+        assert UNIT_GEOMETRY_POINTS.shape == (len(GEOMETRY_TAGS), 4, 3)
+        assert all(GEOMETRY_TAGS[i] == tag for (tag, i) in GEOMETRY_TAG_INDEX.items())
+
+    @pytest.mark.parametrize("lat_const", [1.0, 2.5, 3.2])
+    def test_all_tags_match_functions(self, lat_const):
+        points = geometry_points(lat_const)
+
+        for (i, tag) in enumerate(GEOMETRY_TAGS):
+            np.testing.assert_array_equal(points[i], function_points(tag, lat_const))
+
+    def test_single_tag(self):
+        points = geometry_points(2.0, "sqrt2_sqrt3_sqrt3_a")
+
+        assert points.shape == (4, 3)
+        np.testing.assert_array_equal(
+            points, function_points("sqrt2_sqrt3_sqrt3_a", 2.0)
+        )
+
+    def test_list_of_tags_keeps_order(self):
+        tags = ["sqrt3_2_2_2", "1", "sqrt2"]
+        points = geometry_points(2.0, tags)
+
+        assert points.shape == (3, 4, 3)
+        for (i, tag) in enumerate(tags):
+            np.testing.assert_array_equal(points[i], function_points(tag, 2.0))
+
+    def test_table_is_read_only(self):
+        with pytest.raises(ValueError):
+            UNIT_GEOMETRY_POINTS[0, 0, 0] = 1.0
+
+        points = geometry_points(1.0)
+        points[0, 0, 0] = 1.0
+        assert UNIT_GEOMETRY_POINTS[0, 0, 0] != 1.0
+
+    def test_raises_unknown_tag(self):
+        with pytest.raises(ValueError) as exc_info:
+            geometry_points(1.0, ["1", "not_a_tag"])
+
+        assert "not_a_tag" in str(exc_info.value)
+
+    @pytest.mark.parametrize("lat_const", [0.0, -1.0])
+    def test_raises_nonpositive_lat_const(self, lat_const):
+        with pytest.raises(ValueError):
+            geometry_points(lat_const)
+
+
+class Test_lattice_constant_sweep:
+    def test_matches_geometry_points(self):
+        lat_consts = [1.5, 2.0, 3.25]
+        points = lattice_constant_sweep(lat_consts)
+
+        assert points.shape == (3, len(GEOMETRY_TAGS), 4, 3)
+        for (i, lat_const) in enumerate(lat_consts):
+            np.testing.assert_array_equal(points[i], geometry_points(lat_const))
+
+    def test_selected_tags(self):
+        points = lattice_constant_sweep(np.array([2.0, 3.0]), ["sqrt2", "1"])
+
+        assert points.shape == (2, 2, 4, 3)
+        np.testing.assert_array_equal(points[1, 0], function_points("sqrt2", 3.0))
+
+    @pytest.mark.parametrize("lat_consts", [[1.0, 0.0], [-1.0], [[1.0, 2.0]]])
+    def test_raises_invalid_lat_consts(self, lat_consts):
+        with pytest.raises(ValueError):
+            lattice_constant_sweep(lat_consts)
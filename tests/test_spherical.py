@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 import pytest
 
 from cartesian import Cartesian3D
@@ -7,6 +8,7 @@ from cartesian import measure
 
 from hydro4b_coords.spherical import Spherical3D
 from hydro4b_coords.spherical import hydrogen_molecule_atomic_positions
+from hydro4b_coords.spherical import hydrogen_molecule_atomic_positions_array
 from hydro4b_coords.spherical import spherical_to_cartesian
 import hydro4b_coords.lebedev as lebedev
 
@@ -136,3 +138,48 @@ class TestHydrogenMoleculeAtomicPositions:
         dist1 = measure.euclidean_distance(centre, point1)
 
         assert dist0 == pytest.approx(dist1)
+
+
+class TestHydrogenMoleculeAtomicPositionsArray:
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        centres = rng.uniform(-2.0, 2.0, size=(10, 3))
+        polars = rng.uniform(0.0, math.pi, size=10)
+        azimuthals = rng.uniform(0.0, 2.0 * math.pi, size=10)
+        bondlength = 0.74
+
+        positions = hydrogen_molecule_atomic_positions_array(
+            centres, bondlength, polars, azimuthals
+        )
+        assert positions.shape == (10, 2, 3)
+
+        for i in range(10):
+            point0, point1 = hydrogen_molecule_atomic_positions(
+                Cartesian3D(*centres[i]), bondlength, polars[i], azimuthals[i]
+            )
+            np.testing.assert_allclose(positions[i, 0], point0.coordinates)
+            np.testing.assert_allclose(positions[i, 1], point1.coordinates)
+
+    def test_broadcast_over_orientations(self):
+        centres = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+        scheme_angles = lebedev.schemes.lebedev3.LEBEDEV3_ANGLES.values()
+        polars = np.array([angles.polar for angles in scheme_angles])
+        azimuthals = np.array([angles.azimuthal for angles in scheme_angles])
+
+        positions = hydrogen_molecule_atomic_positions_array(
+            centres[:, np.newaxis, :], 2.0, polars, azimuthals
+        )
+
+        assert positions.shape == (2, 3, 2, 3)
+        np.testing.assert_allclose(
+            positions[1] - centres[1], positions[0], atol=1.0e-12
+        )
+        np.testing.assert_allclose(
+            positions[:, :, 0],
+            -(positions[:, :, 1] - 2.0 * centres[:, None]),
+            atol=1.0e-12,
+        )
+
+    def test_raises_nonpositive_bondlength(self):
+        with pytest.raises(ValueError):
+            hydrogen_molecule_atomic_positions_array(np.zeros(3), 0.0, 0.0, 0.0)
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from hydro4b_coords import geometries
+from hydro4b_coords import lebedev
+from hydro4b_coords.lebedev import symmetry
+
+
+def get_points(tag: str) -> np.ndarray:
+    centres_of_mass = geometries.MAP_GEOMETRY_TAG_TO_FUNCTION[tag](2.0)
+    return np.array([com.coordinates for com in centres_of_mass])
+
+
+def interatomic_distances(
+    points: np.ndarray, indices: np.ndarray, scheme: lebedev.LebedevScheme
+) -> np.ndarray:
+    """The sorted distances between all pairs of atoms; invariant under any symmetry."""
+    bond_vectors = lebedev.LEBEDEV_SCHEME_MAP[scheme].bond_vectors(0.74)
+    atoms = (points[:, np.newaxis, :] + bond_vectors[indices]).reshape(-1, 3)
+    distances = np.linalg.norm(atoms[:, np.newaxis] - atoms[np.newaxis, :], axis=-1)
+
+    return np.sort(distances[np.triu_indices(len(atoms), 1)])
+
+
+class Test_symmetry_operations:
+    def test_identity_always_found(self):
+        points = np.random.default_rng(0).uniform(size=(4, 3))
+        operations = symmetry.symmetry_operations(points)
+
+        assert len(operations) == 1
+        rotation, perm = operations[0]
+        np.testing.assert_allclose(rotation, np.eye(3), atol=1.0e-12)
+        assert perm == (0, 1, 2, 3)
+
+    def test_regular_tetrahedron(self):
+        operations = symmetry.symmetry_operations(get_points("1"))
+        assert len(operations) == 24
+
+    def test_square(self):
+        points = np.array([[1, 1, 0], [-1, 1, 0], [-1, -1, 0], [1, -1, 0]], dtype=float)
+        operations = symmetry.symmetry_operations(points)
+
+        # the D4h point group
+        assert len(operations) == 16
+
+    def test_raises_bad_shape(self):
+        with pytest.raises(ValueError):
+            symmetry.symmetry_operations(np.zeros((4, 2)))
+
+
+class Test_unique_orientation_combinations:
+    def test_no_symmetry(self):
+        points = np.random.default_rng(0).uniform(size=(4, 3))
+        unique = list(
+            symmetry.unique_orientation_combinations(points, lebedev.Lebedev3)
+        )
+
+        assert len(unique) == 3**4
+        assert all([multiplicity == 1 for (_, multiplicity) in unique])
+
+    @pytest.mark.parametrize("scheme", [lebedev.Lebedev3, lebedev.Lebedev5])
+    @pytest.mark.parametrize(
+        "tag", ["1", "sqrt2", "sqrt2_sqrt2", "sqrt3_sqrt3_sqrt3_b"]
+    )
+    def test_multiplicities_add_up(self, tag, scheme):
+        unique = list(symmetry.unique_orientation_combinations(get_points(tag), scheme))
+        total = lebedev.total_number_of_orientations(scheme, 4)
+
+        assert sum([multiplicity for (_, multiplicity) in unique]) == total
+        assert len(unique) < total
+
+    def test_square_lebedev3(self):
+        points = np.array([[1, 1, 0], [-1, 1, 0], [-1, -1, 0], [1, -1, 0]], dtype=float)
+        unique = dict(
+            symmetry.unique_orientation_combinations(points, lebedev.Lebedev3)
+        )
+
+        # all molecules along the z-axis; mapped onto itself by every operation
+        assert unique[(2, 2, 2, 2)] == 1
+
+        # one molecule along the z-axis, and the others all along the x-axis or all along
+        # the y-axis; the molecule along the z-axis can be at any of the four corners
+        assert unique[(0, 0, 0, 2)] == 8
+
+    @pytest.mark.parametrize("scheme", [lebedev.Lebedev3, lebedev.Lebedev5])
+    @pytest.mark.parametrize("tag", ["1", "sqrt2_sqrt2", "sqrt3_sqrt3_sqrt3_b"])
+    def test_operations_preserve_distances(self, tag, scheme):
+        points = get_points(tag)
+        scheme_info = lebedev.LEBEDEV_SCHEME_MAP[scheme]
+        all_indices = lebedev.LebedevOrientationGenerator(scheme, 4).index_array()
+
+        for (rotation, perm) in symmetry.symmetry_operations(points):
+            direction_map = symmetry._direction_map(
+                rotation, scheme_info.unit_vectors, 1.0e-6
+            )
+            if direction_map is None:
+                continue
+
+            for indices in all_indices[::7]:
+                image = np.empty_like(indices)
+                image[list(perm)] = direction_map[indices]
+
+                np.testing.assert_allclose(
+                    interatomic_distances(points, image, scheme),
+                    interatomic_distances(points, indices, scheme),
+                    atol=1.0e-5,
+                )
@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+import pytest
+
+from hydro4b_coords.generate.validity import cayley_menger_determinant
+from hydro4b_coords.generate.validity import cayley_menger_determinant_scalar
+from hydro4b_coords.generate.validity import cayley_menger_mask
+from hydro4b_coords.generate.validity import is_cayley_menger_valid
+from hydro4b_coords.generate.validity import is_triangle_inequality_valid
+from hydro4b_coords.generate.validity import is_valid_tetrahedron
+from hydro4b_coords.generate.validity import tetrahedron_validity_mask
+from hydro4b_coords.generate.validity import triangle_inequality_mask
+
+
+def tetrahedron_volume(points: np.ndarray) -> float:
+    edges = points[1:] - points[0]
+    return abs(np.linalg.det(edges)) / 6.0
+
+
+def pair_distances(points: np.ndarray) -> list[float]:
+    pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    return [float(np.linalg.norm(points[i] - points[j])) for (i, j) in pairs]
+
+
+class Test_cayley_menger_determinant:
+    def test_regular_tetrahedron(self):
+        # 288 * V^2, where V = 1 / (6 * sqrt(2)) for the unit regular tetrahedron
+        determinant = cayley_menger_determinant(np.ones((1, 6)))
+        assert determinant[0] == pytest.approx(4.0)
+
+    def test_matches_volume_of_random_tetrahedra(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            points = rng.uniform(-1.0, 1.0, size=(4, 3))
+            side_lengths = np.array([pair_distances(points)])
+            volume = tetrahedron_volume(points)
+
+            determinant = cayley_menger_determinant(side_lengths)
+            assert determinant[0] == pytest.approx(288.0 * volume**2)
+
+
+class Test_scalar_checks:
+    def test_determinant_matches_array_version(self):
+        rng = np.random.default_rng(0)
+        side_lengths = rng.uniform(1.0, 2.0, size=(200, 6))
+
+        expected = cayley_menger_determinant(side_lengths)
+        for (sidelens, determinant) in zip(side_lengths.tolist(), expected):
+            assert cayley_menger_determinant_scalar(sidelens) == pytest.approx(
+                determinant, abs=1.0e-9
+            )
+
+    def test_masks_match_array_versions(self):
+        rng = np.random.default_rng(1)
+        side_lengths = rng.uniform(1.0, 2.0, size=(2000, 6))
+
+        triangle_mask = triangle_inequality_mask(side_lengths)
+        cayley_menger_valid = cayley_menger_mask(side_lengths)
+        for (i, sidelens) in enumerate(side_lengths.tolist()):
+            assert is_triangle_inequality_valid(sidelens) == triangle_mask[i]
+            assert is_cayley_menger_valid(sidelens) == cayley_menger_valid[i]
+
+    def test_raises_wrong_number_of_side_lengths(self):
+        with pytest.raises(ValueError):
+            is_triangle_inequality_valid((1.0, 1.0, 1.0))
+
+
+class Test_tetrahedron_validity_mask:
+    @pytest.mark.parametrize(
+        "side_lengths",
+        [
+            (1.0, 1.0, 1.0, 1.0, 1.0, 1.0),
+            (1.0, 1.0, 1.0, 1.0, 1.0, math.sqrt(2.0)),
+            (2.0, 2.0, 2.0, 2.0, 2.0, 2.0),
+        ],
+    )
+    def test_valid(self, side_lengths):
+        assert is_valid_tetrahedron(side_lengths)
+
+    @pytest.mark.parametrize(
+        "side_lengths",
+        [
+            (
+                1.0,
+                1.0,
+                1.0,
+                1.0,
+                1.0,
+                3.0,
+            ),  # face (0, 2, 3) violates triangle inequality
+            (1.0, 2.0, 1.0, 1.0, 1.0, 1.0),  # face (0, 1, 2) is collinear
+            (1.0, 1.0, 1.0, 1.0, 1.0, math.sqrt(3.0)),  # flat rhombus, zero volume
+            (1.0, 1.0, 1.0, 1.0, 1.0, 1.9),  # faces are valid, but cannot close in 3D
+        ],
+    )
+    def test_invalid(self, side_lengths):
+        assert not is_valid_tetrahedron(side_lengths)
+
+    def test_cayley_menger_catches_valid_faces(self):
+        side_lengths = np.array([(1.0, 1.0, 1.0, 1.0, 1.0, 1.9)])
+        assert triangle_inequality_mask(side_lengths)[0]
+        assert not cayley_menger_mask(side_lengths)[0]
+
+    def test_scale_invariant(self):
+        rng = np.random.default_rng(0)
+        side_lengths = rng.uniform(1.0, 2.0, size=(1000, 6))
+
+        mask = tetrahedron_validity_mask(side_lengths)
+        scaled_mask = tetrahedron_validity_mask(1000.0 * side_lengths)
+        np.testing.assert_array_equal(mask, scaled_mask)
+
+    def test_matches_realized_geometries(self):
+        # side lengths calculated from actual points in 3D space are always valid
+        rng = np.random.default_rng(0)
+        side_lengths = np.array(
+            [pair_distances(rng.uniform(-1.0, 1.0, size=(4, 3))) for _ in range(100)]
+        )
+        assert np.all(tetrahedron_validity_mask(side_lengths))
+
+    def test_raises_wrong_shape(self):
+        with pytest.raises(ValueError):
+            tetrahedron_validity_mask(np.ones((10, 5)))